@@ -0,0 +1,250 @@
+import argparse
+import hashlib
+import json
+import pathlib
+from typing import Dict, List, Optional
+
+MANIFEST_VERSION = 2
+MANIFEST_NAME = "asset_manifest.json"
+PIECES_FOLDER = "pieces_resources"
+TRANSITIONS_FILE = "state_transitions.json"
+
+
+def manifest_path_for(root_folder: pathlib.Path) -> pathlib.Path:
+    """
+    Default location of the manifest compiled for an assets folder.
+    """
+    return pathlib.Path(root_folder) / MANIFEST_NAME
+
+
+def _file_entry(root_folder: pathlib.Path, rel_path: str, previous: Dict[str, dict]) -> dict:
+    stat = (root_folder / rel_path).stat()
+    old = previous.get(rel_path)
+    if old is not None and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+        return old
+    digest = hashlib.sha256((root_folder / rel_path).read_bytes()).hexdigest()
+    return {"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def build_manifest(root_folder: pathlib.Path, previous: Optional[dict] = None, with_hashes: bool = True) -> dict:
+    """
+    Compiles the state transitions and every piece's config, moves file, per-state configs and sprite
+    list into one dict. Paths are relative to root_folder. With with_hashes every source file also
+    gets a content hash; files whose size and mtime match an entry of the previous manifest keep
+    its hash instead of being read again.
+    Raises ValueError if the result does not pass validate_manifest.
+    """
+    root_folder = pathlib.Path(root_folder)
+    pieces_root = root_folder / PIECES_FOLDER
+    folders: List[pathlib.Path] = [pieces_root]
+    with open(root_folder / TRANSITIONS_FILE, 'r') as f:
+        transitions = json.load(f)
+    state_names = list(transitions.get("states", {}).keys())
+
+    pieces: Dict[str, dict] = {}
+    sources: List[str] = [TRANSITIONS_FILE]
+    for piece_dir in sorted(pieces_root.iterdir()):
+        if not piece_dir.is_dir():
+            continue
+        piece_type = piece_dir.name
+        main_cfg_path = piece_dir / "config.json"
+        if not main_cfg_path.exists():
+            print(f"Warning: No config.json found for piece '{piece_type}'. Skipping.")
+            continue
+        with open(main_cfg_path, 'r') as f:
+            main_cfg = json.load(f)
+        sources.append(main_cfg_path.relative_to(root_folder).as_posix())
+        folders.extend([piece_dir, piece_dir / "states"])
+
+        moves = None
+        if main_cfg.get("moves"):
+            moves_path = piece_dir / main_cfg["moves"]
+            if moves_path.exists():
+                moves = moves_path.relative_to(root_folder).as_posix()
+                sources.append(moves)
+
+        states: Dict[str, dict] = {}
+        for state_name in state_names:
+            state_dir = piece_dir / "states" / state_name
+            state_cfg_path = state_dir / "config.json"
+            if not state_cfg_path.exists():
+                continue
+            with open(state_cfg_path, 'r') as f:
+                cfg = json.load(f)
+            sources.append(state_cfg_path.relative_to(root_folder).as_posix())
+            folders.extend([state_dir, state_dir / "sprites"])
+            sprites = [p.relative_to(root_folder).as_posix() for p in sorted((state_dir / "sprites").glob("*.png"))]
+            sources.extend(sprites)
+            states[state_name] = {
+                "config": cfg,
+                "sprites_dir": (state_dir / "sprites").relative_to(root_folder).as_posix(),
+                "sprites": sprites,
+            }
+
+        pieces[piece_type] = {
+            "initial_state": main_cfg.get("initial_state"),
+            "moves": moves,
+            "states": states,
+        }
+
+    manifest = {"version": MANIFEST_VERSION, "transitions": transitions, "pieces": pieces}
+    if with_hashes:
+        old_files = (previous or {}).get("files", {})
+        manifest["files"] = {rel: _file_entry(root_folder, rel, old_files) for rel in sources}
+        # Folder mtimes change when files are added or removed, which file entries alone can't show.
+        manifest["folders"] = {folder.relative_to(root_folder).as_posix(): folder.stat().st_mtime_ns
+                               for folder in folders if folder.is_dir()}
+
+    problems = validate_manifest(manifest)
+    if problems:
+        raise ValueError("Invalid assets:\n  " + "\n  ".join(problems))
+    return manifest
+
+
+def validate_manifest(manifest: dict) -> List[str]:
+    """
+    Returns a description of every problem found: missing states, initial states or moves files,
+    states without sprites and transitions to unknown states.
+    """
+    problems = []
+    if manifest.get("version") != MANIFEST_VERSION:
+        problems.append(f"unsupported manifest version {manifest.get('version')!r}")
+        return problems
+    transitions = manifest["transitions"].get("states", {})
+    if not transitions:
+        problems.append(f"{TRANSITIONS_FILE} defines no states")
+    for state_name, state_data in transitions.items():
+        for event, target in state_data.get("transitions", {}).items():
+            if target not in transitions:
+                problems.append(f"state '{state_name}' goes to unknown state '{target}' on '{event}'")
+
+    for piece_type, piece in manifest["pieces"].items():
+        if piece["moves"] is None:
+            problems.append(f"piece '{piece_type}' has no moves file")
+        if piece["initial_state"] not in piece["states"]:
+            problems.append(f"piece '{piece_type}' has no initial state '{piece['initial_state']}'")
+        for state_name in transitions:
+            state = piece["states"].get(state_name)
+            if state is None:
+                problems.append(f"piece '{piece_type}' has no config for state '{state_name}'")
+            elif not state["sprites"]:
+                problems.append(f"piece '{piece_type}' has no sprites for state '{state_name}'")
+    return problems
+
+
+def write_manifest(root_folder: pathlib.Path, path: Optional[pathlib.Path] = None) -> bool:
+    """
+    Compiles the manifest for root_folder and writes it unless it is unchanged. Hashes of unchanged
+    files are reused from the existing manifest. Returns whether the file was written.
+    """
+    path = pathlib.Path(path) if path is not None else manifest_path_for(root_folder)
+    previous = _read(path)
+    manifest = build_manifest(root_folder, previous=previous)
+    if manifest == previous:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return True
+
+
+def changed_sources(root_folder: pathlib.Path, manifest: dict) -> List[str]:
+    """
+    Returns the source files and folders whose size or mtime differ from the manifest, or that are
+    gone. Only stats, never reads, so it is cheap enough to run on every startup.
+    """
+    root_folder = pathlib.Path(root_folder)
+    changed = []
+    for rel_path, entry in manifest.get("files", {}).items():
+        try:
+            stat = (root_folder / rel_path).stat()
+        except FileNotFoundError:
+            changed.append(rel_path)
+            continue
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            changed.append(rel_path)
+    for rel_path, mtime_ns in manifest.get("folders", {}).items():
+        try:
+            if (root_folder / rel_path).stat().st_mtime_ns != mtime_ns:
+                changed.append(rel_path)
+        except FileNotFoundError:
+            changed.append(rel_path)
+    return changed
+
+
+def stale_files(root_folder: pathlib.Path, manifest: dict) -> List[str]:
+    """
+    Returns the source files whose content no longer matches the manifest, plus files that were
+    removed. Files with an unchanged size and mtime are not read.
+    """
+    root_folder = pathlib.Path(root_folder)
+    stale = []
+    for rel_path, entry in manifest.get("files", {}).items():
+        try:
+            current = _file_entry(root_folder, rel_path, {rel_path: entry})
+        except FileNotFoundError:
+            stale.append(rel_path)
+            continue
+        if current["sha256"] != entry["sha256"]:
+            stale.append(rel_path)
+    return stale
+
+
+def _read(path: pathlib.Path) -> Optional[dict]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def load_manifest(root_folder: pathlib.Path, path: Optional[pathlib.Path] = None) -> Optional[dict]:
+    """
+    Reads the compiled manifest if one has been built, otherwise returns None so the pieces folder is
+    walked as before. If any source file or folder changed since the build (by size or mtime), the
+    assets are compiled again in memory, without hashes, and a warning suggests rebuilding.
+    """
+    path = pathlib.Path(path) if path is not None else manifest_path_for(root_folder)
+    try:
+        manifest = _read(path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not read asset manifest {path}: {e}")
+        return None
+    if manifest is None:
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        print(f"Warning: Asset manifest {path} has version {manifest.get('version')!r}, "
+              f"expected {MANIFEST_VERSION}; ignoring it.")
+        return None
+    changed = changed_sources(root_folder, manifest)
+    if changed:
+        print(f"Warning: Asset manifest {path} is out of date ({len(changed)} changed, e.g. {changed[0]}); "
+              f"reading the assets directly. Run `python -m implementation.asset_manifest` to rebuild it.")
+        return build_manifest(root_folder, with_hashes=False)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Compile piece configs, moves and sprite lists into one asset manifest.")
+    parser.add_argument("--assets", type=pathlib.Path, default=pathlib.Path(__file__).resolve().parent.parent / "assets")
+    parser.add_argument("--output", type=pathlib.Path, default=None)
+    parser.add_argument("--check", action="store_true", help="only report files changed since the manifest was built")
+    args = parser.parse_args(argv)
+
+    output = args.output if args.output is not None else manifest_path_for(args.assets)
+    if args.check:
+        manifest = _read(output)
+        if manifest is None:
+            raise SystemExit(f"No asset manifest at {output}")
+        # Folders only have an mtime, so added or removed sprites show up in changed_sources alone.
+        changed = sorted(set(changed_sources(args.assets, manifest)) | set(stale_files(args.assets, manifest)))
+        for rel_path in changed:
+            print(f"changed: {rel_path}")
+        raise SystemExit(1 if changed else 0)
+
+    written = write_manifest(args.assets, output)
+    print(f"{'Wrote' if written else 'Up to date:'} {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import weakref
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .img import Img, BLEND_OPAQUE, BLEND_MASKED
+
+# (x, y, cell_w, cell_h, cols, rows) of the board grid in frame pixels.
+Grid = Tuple[int, int, int, int, int, int]
+
+
+def hits_any(rects: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    For every (x, y, w, h) row in rects, whether it overlaps any row in others.
+    """
+    return ((rects[:, None, 0] < others[None, :, 0] + others[None, :, 2]) &
+            (others[None, :, 0] < rects[:, None, 0] + rects[:, None, 2]) &
+            (rects[:, None, 1] < others[None, :, 1] + others[None, :, 3]) &
+            (others[None, :, 1] < rects[:, None, 1] + rects[:, None, 3])).any(axis=1)
+
+
+class SpriteCompositor:
+    """
+    Composites a whole frame's sprites at once. Every distinct cell-sized sprite is copied once into a
+    stacked bank, so all grid-aligned, non-overlapping sprites are written with a single fancy-index
+    assignment into a block view of the board. Anything else falls back to Img.blit in paint order.
+    Sprites are treated as immutable once they have been seen. Sprites are only referenced weakly:
+    when one is garbage collected its entry is dropped and its bank slot is reused.
+    """
+    def __init__(self):
+        self._cell_size: Tuple[int, int] = (0, 0)
+        self._slots: Dict[int, Tuple[int, weakref.ref]] = {}
+        self._free: List[int] = []
+        self._bank = np.zeros((0, 0, 0, 3), dtype=np.uint8)
+        self._mask_bank = np.zeros((0, 0, 0, 1), dtype=bool)
+        self._opaque = np.zeros(0, dtype=bool)
+        self._count = 0
+
+    def composite(self, dst: np.ndarray, sprites: Sequence, grid: Grid):
+        n = len(sprites)
+        if n == 0:
+            return
+
+        gx, gy, cell_w, cell_h, cols, rows = grid
+        if (cell_w, cell_h) != self._cell_size:
+            self._reset((cell_w, cell_h))
+
+        geometry = np.array([(s.x, s.y, s.img.img.shape[1], s.img.img.shape[0]) for s in sprites],
+                            dtype=np.int64).reshape(-1, 4)
+        xs, ys, ws, hs = geometry.T
+
+        col = (xs - gx) // cell_w
+        row = (ys - gy) // cell_h
+        grid_fits = gx >= 0 and gy >= 0 and gx + cols * cell_w <= dst.shape[1] and gy + rows * cell_h <= dst.shape[0]
+        batchable = grid_fits & (ws == cell_w) & (hs == cell_h) & \
+            ((xs - gx) % cell_w == 0) & ((ys - gy) % cell_h == 0) & \
+            (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+
+        # Grid-aligned sprites can only collide by sharing a cell; the rest are checked pairwise.
+        cell = np.where(batchable, row * cols + col, 0)
+        shared = np.bincount(cell[batchable], minlength=rows * cols)[cell] > 1
+        batchable &= ~shared
+        loose = np.flatnonzero(~batchable)
+        if len(loose) and batchable.any():
+            candidates = np.flatnonzero(batchable)
+            batchable[candidates] = ~hits_any(geometry[candidates], geometry[loose])
+
+        slots = np.full(n, -1, dtype=np.int64)
+        for i in np.flatnonzero(batchable):
+            slots[i] = self._slot(sprites[i].img)
+        batched = slots >= 0
+
+        if batched.any():
+            region = dst[gy:gy + rows * cell_h, gx:gx + cols * cell_w]
+            blocks = region.reshape(rows, cell_h, cols, cell_w, 3).swapaxes(1, 2)
+
+            opaque = batched & self._opaque[np.maximum(slots, 0)]
+            if opaque.any():
+                blocks[row[opaque], col[opaque]] = self._bank[slots[opaque]]
+
+            masked = batched & ~opaque
+            if masked.any():
+                r, c, s = row[masked], col[masked], slots[masked]
+                under = blocks[r, c]
+                np.copyto(under, self._bank[s], where=self._mask_bank[s])
+                blocks[r, c] = under
+
+        for i in np.flatnonzero(~batched):
+            sprite = sprites[i]
+            sprite.img.blit(dst, sprite.x, sprite.y)
+
+    def _reset(self, cell_size: Tuple[int, int]):
+        cell_w, cell_h = cell_size
+        self._cell_size = cell_size
+        self._slots = {}
+        self._free = []
+        self._bank = np.zeros((0, cell_h, cell_w, 3), dtype=np.uint8)
+        self._mask_bank = np.zeros((0, cell_h, cell_w, 1), dtype=bool)
+        self._opaque = np.zeros(0, dtype=bool)
+        self._count = 0
+
+    def _slot(self, img: Img) -> int:
+        entry = self._slots.get(id(img))
+        if entry is not None and entry[1]() is img:
+            return entry[0]
+
+        cell_w, cell_h = self._cell_size
+        if img.blend_mode not in (BLEND_OPAQUE, BLEND_MASKED) or img.img.shape != (cell_h, cell_w, 3):
+            slot = -1
+        elif self._free:
+            slot = self._free.pop()
+        else:
+            if self._count == len(self._bank):
+                self._grow()
+            slot = self._count
+            self._count += 1
+        if slot >= 0:
+            self._bank[slot] = img.img
+            self._opaque[slot] = img.blend_mode == BLEND_OPAQUE
+            self._mask_bank[slot] = True if img.mask is None else img.mask
+
+        self._slots[id(img)] = (slot, weakref.ref(img, self._forget(id(img), slot)))
+        return slot
+
+    def _forget(self, key: int, slot: int):
+        # Bound to the tables of the time, so an entry collected after a _reset can't touch the new ones.
+        slots, free = self._slots, self._free
+
+        def callback(ref: weakref.ref):
+            entry = slots.get(key)
+            if entry is not None and entry[1] is ref:
+                del slots[key]
+            if slot >= 0:
+                free.append(slot)
+        return callback
+
+    def _grow(self):
+        capacity = max(16, 2 * len(self._bank))
+        cell_w, cell_h = self._cell_size
+
+        bank = np.zeros((capacity, cell_h, cell_w, 3), dtype=np.uint8)
+        bank[:self._count] = self._bank[:self._count]
+        mask_bank = np.zeros((capacity, cell_h, cell_w, 1), dtype=bool)
+        mask_bank[:self._count] = self._mask_bank[:self._count]
+        opaque = np.zeros(capacity, dtype=bool)
+        opaque[:self._count] = self._opaque[:self._count]
+
+        self._bank, self._mask_bank, self._opaque = bank, mask_bank, opaque
@@ -0,0 +1,183 @@
+import pathlib
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .renderer import clip_rect
+
+ClickHandler = Callable[[int, int], None]
+Rect = Tuple[int, int, int, int]
+
+NO_KEY = -1
+
+
+class DisplaySink(ABC):
+    """
+    Destination for finished frames. The game opens the sink once, presents every rendered frame to
+    it and polls it for key presses; sinks without a screen report no keys and no clicks.
+    needs_frames=False tells the game it may skip composing frames altogether.
+    present() may be given the rects that changed since the previously presented frame (None means
+    the whole frame); sinks that always take the full frame ignore them.
+    """
+    needs_frames = True
+
+    def open(self, first_frame: np.ndarray, on_click: ClickHandler):
+        pass
+
+    @abstractmethod
+    def present(self, frame: np.ndarray, dirty_rects: Optional[List[Rect]] = None):
+        pass
+
+    def poll_key(self) -> int:
+        return NO_KEY
+
+    def close(self):
+        pass
+
+
+class WindowSink(DisplaySink):
+    """
+    On-screen OpenCV window with mouse and keyboard input.
+    """
+    def __init__(self, window_name: str = "Board"):
+        self.window_name = window_name
+
+    def open(self, first_frame: np.ndarray, on_click: ClickHandler):
+        cv2.imshow(self.window_name, first_frame)
+
+        def mouse_callback(event, x, y, flags, param):
+            if event == cv2.EVENT_LBUTTONDOWN:
+                on_click(x, y)
+
+        cv2.setMouseCallback(self.window_name, mouse_callback)
+
+    def present(self, frame: np.ndarray, dirty_rects: Optional[List[Rect]] = None):
+        cv2.imshow(self.window_name, frame)
+
+    def poll_key(self) -> int:
+        key = cv2.waitKey(1)
+        return NO_KEY if key == -1 else key & 0xFF
+
+    def close(self):
+        cv2.destroyAllWindows()
+
+
+class PygameSink(DisplaySink):
+    """
+    On-screen pygame window. Only the changed rects are copied into the window surface and passed
+    to pygame.display.update; mouse clicks and key presses come from the pygame event queue.
+    Closing the window reports Esc so the game ends as usual. pygame is only imported once the sink
+    is used.
+    """
+    def __init__(self, caption: str = "Board", max_update_rects: int = 64):
+        self.caption = caption
+        self.max_update_rects = max_update_rects
+        self.rects_updated = 0
+        self._surface = None
+        self._on_click: Optional[ClickHandler] = None
+        self._keys: deque = deque()
+
+    def open(self, first_frame: np.ndarray, on_click: ClickHandler):
+        import pygame
+        pygame.display.init()
+        pygame.display.set_caption(self.caption)
+        self._on_click = on_click
+        self.present(first_frame)
+
+    def present(self, frame: np.ndarray, dirty_rects: Optional[List[Rect]] = None):
+        import pygame
+        height, width = frame.shape[:2]
+        if self._surface is None or self._surface.get_size() != (width, height):
+            self._surface = pygame.display.set_mode((width, height))
+            dirty_rects = None
+
+        if dirty_rects is None:
+            rects = [(0, 0, width, height)]
+        else:
+            rects = [r for r in (clip_rect(r, width, height) for r in dirty_rects) if r is not None]
+            if len(rects) > self.max_update_rects:
+                left = min(x for x, _, _, _ in rects)
+                top = min(y for _, y, _, _ in rects)
+                rects = [(left, top,
+                          max(x + w for x, _, w, _ in rects) - left,
+                          max(y + h for _, y, _, h in rects) - top)]
+        if not rects:
+            return
+
+        # surfarray views are indexed [x, y] and hold RGB.
+        pixels = pygame.surfarray.pixels3d(self._surface)
+        for x, y, w, h in rects:
+            pixels[x:x + w, y:y + h] = frame[y:y + h, x:x + w, 2::-1].swapaxes(0, 1)
+        del pixels
+        pygame.display.update(rects)
+        self.rects_updated += len(rects)
+
+    def poll_key(self) -> int:
+        import pygame
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self._keys.append(27)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if self._on_click is not None:
+                    self._on_click(*event.pos)
+            elif event.type == pygame.KEYDOWN:
+                self._keys.append(event.key)
+        return self._keys.popleft() if self._keys else NO_KEY
+
+    def close(self):
+        import pygame
+        self._surface = None
+        pygame.display.quit()
+
+
+class BufferSink(DisplaySink):
+    """
+    Keeps a copy of the latest frame in a reused NumPy array, e.g. for spectator views or tests.
+    """
+    def __init__(self):
+        self.frame: Optional[np.ndarray] = None
+        self.frames_presented = 0
+
+    def present(self, frame: np.ndarray, dirty_rects: Optional[List[Rect]] = None):
+        if self.frame is None or self.frame.shape != frame.shape:
+            self.frame = np.empty_like(frame)
+        np.copyto(self.frame, frame)
+        self.frames_presented += 1
+
+
+class ImageSequenceSink(DisplaySink):
+    """
+    Writes every presented frame (or every `every`-th one) to a numbered image file.
+    """
+    def __init__(self, folder: pathlib.Path, pattern: str = "frame_{:06d}.png", every: int = 1):
+        if every < 1:
+            raise ValueError("ImageSequenceSink 'every' must be at least 1.")
+        self.folder = pathlib.Path(folder)
+        self.pattern = pattern
+        self.every = every
+        self.frames_presented = 0
+        self.frames_written = 0
+
+    def open(self, first_frame: np.ndarray, on_click: ClickHandler):
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+    def present(self, frame: np.ndarray, dirty_rects: Optional[List[Rect]] = None):
+        if self.frames_presented % self.every == 0:
+            path = self.folder / self.pattern.format(self.frames_written)
+            if not cv2.imwrite(str(path), frame):
+                print(f"Warning: Could not write frame to {path}.")
+            self.frames_written += 1
+        self.frames_presented += 1
+
+
+class NullSink(DisplaySink):
+    """
+    Discards frames. The game does not compose frames at all when this sink is used.
+    """
+    needs_frames = False
+
+    def present(self, frame: np.ndarray, dirty_rects: Optional[List[Rect]] = None):
+        pass
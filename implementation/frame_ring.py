@@ -0,0 +1,96 @@
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .img import Img
+
+Rect = Tuple[int, int, int, int]
+
+
+class FrameBuffer:
+    def __init__(self, index: int):
+        self.index = index
+        self.img = Img()
+        self.frame_id = 0
+        self.base: Optional[Img] = None
+        # Screen areas that changed since this buffer was last drawn; None means repaint everything.
+        self.damage: Optional[List[Rect]] = None
+        # Set by take_latest: areas that differ from the previously presented frame; None means everything.
+        self.present_damage: Optional[List[Rect]] = None
+
+
+class FrameRing:
+    """
+    Small ring of preallocated frame buffers. The renderer acquires a free buffer, draws into it and
+    submits it; the presenter takes the latest submitted buffer and releases it after showing it.
+    Buffers are only reallocated when the frame shape changes.
+    """
+    def __init__(self, count: int = 3, max_damage_rects: int = 512):
+        if count < 2:
+            raise ValueError("FrameRing needs at least 2 buffers.")
+        self.buffers = [FrameBuffer(i) for i in range(count)]
+        self.max_damage_rects = max_damage_rects
+        self._latest: Optional[FrameBuffer] = None
+        self._presenting: Optional[FrameBuffer] = None
+        self._unpresented_damage: Optional[List[Rect]] = None
+        self._frame_counter = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: Tuple[int, ...]) -> FrameBuffer:
+        with self._lock:
+            free = [b for b in self.buffers if b is not self._latest and b is not self._presenting]
+            if not free:
+                free = [b for b in self.buffers if b is not self._presenting]
+            buffer = min(free, key=lambda b: b.frame_id)
+
+        if buffer.img.img is None or buffer.img.img.shape != shape:
+            buffer.img.img = np.empty(shape, dtype=np.uint8)
+            buffer.base = None
+            buffer.damage = None
+        return buffer
+
+    def submit(self, buffer: FrameBuffer, changed: Optional[List[Rect]] = None):
+        """
+        Publishes a drawn buffer. changed lists the areas that differ from the previously submitted
+        frame (None if unknown); it is accumulated until the next take_latest.
+        """
+        with self._lock:
+            self._frame_counter += 1
+            buffer.frame_id = self._frame_counter
+            self._latest = buffer
+            if changed is None or self._unpresented_damage is None:
+                self._unpresented_damage = None
+            else:
+                self._unpresented_damage.extend(changed)
+                if len(self._unpresented_damage) > self.max_damage_rects:
+                    self._unpresented_damage = None
+
+    def take_latest(self) -> Optional[FrameBuffer]:
+        with self._lock:
+            self._presenting = self._latest
+            if self._latest is not None:
+                self._latest.present_damage = self._unpresented_damage
+                self._unpresented_damage = []
+            return self._latest
+
+    def release(self, buffer: Optional[FrameBuffer]):
+        with self._lock:
+            if self._presenting is buffer:
+                self._presenting = None
+
+    def add_damage(self, rects: List[Rect]):
+        if not rects:
+            return
+        with self._lock:
+            for buffer in self.buffers:
+                if buffer.damage is None:
+                    continue
+                buffer.damage.extend(rects)
+                if len(buffer.damage) > self.max_damage_rects:
+                    buffer.damage = None
+
+    def invalidate(self):
+        with self._lock:
+            for buffer in self.buffers:
+                buffer.damage = None
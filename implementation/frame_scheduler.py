@@ -0,0 +1,88 @@
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class FrameScheduler:
+    """
+    Paces a loop to a target frame rate. Every frame has a fixed start deadline; the loop sleeps until
+    the next one instead of spinning, and when it falls behind it skips rendering (the caller still
+    updates the simulation) for up to max_frame_skip frames in a row so it can catch up.
+    Keeps counts of rendered, skipped and late frames; with report_interval_s set it also prints the
+    achieved rate that often.
+    """
+    def __init__(self, target_fps: float = 60.0, max_frame_skip: int = 4,
+                 report_interval_s: Optional[float] = None,
+                 clock: Callable[[], float] = time.perf_counter,
+                 sleep: Callable[[float], None] = time.sleep):
+        if target_fps <= 0:
+            raise ValueError("FrameScheduler target_fps must be positive.")
+        self.target_fps = target_fps
+        self.period_s = 1.0 / target_fps
+        self.max_frame_skip = max_frame_skip
+        self.report_interval_s = report_interval_s
+        self._clock = clock
+        self._sleep = sleep
+
+        self.frames_rendered = 0
+        self.frames_skipped = 0
+        self.missed_deadlines = 0
+        self._consecutive_skips = 0
+        self._frame_start: Optional[float] = None
+        self._render_times: deque = deque()
+        self._last_report = 0.0
+
+    def begin_frame(self) -> bool:
+        """
+        Starts the next frame and returns whether it should be rendered.
+        """
+        now = self._clock()
+        if self._frame_start is None:
+            self._frame_start = now
+            self._last_report = now
+
+        behind = now - self._frame_start >= self.period_s
+        if behind and self._consecutive_skips < self.max_frame_skip:
+            self._consecutive_skips += 1
+            self.frames_skipped += 1
+            return False
+
+        self._consecutive_skips = 0
+        self.frames_rendered += 1
+        self._render_times.append(now)
+        while self._render_times and now - self._render_times[0] > 1.0:
+            self._render_times.popleft()
+        return True
+
+    def end_frame(self):
+        """
+        Sleeps until the start of the next frame, or records a missed deadline if it has already passed.
+        """
+        if self._frame_start is None:
+            return
+        now = self._clock()
+        self._frame_start += self.period_s
+
+        if now > self._frame_start:
+            self.missed_deadlines += 1
+            # Too far behind to catch up by skipping frames: start counting from now.
+            if now - self._frame_start > (self.max_frame_skip + 1) * self.period_s:
+                self._frame_start = now
+        else:
+            self._sleep(self._frame_start - now)
+
+        if self.report_interval_s is not None and now - self._last_report >= self.report_interval_s:
+            self._last_report = now
+            print(self.report())
+
+    @property
+    def achieved_fps(self) -> float:
+        if len(self._render_times) < 2:
+            return 0.0
+        span = self._render_times[-1] - self._render_times[0]
+        return (len(self._render_times) - 1) / span if span > 0 else 0.0
+
+    def report(self) -> str:
+        return (f"FrameScheduler: {self.achieved_fps:.1f}/{self.target_fps:.0f} fps, "
+                f"{self.frames_rendered} rendered, {self.frames_skipped} skipped, "
+                f"{self.missed_deadlines} missed deadlines")
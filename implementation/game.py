@@ -1,7 +1,7 @@
-import inspect
 import pathlib
 import queue, threading, time, cv2, math
-from typing import List, Dict, Tuple, Optional
+import numpy as np
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional
 
 from .graphics import Graphics
 from .piece_factory import PieceFactory
@@ -13,12 +13,22 @@ from .board import Board
 from .command import Command
 from .piece import Piece
 from .img import Img
+from .static_layer import StaticLayer
+from .renderer import Renderer, FrameSnapshot
+from .scene import Scene, SpriteNode, RectNode, OverlayNode
+from .triple_buffer import TripleBuffer
+from .frame_scheduler import FrameScheduler
+from .display_sink import DisplaySink, WindowSink
+
+if TYPE_CHECKING:
+    # Only needed when recording; importing it pulls in multiprocessing.
+    from .video_recorder import VideoRecorder
 
 class InvalidBoard(Exception):
     pass
 
 class Game:
-    def __init__(self, pieces: List[Piece], board: Board, event_manager: EventManager, background_img: Img, move_logger_display: MoveLoggerDisplay, message_display: MessageDisplay, sound_subscriber: SoundSubscriber, piece_factory: PieceFactory):
+    def __init__(self, pieces: List[Piece], board: Board, event_manager: EventManager, background_img: Img, move_logger_display: MoveLoggerDisplay, message_display: MessageDisplay, sound_subscriber: SoundSubscriber, piece_factory: PieceFactory, static_layer: Optional[StaticLayer] = None, display_sink: Optional[DisplaySink] = None, tile_threads: int = 1):
         self.board = board
         self.pieces: Dict[str, Piece] = {p.piece_id: p for p in pieces}
         self.user_input_queue: queue.Queue = queue.Queue()
@@ -27,6 +37,9 @@ class Game:
         self.background_img = background_img
         self.screen_width: int = 0 
         self.screen_height: int = 0
+        self.output_width: int = 0
+        self.output_height: int = 0
+        self._output_frame: Optional[np.ndarray] = None
         self.selected_piece_id: Optional[str] = None
         self.selected_cell: Optional[Tuple[int, int]] = None
         self.mouse_player_color: str = 'W'
@@ -40,6 +53,20 @@ class Game:
         self.message_display = message_display
         self.sound_subscriber = sound_subscriber
         self.piece_factory = piece_factory
+        self.static_layer = static_layer if static_layer is not None else StaticLayer(background_img, board)
+        self.renderer = Renderer(self.static_layer, tile_threads=tile_threads)
+        self.scene = Scene()
+        self.display_sink = display_sink if display_sink is not None else WindowSink()
+        self.recorder: Optional["VideoRecorder"] = None
+        self.simulation_hz: float = 120.0
+        self.frame_scheduler = FrameScheduler(target_fps=60.0)
+        self.snapshots: TripleBuffer[FrameSnapshot] = TripleBuffer()
+        self._state_lock = threading.RLock()
+        self._win_deadline_ms: Optional[int] = None
+        # Idle-frame skipping: a new frame is composed only once something visible may have changed.
+        self._redraw_requested = True
+        self._next_visual_change_ms: Optional[int] = None
+        self._sprites_prefetched = False
     
     def game_time_ms(self) -> int:
         return (time.time_ns() - self.start_time_ns) // 1_000_000
@@ -52,34 +79,49 @@ class Game:
         while self.running:
             time.sleep(0.01)
 
-    def run(self):
-        cv2.imshow("Board", self.board.img.img)
-        cv2.setMouseCallback("Board", self._mouse_callback)
-        self.start_user_input_thread()
-        start_ms = self.game_time_ms()
-        for p in self.pieces.values():
-            cmd = Command(
-                timestamp=start_ms,
-                piece_id=p.piece_id,
-                type="init",
-                params=p.get_physics().get_pos()
-            )
-            p.on_command(cmd, start_ms)
-        
-        self.event_manager.publish(EventType.GAME_START, start_ms)
+    def run(self, simulation_thread: bool = False):
+        """
+        Runs the game loop. With simulation_thread=True the pieces are updated on their own thread at
+        simulation_hz, and this thread only renders the latest completed snapshot and handles the window.
+        """
+        self.display_sink.open(self.board.img.img, self._on_click)
+        try:
+            self.start_user_input_thread()
+            start_ms = self.game_time_ms()
+            for p in self.pieces.values():
+                cmd = Command(
+                    timestamp=start_ms,
+                    piece_id=p.piece_id,
+                    type="init",
+                    params=p.get_physics().get_pos()
+                )
+                p.on_command(cmd, start_ms)
+            
+            self.event_manager.publish(EventType.GAME_START, start_ms)
 
+            if simulation_thread:
+                self._run_threaded()
+            else:
+                self._run_single_threaded()
+            self._announce_win()
+        finally:
+            # Also on errors: the recorder owns a shared-memory segment and an encoder process.
+            if self.recorder is not None:
+                self.recorder.close(self.game_time_ms())
+            self.renderer.close()
+            self.display_sink.close()
+
+    def _run_single_threaded(self):
+        scheduler = self.frame_scheduler
         while self.running:
+            render = scheduler.begin_frame()
             now = self.game_time_ms()
+            self._tick(now)
 
-            for p in self.pieces.values():
-                p.update(now)
-
-            while not self.user_input_queue.empty():
-                cmd: Command = self.user_input_queue.get()
-                self._process_input(cmd, now)
-
-            self._draw(now)
-            if not self._show():
+            render = render and self._frame_due(now)
+            if render:
+                self._draw(now)
+            if not self._show(present=render):
                 self.running = False
 
             if self._is_win():
@@ -89,20 +131,86 @@ class Game:
                 end_game_display_duration = self.message_display.message_duration_ms + 1000
                 
                 while self.game_time_ms() < end_game_display_start_time + end_game_display_duration:
-                    current_time_after_win = self.game_time_ms()
-                    self._draw(current_time_after_win)
-                    if not self._show():
+                    scheduler.end_frame()
+                    now = self.game_time_ms()
+                    render = scheduler.begin_frame() and self._frame_due(now)
+                    if render:
+                        self._draw(now)
+                    if not self._show(present=render):
                         self.running = False
                         break
-                    time.sleep(0.01)
                 
                 self.running = False 
-        self._announce_win()
-        cv2.destroyAllWindows()
+            scheduler.end_frame()
 
-    def _mouse_callback(self, event, x, y, flags, param):
-        if event != cv2.EVENT_LBUTTONDOWN:
-            return
+    def _run_threaded(self):
+        simulation = threading.Thread(target=self._simulation_loop, daemon=True)
+        simulation.start()
+
+        scheduler = self.frame_scheduler
+        while self.running:
+            render = scheduler.begin_frame() and self._needs_frames() and self.snapshots.has_fresh()
+            if render:
+                self._render(self.snapshots.latest())
+            if not self._show(present=render):
+                self.running = False
+            if self._win_deadline_ms is not None and self.game_time_ms() >= self._win_deadline_ms:
+                self.running = False
+            scheduler.end_frame()
+
+        simulation.join()
+
+    def _simulation_loop(self):
+        scheduler = FrameScheduler(target_fps=self.simulation_hz, max_frame_skip=0)
+        while self.running:
+            scheduler.begin_frame()
+            now = self.game_time_ms()
+            with self._state_lock:
+                self._tick(now)
+                if self._win_deadline_ms is None and self._is_win():
+                    print("Game._run: Win condition met, initiating game end sequence.")
+                    self._announce_win()
+                    self._win_deadline_ms = now + self.message_display.message_duration_ms + 1000
+                snapshot = self._snapshot(now) if self._needs_frames() and self._frame_due(now) else None
+            if snapshot is not None:
+                self.snapshots.publish(snapshot)
+            scheduler.end_frame()
+
+    def _tick(self, now: int):
+        for p in self.pieces.values():
+            state = p.get_self_state()
+            p.update(now)
+            if p.get_self_state() is not state:
+                self._redraw_requested = True
+
+        while not self.user_input_queue.empty():
+            cmd: Command = self.user_input_queue.get()
+            self._process_input(cmd, now)
+            self._redraw_requested = True
+
+    def _frame_due(self, now_ms: int) -> bool:
+        """
+        Returns whether anything visible may have changed since the last composed frame: input or a
+        state change requested a redraw, or the earliest timed change (next sprite frame, a jump
+        landing, a message expiring; a moving piece counts as changing every frame) has been reached.
+        """
+        if not self._redraw_requested and \
+                (self._next_visual_change_ms is None or now_ms < self._next_visual_change_ms):
+            return False
+        self._redraw_requested = False
+        times = [p.next_visual_change_ms(now_ms) for p in self.pieces.values()]
+        times.append(self.message_display.next_change_ms(now_ms))
+        times = [t for t in times if t is not None]
+        self._next_visual_change_ms = min(times) if times else None
+        return True
+
+    def _on_click(self, x: int, y: int):
+        x, y = self._to_render_coords(x, y)
+        with self._state_lock:
+            self._handle_mouse_click(x, y)
+            self._redraw_requested = True
+
+    def _handle_mouse_click(self, x: int, y: int):
         board_width = self.board.W_cells * self.board.cell_W_pix
         board_height = self.board.H_cells * self.board.cell_H_pix
         board_x_on_screen = (self.screen_width - board_width) // 2
@@ -256,85 +364,108 @@ class Game:
             )
 
     def _draw(self, now_ms: int):
-        final_display_img_obj = self.background_img.copy() 
-        cloned_board = self.board.clone()
-
+        if not self._needs_frames():
+            return
+        self._render(self._snapshot(now_ms))
+
+    def _render(self, snapshot: FrameSnapshot):
+        self.current_frame = self.renderer.render(list(snapshot.items), (self.screen_width, self.screen_height))
+        if self.recorder is not None:
+            self.recorder.offer(self.current_frame, snapshot.now_ms)
+
+    def _needs_frames(self) -> bool:
+        return self.display_sink.needs_frames or self.recorder is not None
+
+    def _snapshot(self, now_ms: int) -> FrameSnapshot:
+        self.static_layer.get(self.screen_width, self.screen_height)
+        board_x_on_screen, board_y_on_screen = self.static_layer.board_origin
+        items = self._collect_draw_items(now_ms, board_x_on_screen, board_y_on_screen)
+        return FrameSnapshot(now_ms=now_ms, items=items)
+
+    def _collect_draw_items(self, now_ms: int, board_x_on_screen: int, board_y_on_screen: int) -> Tuple:
+        """
+        Brings the retained scene up to date with the game state and returns its items in paint order.
+        Nodes whose inputs did not change keep their cached items, so the renderer sees them as unchanged.
+        """
+        board_size = (self.board.img.get_width(), self.board.img.get_height())
+        self.scene.set_viewport((0, 0) + self.static_layer.size)
+
+        pieces_layer = self.scene.layer("pieces")
+        pieces_layer.set_position(board_x_on_screen, board_y_on_screen)
+        for node in list(pieces_layer.children):
+            if node.key[1] not in self.pieces:
+                pieces_layer.remove(node.key)
         for p in self.pieces.values():
-            p.draw_on_board(cloned_board, now_ms)
-
+            node = pieces_layer.child(("piece", p.piece_id)) or pieces_layer.add(SpriteNode(("piece", p.piece_id)))
+            draw_x, draw_y = p.get_draw_pos(self.board)
+            node.set(p.get_draw_img(now_ms), draw_x, draw_y)
+
+        cursors_layer = self.scene.layer("cursors")
+        cursors_layer.set_position(board_x_on_screen, board_y_on_screen)
+        cursors_layer.set_size(board_size)
+        keyboard_cursor = cursors_layer.child(("cursor", "keyboard")) or cursors_layer.add(RectNode(
+            ("cursor", "keyboard"), self.board.cell_W_pix, self.board.cell_H_pix,
+            self.keyboard_cursor_color, self.keyboard_cursor_thickness))
+        keyboard_cursor.set_style(self.board.cell_W_pix, self.board.cell_H_pix,
+                                  self.keyboard_cursor_color, self.keyboard_cursor_thickness)
         cursor_col, cursor_row = self.keyboard_cursor_cell
-        x_pix = cursor_col * self.board.cell_W_pix
-        y_pix = cursor_row * self.board.cell_H_pix
-
-        cloned_board.img.draw_rectangle( 
-            x_pix, y_pix,
-            self.board.cell_W_pix, self.board.cell_H_pix,
-            self.keyboard_cursor_color,
-            self.keyboard_cursor_thickness
-        )
-
-        if self.keyboard_selected_piece_id:
-            selected_piece = self.pieces.get(self.keyboard_selected_piece_id)
-            if selected_piece:
-                sel_col, sel_row = selected_piece.get_physics().get_cell()
-                sel_x_pix = sel_col * self.board.cell_W_pix
-                sel_y_pix = sel_row * self.board.cell_H_pix
-                cloned_board.img.draw_rectangle( 
-                    sel_x_pix, sel_y_pix,
-                    self.board.cell_W_pix, self.board.cell_H_pix,
-                    (0, 0, 255), 
-                    3
-                )
-        
-        board_width = cloned_board.img.get_width()
-        board_height = cloned_board.img.get_height()
-        board_x_on_screen = (self.screen_width - board_width) // 2
-        board_y_on_screen = (self.screen_height - board_height) // 2
-        
-        cloned_board.img.draw_on(final_display_img_obj, board_x_on_screen, board_y_on_screen)
-
-        self.message_display.draw(
-            display_img=final_display_img_obj.img,
-            display_width=self.screen_width,
-            display_height=self.screen_height,
-            current_game_time_ms=now_ms
-        )
-        self.move_logger_display.draw(
-            display_img=final_display_img_obj.img,
-            display_width=self.screen_width,
-            display_height=self.screen_height,
-            board_x_offset=board_x_on_screen,
-            board_y_offset=board_y_on_screen,
-            board_width=board_width,
-            board_height=board_height
-        )
-        self.current_frame = final_display_img_obj.img
-
-    def _show(self) -> bool:
-        cv2.imshow("Board", self.current_frame)
-        key = cv2.waitKey(1) & 0xFF
-
-        current_col, current_row = self.keyboard_cursor_cell
+        keyboard_cursor.set_position(cursor_col * self.board.cell_W_pix, cursor_row * self.board.cell_H_pix)
+
+        selected_cursor = cursors_layer.child(("cursor", "keyboard_selected")) or cursors_layer.add(RectNode(
+            ("cursor", "keyboard_selected"), self.board.cell_W_pix, self.board.cell_H_pix, (0, 0, 255), 3))
+        selected_cursor.set_style(self.board.cell_W_pix, self.board.cell_H_pix, (0, 0, 255), 3)
+        selected_piece = self.pieces.get(self.keyboard_selected_piece_id) if self.keyboard_selected_piece_id else None
+        selected_cursor.set_visible(selected_piece is not None)
+        if selected_piece is not None:
+            sel_col, sel_row = selected_piece.get_physics().get_cell()
+            selected_cursor.set_position(sel_col * self.board.cell_W_pix, sel_row * self.board.cell_H_pix)
+
+        overlays_layer = self.scene.layer("overlays")
+        message_node = overlays_layer.child(("overlay", "message")) or overlays_layer.add(OverlayNode(
+            ("overlay", "message"),
+            rects_for=lambda layout: tuple(self.message_display.get_text_rect(text, org) for text, org in layout),
+            draw=lambda img, origin, layout: self.message_display.draw_layout(img, layout, origin)))
+        message_node.set_signature(tuple(self.message_display.get_layout(self.screen_width, self.screen_height, now_ms)))
+
+        log_node = overlays_layer.child(("overlay", "move_log")) or overlays_layer.add(OverlayNode(
+            ("overlay", "move_log"),
+            rects_for=lambda layout: layout.rects,
+            draw=lambda img, origin, layout: self.move_logger_display.draw_layout(img, layout, origin)))
+        log_node.set_signature(self.move_logger_display.get_layout(
+            self.screen_width, self.screen_height,
+            board_x_on_screen, board_y_on_screen, board_size[0], board_size[1]
+        ))
+        return self.scene.items()
+
+    def _show(self, present: bool = True) -> bool:
+        if present and self.display_sink.needs_frames:
+            buffer = self.renderer.ring.take_latest()
+            if buffer is not None:
+                self.display_sink.present(self._upscale(buffer.img.img), self._upscale_rects(buffer.present_damage))
+                if not self._sprites_prefetched:
+                    # The first frame is up; warm the sprites of states nobody has entered yet.
+                    self._sprites_prefetched = True
+                    self.piece_factory.prefetch_sprites()
+            self.renderer.ring.release(buffer)
+        key = self.display_sink.poll_key()
+        steps = {ord('w'): (0, -1), ord('s'): (0, 1), ord('a'): (-1, 0), ord('d'): (1, 0)}
         moved = False
 
-        if key == ord('w'):
-            if current_row > 0:
-                self.keyboard_cursor_cell = (current_col, current_row - 1)
-                moved = True
-        elif key == ord('s'):
-            if current_row < self.board.H_cells - 1:
-                self.keyboard_cursor_cell = (current_col, current_row + 1)
-                moved = True
-        elif key == ord('a'):
-            if current_col > 0:
-                self.keyboard_cursor_cell = (current_col - 1, current_row)
-                moved = True
-        elif key == ord('d'):
-            if current_col < self.board.W_cells - 1:
-                self.keyboard_cursor_cell = (current_col + 1, current_row)
-                moved = True
+        # The cursor changes under the lock, and the redraw is requested only afterwards, so the
+        # simulation thread can't compose a frame that clears the request but shows the old cursor.
+        if key in steps:
+            with self._state_lock:
+                current_col, current_row = self.keyboard_cursor_cell
+                d_col, d_row = steps[key]
+                new_col, new_row = current_col + d_col, current_row + d_row
+                if 0 <= new_col < self.board.W_cells and 0 <= new_row < self.board.H_cells:
+                    self.keyboard_cursor_cell = (new_col, new_row)
+                    moved = True
+                    self._redraw_requested = True
         elif key == 13:
-            self._handle_keyboard_action(self.keyboard_cursor_cell)
+            with self._state_lock:
+                self._handle_keyboard_action(self.keyboard_cursor_cell)
+                self._redraw_requested = True
 
         if moved:
             print(f"Keyboard cursor moved to: {self.keyboard_cursor_cell}")
@@ -343,6 +474,41 @@ class Game:
             return False
         return True
 
+    def _upscale(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Scales a frame composed at the internal resolution to the output size, reusing one buffer.
+        """
+        height, width = frame.shape[:2]
+        if self.output_width <= 0 or self.output_height <= 0 or (self.output_width, self.output_height) == (width, height):
+            return frame
+        shape = (self.output_height, self.output_width, frame.shape[2])
+        if self._output_frame is None or self._output_frame.shape != shape:
+            self._output_frame = np.empty(shape, dtype=frame.dtype)
+        cv2.resize(frame, (self.output_width, self.output_height), dst=self._output_frame, interpolation=cv2.INTER_LINEAR)
+        return self._output_frame
+
+    def _upscale_rects(self, rects: Optional[List[Tuple[int, int, int, int]]]) -> Optional[List[Tuple[int, int, int, int]]]:
+        """
+        Maps changed rects from the internal resolution to the output, grown by one source pixel on
+        each side to cover the bilinear filter's reach.
+        """
+        if rects is None or self.output_width <= 0 or self.output_height <= 0 \
+                or (self.output_width, self.output_height) == (self.screen_width, self.screen_height):
+            return rects
+        sx = self.output_width / self.screen_width
+        sy = self.output_height / self.screen_height
+        scaled = []
+        for x, y, w, h in rects:
+            x1, y1 = math.floor((x - 1) * sx), math.floor((y - 1) * sy)
+            x2, y2 = math.ceil((x + w + 1) * sx), math.ceil((y + h + 1) * sy)
+            scaled.append((x1, y1, x2 - x1, y2 - y1))
+        return scaled
+
+    def _to_render_coords(self, x: int, y: int) -> Tuple[int, int]:
+        if self.output_width <= 0 or self.output_height <= 0:
+            return x, y
+        return x * self.screen_width // self.output_width, y * self.screen_height // self.output_height
+
     def _handle_keyboard_action(self, cell_coords: Tuple[int, int]):
         clicked_piece_id = None
         for pid, piece in self.pieces.items():
@@ -427,6 +593,7 @@ class Game:
 
         if winner_color:
             self.event_manager.publish(EventType.GAME_END, winner=winner_color, game_time_ms=self.game_time_ms())
+            self._redraw_requested = True
 
     def _get_all_pieces_on_board(self) -> List['Piece']:
         return list(self.pieces.values())
@@ -1,6 +1,6 @@
 import pathlib
 import csv
-from typing import List, Tuple, Dict
+from typing import TYPE_CHECKING, List, Tuple, Dict, Optional
 
 from implementation.publish_subscribe.message_display import MessageDisplay
 from implementation.publish_subscribe.move_logger_display import MoveLoggerDisplay
@@ -11,8 +11,16 @@ from .game import Game
 from .piece import Piece
 from .piece_factory import PieceFactory
 from .img import Img
+from .static_layer import StaticLayer
+from .sprite_atlas import load_atlas
+from .asset_manifest import load_manifest
+from .sprite_cache import SpriteCache, sprite_cache_dir_for
+from .display_sink import DisplaySink
 from .publish_subscribe.event_manager import EventManager
 
+if TYPE_CHECKING:
+    from .video_recorder import VideoRecorder
+
 class GameBuilder:
     def __init__(self, root_folder: pathlib.Path, 
                  board_width: int, board_height: int,
@@ -20,12 +28,26 @@ class GameBuilder:
                  board_image_file: str,
                  background_image_file: str,
                  screen_width: int, 
-                 screen_height: int):
-        
+                 screen_height: int,
+                 render_width: Optional[int] = None,
+                 tile_threads: int = 1):
+        """
+        render_width sets the internal resolution frames are composed at (height follows the screen's
+        aspect ratio); frames are upscaled to the screen size once, just before they are shown.
+        Board, sprites and background are all sized for the internal resolution.
+        tile_threads > 1 lets the renderer composite large repaints as parallel tiles.
+        """
         self.root_folder = root_folder.resolve()
+        self.tile_threads = tile_threads
         self.screen_width = screen_width
         self.screen_height = screen_height
 
+        self.render_scale = render_width / screen_width if render_width and screen_width > 0 else 1.0
+        self.render_width = round(screen_width * self.render_scale)
+        self.render_height = round(screen_height * self.render_scale)
+        cell_width_pix = max(1, round(cell_width_pix * self.render_scale))
+        cell_height_pix = max(1, round(cell_height_pix * self.render_scale))
+
         board_img = Img()
         board_img_path = self.root_folder / board_image_file
         board_img.read(board_img_path)
@@ -48,14 +70,23 @@ class GameBuilder:
         self.background_img = Img()
         background_img_path = self.root_folder / background_image_file
         self.background_img.read(background_img_path)
-        self.background_img.resize(self.screen_width, self.screen_height)
+        self.background_img.resize(self.render_width, self.render_height)
+        self.static_layer = StaticLayer(self.background_img, self.board)
+        self.static_layer.get(self.render_width, self.render_height)
 
         pieces_root_folder = self.root_folder / "pieces_resources"
-        self.piece_factory = PieceFactory(self.board, pieces_root_folder)
+        # Sprites come from a prebuilt atlas for this cell size when there is one (see sprite_atlas.py).
+        self.sprite_atlas = load_atlas(pieces_root_folder, (cell_width_pix, cell_height_pix))
+        # Only initial-state sprites are decoded before the first frame; the game prefetches the rest.
+        # Piece configs and sprite lists come from the compiled asset manifest when there is one (see asset_manifest.py).
+        # Without an atlas, resized sprites are reused from the on-disk cache of earlier launches.
+        self.piece_factory = PieceFactory(self.board, pieces_root_folder, atlas=self.sprite_atlas, lazy_sprites=True,
+                                          manifest=load_manifest(self.root_folder),
+                                          sprite_cache=SpriteCache(sprite_cache_dir_for(self.root_folder)))
         
         self.event_manager = EventManager() 
-        self.move_logger_display = MoveLoggerDisplay(self.event_manager)
-        self.message_display = MessageDisplay(self.event_manager)
+        self.move_logger_display = MoveLoggerDisplay(self.event_manager, render_scale=self.render_scale)
+        self.message_display = MessageDisplay(self.event_manager, render_scale=self.render_scale)
         self.sound_subscriber = SoundSubscriber(self.event_manager)
 
     def _read_board_layout(self, board_file: pathlib.Path) -> List[Tuple[str, Tuple[int, int]]]:
@@ -70,8 +101,9 @@ class GameBuilder:
                         pieces_data.append((piece_type, (col_index, row_index)))
         return pieces_data
 
-    def build_game(self, board_file: str) -> Game:
-        """Build the full game by creating all pieces and a Game instance."""
+    def build_game(self, board_file: str, display_sink: Optional[DisplaySink] = None,
+                   recorder: Optional["VideoRecorder"] = None) -> Game:
+        """Build the full game by creating all pieces and a Game instance. Frames go to an on-screen window unless another display sink is given, and are also recorded to video when a recorder is given."""
         board_path = self.root_folder / board_file
         if not board_path.exists():
             raise FileNotFoundError(f"Board file not found at {board_path}")
@@ -89,7 +121,10 @@ class GameBuilder:
             piece = self.piece_factory.create_piece(piece_type, location)
             game_pieces.append(piece)
 
-        game = Game(game_pieces, self.board, self.event_manager, self.background_img, move_logger_display=self.move_logger_display, message_display=self.message_display, sound_subscriber=self.sound_subscriber,piece_factory=self.piece_factory) 
-        game.screen_width = self.screen_width
-        game.screen_height = self.screen_height
+        game = Game(game_pieces, self.board, self.event_manager, self.background_img, move_logger_display=self.move_logger_display, message_display=self.message_display, sound_subscriber=self.sound_subscriber,piece_factory=self.piece_factory, static_layer=self.static_layer, display_sink=display_sink, tile_threads=self.tile_threads)
+        game.screen_width = self.render_width
+        game.screen_height = self.render_height
+        game.output_width = self.screen_width
+        game.output_height = self.screen_height
+        game.recorder = recorder
         return game
\ No newline at end of file
@@ -1,65 +1,155 @@
+import math
 import pathlib
 import time
 import copy
-from typing import Optional, List
+import threading
+from typing import Optional, List, Tuple
 from .command import Command
 from .board import Board
 from .img import Img
+from .sprite_atlas import SpriteAtlas
+from .sprite_cache import SpriteCache
+
+def read_sprite(file: pathlib.Path, target_size: Tuple[int, int], cache: Optional[SpriteCache] = None) -> Img:
+    if cache is not None:
+        return cache.read(file, target_size)
+    img = Img()
+    img.read(file, target_size=target_size)
+    return img
+
+
+class SpriteSet:
+    """
+    The frames of one sprites folder, decoded on first use (or taken from the atlas right away).
+    Shared by every copy of a Graphics. Whoever decodes the folder claims it first, so when the game
+    asks for frames a background prefetcher is still decoding, it waits for that result instead of
+    decoding the folder a second time.
+    """
+    def __init__(self, folder: pathlib.Path, target_size: Tuple[int, int],
+                 atlas: Optional[SpriteAtlas] = None, frames: Optional[List[Img]] = None,
+                 files: Optional[List[pathlib.Path]] = None, cache: Optional[SpriteCache] = None):
+        """
+        files lists the sprite files when they are already known (e.g. from the asset manifest);
+        otherwise the folder is globbed. Frames not in the atlas are read through cache when given.
+        """
+        self.folder = folder
+        self.target_size = target_size
+        self.cache = cache
+        if frames is None and atlas is not None:
+            frames = atlas.frames(folder)
+        self._frames: Optional[List[Img]] = frames
+        if frames is not None:
+            files = []
+        elif files is None:
+            files = sorted(folder.glob("*.png"))
+        self.files: List[pathlib.Path] = files
+        self._claimed = False
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._frames) if self._frames is not None else len(self.files)
+
+    @property
+    def loaded(self) -> bool:
+        return self._frames is not None
+
+    def claim(self) -> bool:
+        """
+        Reserves the set for decoding. Returns False if it is already loaded or claimed; otherwise the
+        caller must call set_frames() and/or release().
+        """
+        with self._condition:
+            if self._frames is not None or self._claimed:
+                return False
+            self._claimed = True
+            return True
+
+    def release(self):
+        """Drops a claim; waiters decode the folder themselves if no frames were set."""
+        with self._condition:
+            self._claimed = False
+            self._condition.notify_all()
+
+    def frames(self) -> List[Img]:
+        frames = self._frames
+        if frames is not None:
+            return frames
+        with self._condition:
+            while self._frames is None and self._claimed:
+                self._condition.wait()
+            if self._frames is not None:
+                return self._frames
+            self._claimed = True
+        try:
+            self.set_frames([read_sprite(file, self.target_size, self.cache) for file in self.files])
+        finally:
+            self.release()
+        return self._frames
+
+    def set_frames(self, frames: List[Img]):
+        with self._condition:
+            if self._frames is None:
+                self._frames = frames
+            self._condition.notify_all()
+
 
 class Graphics:
     def __init__(self,
                  sprites_folder: pathlib.Path,
                  board: Board,
                  loop: bool = True,
-                 fps: float = 6.0):
+                 fps: float = 6.0,
+                 atlas: Optional[SpriteAtlas] = None,
+                 sprite_set: Optional[SpriteSet] = None,
+                 lazy: bool = False):
+        """
+        Sprites come from sprite_set when given (typically shared through a GraphicsFactory), otherwise
+        from the folder. With lazy=True they are only decoded when first drawn.
+        """
         self.sprites_folder = sprites_folder
         self.board = board
         self.loop = loop
         self.fps = fps
+        self.atlas = atlas
 
-        self.sprites: list[Img] = []
         self.cur_index = 0
         self.last_frame_time: Optional[int] = None
         self.total_frames = 0
         self.animation_finished = False
 
-        self._load_sprites()
-
-    def _load_sprites(self):
-        files = sorted(self.sprites_folder.glob("*.png"))
-        
-        target_size = (self.board.cell_W_pix, self.board.cell_H_pix)
-
-        for file in files:
-            img = Img()
-            img.read(file, target_size=target_size)
-            self.sprites.append(img)
-
-        self.total_frames = len(self.sprites)
+        self._sprite_set = sprite_set if sprite_set is not None else SpriteSet(
+            sprites_folder, (board.cell_W_pix, board.cell_H_pix), atlas)
+        self.total_frames = len(self._sprite_set)
         if self.total_frames == 0:
             raise ValueError(f"No sprites found in: {self.sprites_folder}")
+        if not lazy:
+            self._sprite_set.frames()
+
+    @property
+    def sprites(self) -> List[Img]:
+        return self._sprite_set.frames()
+
+    @sprites.setter
+    def sprites(self, frames: List[Img]):
+        self._sprite_set = SpriteSet(self.sprites_folder, self._sprite_set.target_size, frames=list(frames))
+        self.total_frames = len(self._sprite_set)
+        self.cur_index = min(self.cur_index, max(0, self.total_frames - 1))
+
+    def __deepcopy__(self, memo):
+        """
+        Deep copies of a piece's state graph share the sprites, board and atlas like copy() does.
+        """
+        clone = self.copy()
+        memo[id(self)] = clone
+        return clone
 
     def copy(self):
-        new_board = self.board.clone()
-
-        new_graphics = Graphics(
-            sprites_folder=self.sprites_folder,
-            board=new_board,
-            loop=self.loop,
-            fps=self.fps
-        )
-
-        new_graphics.cur_index = self.cur_index
-        new_graphics.last_frame_time = self.last_frame_time
-        new_graphics.total_frames = self.total_frames
-        new_graphics.animation_finished = self.animation_finished
-
-        new_sprites: List[Img] = []
-        for sprite in self.sprites:
-            new_sprites.append(sprite.copy())
-        new_graphics.sprites = new_sprites
-
-        return new_graphics
+        """
+        Returns a Graphics with its own animation cursor (cur_index, last_frame_time,
+        animation_finished) that shares the sprites, board and atlas with this one. Nothing is read
+        or resized; assigning new sprites to either instance later only replaces them on that one.
+        """
+        return copy.copy(self)
 
     def reset(self, cmd: Command):
         self.cur_index = 0
@@ -93,6 +183,16 @@ class Graphics:
                     return None
         return None
     
+    def next_frame_ms(self, now_ms: int) -> Optional[int]:
+        """
+        Game time at which update() will next show a different sprite, or None if it never will.
+        """
+        if self.is_finished() or (self.loop and self.total_frames <= 1):
+            return None
+        if self.last_frame_time is None:
+            return now_ms
+        return self.last_frame_time + math.ceil(1000 / self.fps)
+
     def is_finished(self) -> bool: 
         return self.animation_finished and not self.loop
 
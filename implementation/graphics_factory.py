@@ -1,14 +1,75 @@
 import pathlib
-import json
-from .graphics import Graphics
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from .graphics import Graphics, SpriteSet, read_sprite
 from .board import Board
+from .sprite_atlas import SpriteAtlas
+from .sprite_cache import SpriteCache
 
 class GraphicsFactory:
-    def __init__(self, board: Board):
+    """
+    Creates Graphics that share one lazily decoded SpriteSet per sprites folder. preload() decodes
+    many folders at once on a thread pool; prefetch() does the same for every folder not yet
+    decoded on a background thread.
+    """
+    def __init__(self, board: Board, atlas: Optional[SpriteAtlas] = None, cache: Optional[SpriteCache] = None):
         self.board = board
+        self.atlas = atlas
+        self.cache = cache
+        self._sprite_sets: Dict[pathlib.Path, SpriteSet] = {}
 
-    def load(self, sprites_dir: pathlib.Path, cfg: dict) -> Graphics:
-        if not sprites_dir.is_dir():
+    def sprite_set(self, sprites_dir: pathlib.Path, files: Optional[List[pathlib.Path]] = None) -> SpriteSet:
+        sprite_set = self._sprite_sets.get(sprites_dir)
+        if sprite_set is None:
+            sprite_set = SpriteSet(sprites_dir, (self.board.cell_W_pix, self.board.cell_H_pix), self.atlas,
+                                   files=files, cache=self.cache)
+            self._sprite_sets[sprites_dir] = sprite_set
+        return sprite_set
+
+    @property
+    def sprite_dirs(self) -> List[pathlib.Path]:
+        return list(self._sprite_sets)
+
+    def preload(self, sprite_dirs: Iterable[pathlib.Path], max_workers: Optional[int] = None) -> int:
+        """
+        Decodes and resizes every sprite of the given folders on a thread pool (OpenCV releases the
+        GIL while decoding and resizing); max_workers=1 decodes them one at a time on this thread.
+        Folders already decoded, in the atlas or being decoded elsewhere are skipped.
+        Returns the number of sprites decoded.
+        """
+        sets = [s for s in (self.sprite_set(d) for d in sprite_dirs) if s.claim()]
+        try:
+            if max_workers == 1:
+                for sprite_set in sets:
+                    sprite_set.set_frames([read_sprite(f, sprite_set.target_size, sprite_set.cache)
+                                           for f in sprite_set.files])
+            else:
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sprite-loader") as pool:
+                    pending = [(s, [pool.submit(read_sprite, f, s.target_size, s.cache) for f in s.files])
+                               for s in sets]
+                    for sprite_set, futures in pending:
+                        sprite_set.set_frames([future.result() for future in futures])
+        finally:
+            for sprite_set in sets:
+                sprite_set.release()
+        return sum(len(s.files) for s in sets)
+
+    def prefetch(self, max_workers: Optional[int] = None) -> threading.Thread:
+        """
+        Starts decoding every folder that has not been used yet in the background, so the first
+        jump or rest does not have to wait for its sprites.
+        """
+        thread = threading.Thread(target=self.preload, args=(self.sprite_dirs, max_workers),
+                                  name="sprite-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def load(self, sprites_dir: pathlib.Path, cfg: dict, files: Optional[List[pathlib.Path]] = None) -> Graphics:
+        """
+        files, when given, lists the sprites so the folder is neither checked nor globbed.
+        """
+        if files is None and not sprites_dir.is_dir():
             raise FileNotFoundError(f"Sprites directory not found: {sprites_dir}")
 
         graphics_cfg = cfg.get("graphics", {})
@@ -19,5 +80,8 @@ class GraphicsFactory:
             sprites_folder=sprites_dir,
             board=self.board,
             loop=is_loop,
-            fps=fps
-        )
\ No newline at end of file
+            fps=fps,
+            atlas=self.atlas,
+            sprite_set=self.sprite_set(sprites_dir, files),
+            lazy=True
+        )
@@ -1,59 +1,198 @@
 import cv2
 import numpy as np
 import pathlib
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+BLEND_OPAQUE = "opaque"
+BLEND_MASKED = "masked"
+BLEND_TRANSLUCENT = "translucent"
+
 
 class Img:
+    """
+    BGR uint8 image. Images loaded with an alpha channel keep it as a premultiplied mask,
+    and the blit path is picked once at load/resize time instead of on every draw.
+    """
     def __init__(self):
         self.img: Optional[np.ndarray] = None
+        self.alpha: Optional[np.ndarray] = None
+        self.blend_mode: str = BLEND_OPAQUE
+        self._mask: Optional[np.ndarray] = None
+        self._inv_alpha: Optional[np.ndarray] = None
+        self._tints: Dict[Tuple[Tuple[int, int, int], float], 'Img'] = {}
 
     def read(self, path: pathlib.Path, target_size: Optional[Tuple[int, int]] = None):
         if not path.exists():
             raise FileNotFoundError(f"Image file not found at {path}")
         
-        self.img = cv2.imread(str(path), cv2.IMREAD_COLOR) 
+        raw = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
         
-        if self.img is None:
+        if raw is None:
             raise ValueError(f"Could not read image from {path}. Check file format or corruption.")
 
-        if self.img.dtype != np.uint8:
-            self.img = self.img.astype(np.uint8)
-
-        if not self.img.flags['C_CONTIGUOUS']:
-            self.img = np.ascontiguousarray(self.img)
+        self._set_pixels(raw)
 
         if target_size:
             self.resize(target_size[0], target_size[1])
 
         return self
 
+    def _set_pixels(self, raw: np.ndarray):
+        if raw.dtype == np.uint16:
+            raw = (raw >> 8).astype(np.uint8)
+        elif raw.dtype != np.uint8:
+            raw = raw.astype(np.uint8)
+
+        if raw.ndim == 2:
+            raw = cv2.cvtColor(raw, cv2.COLOR_GRAY2BGR)
+
+        if raw.shape[2] == 4:
+            alpha = np.ascontiguousarray(raw[:, :, 3])
+            bgr = raw[:, :, :3]
+            # Premultiply so translucent blits are a single multiply-add.
+            self.img = cv2.multiply(bgr, cv2.merge([alpha, alpha, alpha]), scale=1 / 255)
+            self.alpha = alpha
+        else:
+            self.img = np.ascontiguousarray(raw)
+            self.alpha = None
+
+        self._prepare_blit()
+
+    def _prepare_blit(self):
+        """
+        Classifies the alpha mask once so blit() never has to inspect it again.
+        """
+        self._mask = None
+        self._inv_alpha = None
+        self._tints = {}
+
+        if self.alpha is None or self.alpha.min() == 255:
+            self.alpha = None
+            self.blend_mode = BLEND_OPAQUE
+        elif np.isin(self.alpha, (0, 255)).all():
+            self.blend_mode = BLEND_MASKED
+            self._mask = (self.alpha == 255)[:, :, None]
+        else:
+            self.blend_mode = BLEND_TRANSLUCENT
+            inv = 255 - self.alpha
+            self._inv_alpha = cv2.merge([inv, inv, inv])
+
+    @property
+    def mask(self) -> Optional[np.ndarray]:
+        """
+        Boolean (H, W, 1) coverage mask for masked images, None otherwise.
+        """
+        return self._mask
+
+    @property
+    def inv_alpha(self) -> Optional[np.ndarray]:
+        """
+        (H, W, 3) inverted alpha for translucent images, None otherwise.
+        """
+        return self._inv_alpha
+
+    @classmethod
+    def from_prepared(cls, img: np.ndarray, alpha: Optional[np.ndarray], blend_mode: str,
+                      mask: Optional[np.ndarray] = None, inv_alpha: Optional[np.ndarray] = None) -> 'Img':
+        """
+        Wraps pixel arrays that were already classified for blitting, e.g. views into a sprite atlas,
+        without copying or re-inspecting them.
+        """
+        new_img_obj = cls()
+        new_img_obj.img = img
+        new_img_obj.alpha = alpha
+        new_img_obj.blend_mode = blend_mode
+        new_img_obj._mask = mask
+        new_img_obj._inv_alpha = inv_alpha
+        return new_img_obj
+
+    @classmethod
+    def from_pixels(cls, img: np.ndarray, alpha: Optional[np.ndarray] = None) -> 'Img':
+        """
+        Wraps a premultiplied BGR image and its alpha, e.g. as stored by the sprite cache, and
+        classifies it for blitting like read() does.
+        """
+        new_img_obj = cls()
+        new_img_obj.img = img
+        new_img_obj.alpha = alpha
+        new_img_obj._prepare_blit()
+        return new_img_obj
+
     def copy(self) -> 'Img':
         new_img_obj = Img()
         if self.img is not None:
             new_img_obj.img = self.img.copy()
+        if self.alpha is not None:
+            new_img_obj.alpha = self.alpha.copy()
+        new_img_obj.blend_mode = self.blend_mode
+        new_img_obj._mask = self._mask
+        new_img_obj._inv_alpha = self._inv_alpha
         return new_img_obj
 
+    def tinted(self, color: Tuple[int, int, int], strength: float) -> 'Img':
+        """
+        Returns a copy that draws like this image followed by a flat colour blended over the whole
+        rectangle at the given strength. Built once per (color, strength) and cached.
+        """
+        key = (tuple(color), strength)
+        cached = self._tints.get(key)
+        if cached is not None:
+            return cached
+
+        keep = 1.0 - strength
+        color_layer = np.empty_like(self.img)
+        color_layer[:] = color
+
+        tint = Img()
+        tint.img = cv2.addWeighted(self.img, keep, color_layer, strength, 0.0)
+        if self.alpha is not None:
+            tint.alpha = cv2.addWeighted(self.alpha, keep, np.full_like(self.alpha, 255), strength, 0.0)
+        tint._prepare_blit()
+
+        self._tints[key] = tint
+        return tint
+
+    def blit(self, dst: np.ndarray, x: int, y: int):
+        """
+        Draws this image onto a BGR uint8 array at (x, y), clipped to the array bounds.
+        """
+        h_src, w_src = self.img.shape[:2]
+        h_dst, w_dst = dst.shape[:2]
+
+        x_dst_start = max(0, x)
+        y_dst_start = max(0, y)
+        x_dst_end = min(w_dst, x + w_src)
+        y_dst_end = min(h_dst, y + h_src)
+        if x_dst_start >= x_dst_end or y_dst_start >= y_dst_end:
+            return
+
+        x_src_start = x_dst_start - x
+        y_src_start = y_dst_start - y
+        x_src_end = x_src_start + (x_dst_end - x_dst_start)
+        y_src_end = y_src_start + (y_dst_end - y_dst_start)
+
+        roi_dst = dst[y_dst_start:y_dst_end, x_dst_start:x_dst_end]
+        roi_src = self.img[y_src_start:y_src_end, x_src_start:x_src_end]
+
+        if self.blend_mode == BLEND_OPAQUE:
+            roi_dst[...] = roi_src
+        elif self.blend_mode == BLEND_MASKED:
+            np.copyto(roi_dst, roi_src, where=self._mask[y_src_start:y_src_end, x_src_start:x_src_end])
+        else:
+            inv = self._inv_alpha[y_src_start:y_src_end, x_src_start:x_src_end]
+            cv2.multiply(roi_dst, inv, dst=roi_dst, scale=1 / 255)
+            cv2.add(roi_dst, roi_src, dst=roi_dst)
+
     def draw_on(self, other_img: 'Img', x: int, y: int, alpha: float = 1.0):
         if self.img is None or other_img.img is None:
             return
 
-        if len(self.img.shape) == 2:
-            self.img = cv2.cvtColor(self.img, cv2.COLOR_GRAY2BGR)
-        if len(other_img.img.shape) == 2:
-            other_img.img = cv2.cvtColor(other_img.img, cv2.COLOR_GRAY2BGR)
-            
-        if self.img.dtype != np.uint8:
-            self.img = self.img.astype(np.uint8)
-        if other_img.img.dtype != np.uint8:
-            other_img.img = other_img.img.astype(np.uint8)
-            
-        if not self.img.flags['C_CONTIGUOUS']:
-            self.img = np.ascontiguousarray(self.img)
-        if not other_img.img.flags['C_CONTIGUOUS']:
-            other_img.img = np.ascontiguousarray(other_img.img)
+        if alpha >= 1.0:
+            self.blit(other_img.img, x, y)
+            return
 
-        h_src, w_src, _ = self.img.shape
-        h_dst, w_dst, _ = other_img.img.shape
+        h_src, w_src = self.img.shape[:2]
+        h_dst, w_dst = other_img.img.shape[:2]
 
         x_dst_start = max(0, x)
         y_dst_start = max(0, y)
@@ -71,7 +210,13 @@ class Img:
         roi_dst = other_img.img[y_dst_start:y_dst_end, x_dst_start:x_dst_end]
         roi_src = self.img[y_src_start:y_src_end, x_src_start:x_src_end]
 
-        cv2.addWeighted(roi_src, alpha, roi_dst, 1.0 - alpha, 0.0, roi_dst)
+        if self.blend_mode == BLEND_OPAQUE:
+            cv2.addWeighted(roi_src, alpha, roi_dst, 1.0 - alpha, 0.0, roi_dst)
+            return
+
+        coverage = self.alpha[y_src_start:y_src_end, x_src_start:x_src_end, None].astype(np.float32) * (alpha / 255.0)
+        blended = roi_src.astype(np.float32) * alpha + roi_dst.astype(np.float32) * (1.0 - coverage)
+        np.copyto(roi_dst, np.clip(blended + 0.5, 0, 255).astype(np.uint8))
 
     def resize(self, new_width: int, new_height: int):
         if self.img is None:
@@ -83,6 +228,9 @@ class Img:
 
         interpolation = cv2.INTER_AREA if (new_width < current_width or new_height < current_height) else cv2.INTER_LINEAR
         self.img = cv2.resize(self.img, (new_width, new_height), interpolation=interpolation)
+        if self.alpha is not None:
+            self.alpha = cv2.resize(self.alpha, (new_width, new_height), interpolation=interpolation)
+        self._prepare_blit()
 
     def get_width(self) -> int:
         return self.img.shape[1] if self.img is not None else 0
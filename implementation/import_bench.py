@@ -0,0 +1,133 @@
+import argparse
+import functools
+import pathlib
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ("cv2", "numpy", "pygame", "multiprocessing")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass(frozen=True)
+class ImportEntry:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportCost:
+    module: str
+    total_ms: float
+    heavy: Tuple[str, ...]
+    heaviest: Tuple[ImportEntry, ...]
+
+
+def parse_importtime(output: str) -> List[ImportEntry]:
+    """
+    Parses the stderr of `python -X importtime`. Depth 0 entries are imported by the statement
+    itself; nested imports are indented two spaces per level.
+    """
+    entries = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append(ImportEntry(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return entries
+
+
+def measure(module: str, repeat: int = 3, top: int = 5) -> ImportCost:
+    """
+    Imports module in `repeat` fresh interpreters and keeps the fastest run, so the numbers include
+    every dependency the module pulls in.
+    """
+    best: Optional[List[ImportEntry]] = None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                cwd=REPO_ROOT, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+        entries = _skip_startup(parse_importtime(result.stderr))
+        if best is None or _total_us(entries) < _total_us(best):
+            best = entries
+
+    imported = {entry.name.split(".")[0] for entry in best}
+    heaviest = sorted(external_imports(best), key=lambda entry: entry.cumulative_us, reverse=True)[:top]
+    return ImportCost(module=module,
+                      total_ms=_total_us(best) / 1000,
+                      heavy=tuple(name for name in HEAVY_MODULES if name in imported),
+                      heaviest=tuple(heaviest))
+
+
+def external_imports(entries: Sequence[ImportEntry]) -> List[ImportEntry]:
+    """
+    Returns the modules outside the package that package code imports directly, i.e. the outermost
+    non-package entry of every import chain. importtime lists children before their parent, so the
+    entries are walked in reverse to see each parent first.
+    """
+    external = []
+    outside: List[bool] = []
+    for entry in reversed(entries):
+        del outside[entry.depth:]
+        parent_outside = outside[-1] if outside else False
+        is_outside = parent_outside or not entry.name.startswith("implementation")
+        if is_outside and not parent_outside:
+            external.append(entry)
+        outside.append(is_outside)
+    return external
+
+
+@functools.lru_cache(maxsize=None)
+def _startup_modules() -> frozenset:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                            cwd=REPO_ROOT, capture_output=True, text=True)
+    return frozenset(entry.name for entry in parse_importtime(result.stderr) if entry.depth == 0)
+
+
+def _skip_startup(entries: List[ImportEntry]) -> List[ImportEntry]:
+    """Drops what the interpreter imports before running any code (site, encodings, ...)."""
+    startup = _startup_modules()
+    kept: List[ImportEntry] = []
+    for entry in reversed(entries):
+        if entry.depth == 0:
+            skipping = entry.name in startup
+        if not skipping:
+            kept.append(entry)
+    kept.reverse()
+    return kept
+
+
+def _total_us(entries: Sequence[ImportEntry]) -> int:
+    return sum(entry.cumulative_us for entry in entries if entry.depth == 0)
+
+
+def package_modules() -> List[str]:
+    package_dir = REPO_ROOT / "implementation"
+    modules = [".".join(path.relative_to(REPO_ROOT).with_suffix("").parts) for path in package_dir.rglob("*.py")]
+    return sorted(m for m in modules if not m.endswith("__init__") and m != "implementation.import_bench")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report how long each module takes to import in a fresh interpreter.")
+    parser.add_argument("modules", nargs="*", help="modules to measure (default: every module of the package)")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per module; the fastest run is kept")
+    parser.add_argument("--top", type=int, default=3, help="heaviest dependencies listed per module")
+    args = parser.parse_args()
+
+    costs = [measure(module, args.repeat, args.top) for module in (args.modules or package_modules())]
+    width = max(len(cost.module) for cost in costs)
+    print(f"{'module':<{width}}  {'ms':>7}  heavy deps        heaviest imports (ms)")
+    for cost in sorted(costs, key=lambda cost: cost.total_ms, reverse=True):
+        heaviest = ", ".join(f"{e.name} {e.cumulative_us / 1000:.0f}" for e in cost.heaviest)
+        print(f"{cost.module:<{width}}  {cost.total_ms:7.1f}  {','.join(cost.heavy) or '-':<16}  {heaviest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,11 @@ class Moves:
         self.dims = dims
         self.raw_moves: Dict[str, List[Tuple[int, int, str]]] = self._load_moves(moves_txt_path)
 
+    def __deepcopy__(self, memo):
+        # Move rules never change after loading, so every piece of a type shares one instance.
+        memo[id(self)] = self
+        return self
+
     def _load_moves(self, moves_txt_path: pathlib.Path) -> Dict[str, List[Tuple[int, int, str]]]:
         # This method is not used for the logic, so it can remain a placeholder
         # if you don't load moves from a file.
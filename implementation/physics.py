@@ -1,3 +1,5 @@
+import copy
+import math
 from typing import Tuple, Optional
 from .command import Command
 from .board import Board
@@ -22,9 +24,21 @@ class Physics:
         self.cmd = cmd
         self.start_time_ms = cmd.timestamp
 
+    def __deepcopy__(self, memo):
+        """
+        Shares the board with the original; every other field is an immutable value.
+        """
+        clone = copy.copy(self)
+        memo[id(self)] = clone
+        return clone
+
     def update(self, now_ms: int) -> Command:
         return None
 
+    def next_change_ms(self, now_ms: int) -> Optional[int]:
+        """Game time at which the position or state will next change on its own; None if never."""
+        return None
+
     def can_be_captured(self) -> bool:
         """Default: A piece at rest can be captured."""
         return True
@@ -115,6 +129,10 @@ class MovePhysics(Physics):
         )
         return None
 
+    def next_change_ms(self, now_ms: int) -> Optional[int]:
+        """A moving piece changes position on every update."""
+        return now_ms if self.start_time_ms is not None else None
+
     def can_be_captured(self) -> bool:
         """A piece in motion should not be captured mid-move."""
         return False
@@ -176,6 +194,12 @@ class JumpPhysics(Physics):
             )
         return None
 
+    def next_change_ms(self, now_ms: int) -> Optional[int]:
+        """A jumping piece stays in place until the jump ends."""
+        if self.start_time_ms is None:
+            return None
+        return self.start_time_ms + math.ceil(self.duration_s * 1000)
+
     def can_be_captured(self) -> bool:
         """A piece in motion should not be captured mid-move."""
         return False
@@ -1,11 +1,15 @@
 import cv2
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .board import Board
 from .command import Command
 from .state import State
 from .moves import Moves
+from .img import Img
+
+COOLDOWN_TINT = (0, 0, 255)
+COOLDOWN_TINT_STRENGTH = 0.4
 
 class Piece:
     def __init__(self, piece_id: str, init_state: State, color: str, is_jump = False):
@@ -40,23 +44,53 @@ class Piece:
             print(f"[{self.piece_id}] {prev_state_name} -> {new_state_name}")
 
 
-    def draw_on_board(self, board: Board, now_ms: int):
-        piece_img_obj = self._state.get_graphics().get_img()
-        piece_img = piece_img_obj.img
+    def get_draw_pos(self, board: Board) -> Tuple[int, int]:
+        """
+        Returns the top-left pixel of the current sprite on the board, clamped to the board area.
+        """
+        h_piece, w_piece = self._state.get_graphics().get_img().img.shape[:2]
+        board_x_pix, board_y_pix = self._get_board_pix(board)
 
-        pos_x_m, pos_y_m = self._state.get_physics().get_pos()
+        board_width_pix = board.W_cells * board.cell_W_pix
+        board_height_pix = board.H_cells * board.cell_H_pix
+
+        draw_x = max(0, min(board_x_pix, board_width_pix - w_piece))
+        draw_y = max(0, min(board_y_pix, board_height_pix - h_piece))
+        return draw_x, draw_y
 
+    def _get_board_pix(self, board: Board) -> Tuple[int, int]:
+        pos_x_m, pos_y_m = self._state.get_physics().get_pos()
         board_x_pix = round(pos_x_m / board.cell_W_m * board.cell_W_pix)
         board_y_pix = round(pos_y_m / board.cell_H_m * board.cell_H_pix)
+        return board_x_pix, board_y_pix
+
+    def get_draw_img(self, now_ms: int) -> Img:
+        """
+        Returns the current sprite, or its cached cooldown-tinted variant while the piece cannot act.
+        """
+        img = self._state.get_graphics().get_img()
+        if self._state.can_transition(now_ms):
+            return img
+        return img.tinted(COOLDOWN_TINT, COOLDOWN_TINT_STRENGTH)
+
+    def next_visual_change_ms(self, now_ms: int) -> Optional[int]:
+        """
+        Earliest game time at which the piece may look different without a new command, or None.
+        """
+        times = [t for t in (self._state.get_graphics().next_frame_ms(now_ms),
+                             self._state.get_physics().next_change_ms(now_ms)) if t is not None]
+        return min(times) if times else None
+
+    def draw_on_board(self, board: Board, now_ms: int):
+        piece_img_obj = self.get_draw_img(now_ms)
+        h_piece, w_piece = piece_img_obj.img.shape[:2]
 
-        h_piece, w_piece, _ = piece_img.shape
+        board_x_pix, board_y_pix = self._get_board_pix(board)
+        draw_x, draw_y = self.get_draw_pos(board)
 
         board_width_pix = board.W_cells * board.cell_W_pix
         board_height_pix = board.H_cells * board.cell_H_pix
 
-        draw_x = max(0, min(board_x_pix, board_width_pix - w_piece))
-        draw_y = max(0, min(board_y_pix, board_height_pix - h_piece))
-
         if board_x_pix < 0 or board_y_pix < 0 or \
            board_x_pix + w_piece > board_width_pix or \
            board_y_pix + h_piece > board_height_pix:
@@ -64,12 +98,6 @@ class Piece:
 
         piece_img_obj.draw_on(other_img=board.img, x=draw_x, y=draw_y)
 
-        if not self._state.can_transition(now_ms):
-            cooldown_img = piece_img_obj.clone()
-            h, w, _ = cooldown_img.img.shape
-            cv2.rectangle(cooldown_img.img, (0, 0), (w, h), (0, 0, 255), -1)
-            cooldown_img.draw_on(other_img=board.img, x=draw_x, y=draw_y, alpha=0.4)
-
     def get_physics(self):
         return self._state.get_physics()
 
@@ -1,103 +1,104 @@
 import pathlib
-import json
 import copy 
 
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional
 
+from .asset_manifest import build_manifest
 from .board import Board
 from .graphics_factory import GraphicsFactory
 from .moves import Moves
 from .physics_factory import PhysicsFactory
 from .piece import Piece
+from .sprite_atlas import SpriteAtlas
+from .sprite_cache import SpriteCache
 from .state import State
 
 
 class PieceFactory:
-    def __init__(self, board: Board, pieces_root: pathlib.Path):
+    def __init__(self, board: Board, pieces_root: pathlib.Path, atlas: Optional[SpriteAtlas] = None,
+                 load_workers: Optional[int] = None, lazy_sprites: bool = False,
+                 manifest: Optional[dict] = None, sprite_cache: Optional[SpriteCache] = None):
+        """
+        Once the state machines are assembled, sprites are decoded in parallel on load_workers threads
+        (default: chosen by ThreadPoolExecutor from the core count; 1 decodes them one at a time
+        without a pool). With lazy_sprites only the initial state of each piece type is decoded up
+        front; the other states load on first use, or earlier through prefetch_sprites().
+        manifest is the compiled asset manifest (see asset_manifest.py); the transitions file is
+        expected next to pieces_root. Sprites missing from the atlas are read through sprite_cache
+        when one is given.
+        """
         self.board = board
         self.pieces_root = pieces_root
+        self.load_workers = load_workers
+        self.lazy_sprites = lazy_sprites
+        self.manifest = manifest
         self.moves_lib: Dict[str, Moves] = {}
         self.state_machines: Dict[str, State] = {}
-        self.graphics_factory = GraphicsFactory(board=self.board)
+        self.graphics_factory = GraphicsFactory(board=self.board, atlas=atlas, cache=sprite_cache)
         self.physics_factory = PhysicsFactory(board=self.board)
         self._state_machine_config: Dict[str, Dict] = {} 
         self._load_piece_templates()
 
     def _load_piece_templates(self):
         """
-        Loads all piece configurations and state machines from the pieces directory.
+        Loads all piece configurations and state machines from the asset manifest. Without a
+        compiled manifest the pieces directory is walked to build one in memory.
         """
-        for piece_dir in self.pieces_root.iterdir():
-            if not piece_dir.is_dir():
-                continue
-
-            piece_type = piece_dir.name
-            main_cfg_path = piece_dir / "config.json"
-            
-            if not main_cfg_path.exists():
-                print(f"Warning: No config.json found for piece '{piece_type}'. Skipping.")
-                continue
-
-            with open(main_cfg_path, 'r') as f:
-                main_cfg = json.load(f)
-
-            # 1. Load moves based on the main config file
-            moves_file = main_cfg.get("moves")
-            if moves_file:
-                moves_path = piece_dir / moves_file
-                if moves_path.exists():
-                    self.moves_lib[piece_type] = Moves(
-                        moves_txt_path=moves_path,
-                        dims=(self.board.H_cells, self.board.W_cells)
-                    )
-                else:
-                    print(f"Warning: Moves file not found for piece '{piece_type}' at {moves_path}")
-            
-            # 2. Build the state machine for the piece
-            initial_state_name = main_cfg.get("initial_state")
-            state_transitions_path = pathlib.Path(r"C:\Users\user1\Documents\Bootcamp\KFChess\assets\state_transitions.json")
-
-            if not state_transitions_path.exists():
-                print(f"Error: states_transitions.json not found for piece '{piece_type}' at {state_transitions_path}")
-                continue
+        manifest = self.manifest
+        if manifest is None:
+            manifest = build_manifest(self.pieces_root.parent, with_hashes=False)
+        self._load_from_manifest(manifest)
+        if self.lazy_sprites:
+            sprite_dirs = [state.get_graphics().sprites_folder for state in self.state_machines.values()]
+        else:
+            sprite_dirs = self.graphics_factory.sprite_dirs
+        self.graphics_factory.preload(sprite_dirs, self.load_workers)
+
+    def prefetch_sprites(self):
+        """
+        Decodes the sprites of every state not used yet on a background thread.
+        """
+        return self.graphics_factory.prefetch(self.load_workers)
 
-            with open(state_transitions_path, 'r') as f:
-                self._state_machine_config[piece_type] = json.load(f)
+    def _load_from_manifest(self, manifest: dict):
+        assets_root = self.pieces_root.parent
+        transitions = manifest["transitions"]
+        state_names = list(transitions.get("states", {}).keys())
 
-            state_names = list(self._state_machine_config[piece_type].get("states", {}).keys())
-            
-            if initial_state_name and state_names:
-                state_machine = self._build_state_machine(
-                    piece_dir=piece_dir,
-                    piece_type=piece_type,
-                    initial_state_name=initial_state_name,
-                    state_names=state_names
-                )
-                if state_machine:
-                    self.state_machines[piece_type] = state_machine
+        for piece_type, piece in manifest["pieces"].items():
+            self.moves_lib[piece_type] = Moves(
+                moves_txt_path=assets_root / piece["moves"],
+                dims=(self.board.H_cells, self.board.W_cells)
+            )
+            self._state_machine_config[piece_type] = transitions
+            state_machine = self._build_state_machine(
+                piece_type=piece_type,
+                initial_state_name=piece["initial_state"],
+                state_names=state_names,
+                states=piece["states"]
+            )
+            if state_machine:
+                self.state_machines[piece_type] = state_machine
 
     def _build_state_machine(self,
-                             piece_dir: pathlib.Path,
                              piece_type: str,
                              initial_state_name: str,
-                             state_names: List[str]) -> State:
+                             state_names: List[str],
+                             states: Dict[str, dict]) -> State:
         """
-        Builds a state machine for a piece from its directory.
+        Builds a state machine for a piece from its manifest entry.
         """
-        states_dir = piece_dir / "states"
+        assets_root = self.pieces_root.parent
         state_objects: Dict[str, State] = {}
         
         for state_name in state_names:
-            state_cfg_path = states_dir / state_name / "config.json"
-            if not state_cfg_path.exists():
-                raise FileNotFoundError(f"Config file not found for state '{state_name}': {state_cfg_path}")
-            
-            with open(state_cfg_path, 'r') as f:
-                cfg = json.load(f)
+            entry = states[state_name]
+            cfg = entry["config"]
 
             graphics = self.graphics_factory.load(
-                sprites_dir=states_dir / state_name / "sprites",
-                cfg=cfg
+                sprites_dir=assets_root / entry["sprites_dir"],
+                cfg=cfg,
+                files=[assets_root / sprite for sprite in entry["sprites"]]
             )
             physics = self.physics_factory.create(
                 start_cell=(0, 0),
@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+LabelKey = Tuple[str, int, float, int, Tuple[int, int, int], int]
+
+
+class Label:
+    """
+    A rendered text patch ready to be blitted: the text pixels already cut to their mask, plus a keep
+    mask that is zero where the text fully hides the background. Origins are bottom-left, like cv2.putText.
+    """
+    def __init__(self, bgr: np.ndarray, mask: np.ndarray):
+        self.height, self.width = mask.shape[:2]
+        self.fg = np.where(mask[:, :, None] > 0, bgr, 0).astype(np.uint8)
+        # Background only disappears under fully covered pixels; edge pixels get the text added on top.
+        self.keep = np.where(mask[:, :, None] == 255, 0, 255).repeat(3, axis=2).astype(np.uint8)
+
+    def get_rect(self, org_pos: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        return (org_pos[0], org_pos[1] - self.height, self.width, self.height)
+
+    def blit(self, image: np.ndarray, org_pos: Tuple[int, int]):
+        composite(image, self.fg, self.keep, org_pos[0], org_pos[1] - self.height)
+
+
+def composite(image: np.ndarray, fg: np.ndarray, keep: np.ndarray, x: int, y: int):
+    """
+    Draws a premasked text surface with its top-left corner at (x, y), clipped to the image:
+    the background is ANDed with keep (0 under fully covered pixels, 255 elsewhere), then the text
+    pixels are added with saturation.
+    """
+    height, width = fg.shape[:2]
+    x1_target = max(0, x)
+    y1_target = max(0, y)
+    x2_target = min(image.shape[1], x + width)
+    y2_target = min(image.shape[0], y + height)
+    if x1_target >= x2_target or y1_target >= y2_target:
+        return
+
+    x1_source = x1_target - x
+    y1_source = y1_target - y
+    x2_source = x1_source + (x2_target - x1_target)
+    y2_source = y1_source + (y2_target - y1_target)
+
+    roi = image[y1_target:y2_target, x1_target:x2_target]
+    cv2.bitwise_and(roi, keep[y1_source:y2_source, x1_source:x2_source], dst=roi)
+    cv2.add(roi, fg[y1_source:y2_source, x1_source:x2_source], dst=roi)
+
+
+class LabelCache:
+    """
+    LRU cache of rendered text labels shared by the on-screen displays. Text is rasterised at
+    upscale_factor times the requested size, thresholded to a mask and downscaled once; after that,
+    drawing the same string is just a masked blit.
+    """
+    def __init__(self, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError("LabelCache needs room for at least one label.")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._labels: "OrderedDict[LabelKey, Label]" = OrderedDict()
+        self._scratch = np.zeros((0, 0, 3), dtype=np.uint8)
+        self._lock = threading.Lock()
+
+    def get(self, text: str, font_face: int, font_scale: float, thickness: int,
+            color: Tuple[int, int, int], upscale_factor: int = 3) -> Label:
+        key = (text, font_face, font_scale, thickness, tuple(color), upscale_factor)
+        with self._lock:
+            label = self._labels.get(key)
+            if label is not None:
+                self._labels.move_to_end(key)
+                self.hits += 1
+                return label
+
+            self.misses += 1
+            label = self._render(text, font_face, font_scale, thickness, color, upscale_factor)
+            self._labels[key] = label
+            if len(self._labels) > self.max_entries:
+                self._labels.popitem(last=False)
+            return label
+
+    def clear(self):
+        with self._lock:
+            self._labels.clear()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def _render(self, text: str, font_face: int, font_scale: float, thickness: int,
+                color: Tuple[int, int, int], upscale_factor: int) -> Label:
+        temp_font_scale = font_scale * upscale_factor
+        temp_font_thickness = thickness * upscale_factor
+
+        (text_w_large, text_h_large), baseline_large = cv2.getTextSize(text, font_face, temp_font_scale, temp_font_thickness)
+        small_size = (text_w_large // upscale_factor, (text_h_large + baseline_large) // upscale_factor)
+        if small_size[0] == 0 or small_size[1] == 0:
+            return Label(np.zeros((small_size[1], small_size[0], 3), dtype=np.uint8),
+                         np.zeros((small_size[1], small_size[0]), dtype=np.uint8))
+
+        canvas = self._scratch_canvas(text_h_large + baseline_large, text_w_large)
+        cv2.putText(canvas, text, (0, text_h_large),
+                    font_face, temp_font_scale, color, temp_font_thickness, cv2.LINE_AA)
+
+        gray = cv2.cvtColor(canvas, cv2.COLOR_BGR2GRAY)
+        _, mask_large = cv2.threshold(gray, 1, 255, cv2.THRESH_BINARY)
+
+        mask = cv2.resize(mask_large, small_size, interpolation=cv2.INTER_LANCZOS4)
+        bgr = cv2.resize(canvas, small_size, interpolation=cv2.INTER_LANCZOS4)
+        return Label(bgr, mask)
+
+    def _scratch_canvas(self, height: int, width: int) -> np.ndarray:
+        if self._scratch.shape[0] < height or self._scratch.shape[1] < width:
+            self._scratch = np.zeros((max(height, self._scratch.shape[0]), max(width, self._scratch.shape[1]), 3), dtype=np.uint8)
+        canvas = self._scratch[:height, :width]
+        canvas.fill(0)
+        return canvas
+
+
+shared_label_cache = LabelCache()
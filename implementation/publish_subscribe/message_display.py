@@ -1,22 +1,29 @@
 import cv2
 import numpy as np
 import time
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from .event_manager import EventManager, EventType
+from .label_cache import LabelCache, shared_label_cache
 
 class MessageDisplay:
-    def __init__(self, event_manager: EventManager):
+    def __init__(self, event_manager: EventManager, label_cache: Optional[LabelCache] = None,
+                 render_scale: float = 1.0):
+        """
+        render_scale is the internal render resolution relative to the screen; text is scaled with it
+        so it keeps its size relative to the board.
+        """
         self.event_manager = event_manager
         self.current_message: str = ""
         self.message_display_start_time_ms: int = 0
         self.message_duration_ms: int = 3000
 
         self.font = cv2.FONT_HERSHEY_COMPLEX
-        self.font_scale = 1.2
-        self.font_thickness = 3
+        self.font_scale = 1.2 * render_scale
+        self.font_thickness = max(1, round(3 * render_scale))
         self.text_color = (0, 255, 0)
         self.upscale_factor = 3
+        self.label_cache = label_cache if label_cache is not None else shared_label_cache
 
         self.event_manager.subscribe(EventType.GAME_START, self._on_game_start)
         self.event_manager.subscribe(EventType.GAME_END, self._on_game_end)
@@ -41,77 +48,60 @@ class MessageDisplay:
         print(f"GameMessageDisplay: Game ended event received. Displaying: '{self.current_message}'")
 
         
-    def draw(self, display_img: np.ndarray, display_width: int, display_height: int, current_game_time_ms: int):
+    def get_layout(self, display_width: int, display_height: int, current_game_time_ms: int) -> List[Tuple[str, Tuple[int, int]]]:
         if not self.current_message:
-            return
-        
-        if current_game_time_ms - self.message_display_start_time_ms < self.message_duration_ms:
-            text_size = cv2.getTextSize(self.current_message, self.font, self.font_scale, self.font_thickness)
-            text_w, text_h = text_size[0]
-            
-            text_x = (display_width - text_w) // 2
-            text_y = display_height // 2 - text_h // 2
-
-            self.draw_sharp_text(display_img, self.current_message, (text_x, text_y),
-                                 self.font, self.font_scale, self.text_color, self.font_thickness)
-        else:
-            self.current_message = ""
-
-    def draw_sharp_text(self, image: np.ndarray, text: str, org_pos: Tuple[int, int],
-                        font_face, font_scale: float, color: Tuple[int, int],
-                        thickness: int):
-        temp_font_scale = font_scale * self.upscale_factor
-        temp_font_thickness = thickness * self.upscale_factor
-
-        text_size_info_large = cv2.getTextSize(text, font_face, temp_font_scale, temp_font_thickness)
-        text_w_large, text_h_large = text_size_info_large[0]
-        baseline_large = text_size_info_large[1] if len(text_size_info_large) > 1 else 0
-
-        text_canvas_large_bgr = np.zeros((text_h_large + baseline_large, text_w_large, 3), dtype=np.uint8)
-
-        cv2.putText(text_canvas_large_bgr, text, (0, text_h_large),
-                            font_face, temp_font_scale, color, temp_font_thickness, cv2.LINE_AA)
-
-        gray_text_canvas_large = cv2.cvtColor(text_canvas_large_bgr, cv2.COLOR_BGR2GRAY)
-        _, alpha_mask_large = cv2.threshold(gray_text_canvas_large, 1, 255, cv2.THRESH_BINARY)
+            return []
+        if current_game_time_ms - self.message_display_start_time_ms >= self.message_duration_ms:
+            return []
 
-        alpha_mask_small = cv2.resize(alpha_mask_large, (text_w_large // self.upscale_factor, (text_h_large + baseline_large) // self.upscale_factor),
-                                         interpolation=cv2.INTER_LANCZOS4)
+        text_size = cv2.getTextSize(self.current_message, self.font, self.font_scale, self.font_thickness)
+        text_w, text_h = text_size[0]
 
-        text_canvas_bgr_small = cv2.resize(text_canvas_large_bgr, (text_w_large // self.upscale_factor, (text_h_large + baseline_large) // self.upscale_factor),
-                                             interpolation=cv2.INTER_LANCZOS4)
+        text_x = (display_width - text_w) // 2
+        text_y = display_height // 2 - text_h // 2
+        return [(self.current_message, (text_x, text_y))]
 
-        x, y = org_pos
-        text_height = alpha_mask_small.shape[0]
-        text_width = alpha_mask_small.shape[1]
-
-        x1_target = max(0, x)
-        y1_target = max(0, y - text_height)
-        x2_target = min(image.shape[1], x + text_width)
-        y2_target = min(image.shape[0], y)
-
-        x1_source = 0 if x >= 0 else -x
-        y1_source = 0 if y - text_height >= 0 else -(y - text_height)
-        x2_source = text_width if x + text_width <= image.shape[1] else image.shape[1] - x
-        y2_source = text_height if y <= image.shape[0] else image.shape[0] - (y - text_height)
+    def next_change_ms(self, current_game_time_ms: int) -> Optional[int]:
+        """
+        Game time at which the current message disappears, or None if none is showing.
+        """
+        if not self.current_message:
+            return None
+        expires_ms = self.message_display_start_time_ms + self.message_duration_ms
+        return expires_ms if current_game_time_ms < expires_ms else None
+
+    def get_text_rect(self, text: str, org_pos: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """
+        Returns the (x, y, w, h) area that draw_sharp_text covers for this text.
+        """
+        (text_w_large, text_h_large), baseline_large = cv2.getTextSize(
+            text, self.font, self.font_scale * self.upscale_factor, self.font_thickness * self.upscale_factor)
+        width = text_w_large // self.upscale_factor
+        height = (text_h_large + baseline_large) // self.upscale_factor
+        return (org_pos[0], org_pos[1] - height, width, height)
 
-        
-        if x1_target >= x2_target or y1_target >= y2_target or \
-           x1_source >= x2_source or y1_source >= y2_source:
+    def draw(self, display_img: np.ndarray, display_width: int, display_height: int, current_game_time_ms: int):
+        if not self.current_message:
             return
 
-        roi = image[y1_target:y2_target, x1_target:x2_target]
-        text_roi = text_canvas_bgr_small[y1_source:y2_source, x1_source:x2_source]
-        mask_roi = alpha_mask_small[y1_source:y2_source, x1_source:x2_source]
-
-     
-        if roi.shape != text_roi.shape or roi.shape[:2] != mask_roi.shape[:2]:
+        layout = self.get_layout(display_width, display_height, current_game_time_ms)
+        if not layout:
+            self.current_message = ""
             return
 
-        mask_inv = cv2.bitwise_not(mask_roi)
-        img_bg = cv2.bitwise_and(roi, roi, mask=mask_inv)
-        img_fg = cv2.bitwise_and(text_roi, text_roi, mask=mask_roi)
-        final_segment = cv2.add(img_bg, img_fg)
-        image[y1_target:y2_target, x1_target:x2_target] = final_segment
+        self.draw_layout(display_img, layout)
+
+    def draw_layout(self, display_img: np.ndarray, layout: List[Tuple[str, Tuple[int, int]]],
+                    origin: Tuple[int, int] = (0, 0)):
+        """
+        Draws a layout from get_layout. display_img may be a tile of the screen whose top-left pixel is at origin.
+        """
+        for text, (x, y) in layout:
+            self.draw_sharp_text(display_img, text, (x - origin[0], y - origin[1]),
+                                 self.font, self.font_scale, self.text_color, self.font_thickness)
 
-        
\ No newline at end of file
+    def draw_sharp_text(self, image: np.ndarray, text: str, org_pos: Tuple[int, int],
+                        font_face, font_scale: float, color: Tuple[int, int],
+                        thickness: int):
+        label = self.label_cache.get(text, font_face, font_scale, thickness, color, self.upscale_factor)
+        label.blit(image, org_pos)
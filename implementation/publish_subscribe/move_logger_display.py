@@ -1,9 +1,14 @@
+import threading
+
 import cv2
 import numpy as np
-from typing import List, Dict, Tuple, Any
+from dataclasses import dataclass, field, replace
+from typing import List, Dict, Tuple, Any, Optional
 
 from implementation.publish_subscribe.utils import to_chess_notation
 from .event_manager import EventManager, EventType
+from .label_cache import Label, LabelCache, shared_label_cache
+from .text_panel import TextPanel, LayoutEntry
 
 PIECE_SCORES = {
     "Pawn": 1,
@@ -22,8 +27,36 @@ def custom_to_chess_notation(col: int, row: int) -> str:
     }
     return mapping.get((col, row), to_chess_notation(col, row))
 
+@dataclass(frozen=True)
+class MoveLogColumn:
+    header: LayoutEntry
+    lines: Tuple[LayoutEntry, ...]
+
+
+@dataclass(frozen=True)
+class MoveLogLayout:
+    """
+    Where every label of the move-log panel goes: the two score labels, then one column per player.
+    """
+    scores: Tuple[LayoutEntry, ...]
+    columns: Tuple[MoveLogColumn, ...]
+    rects: Tuple[Tuple[int, int, int, int], ...] = field(compare=False, default=())
+
+    def entries(self) -> List[LayoutEntry]:
+        entries = list(self.scores)
+        for column in self.columns:
+            entries.append(column.header)
+            entries.extend(column.lines)
+        return entries
+
+
 class MoveLoggerDisplay:
-    def __init__(self, event_manager: EventManager, font_path: str = None, refresh_callback=None):
+    def __init__(self, event_manager: EventManager, font_path: str = None, refresh_callback=None, label_cache: Optional[LabelCache] = None,
+                 render_scale: float = 1.0):
+        """
+        render_scale is the internal render resolution relative to the screen; text, padding and
+        margins are scaled with it so the log keeps its proportions at lower render widths.
+        """
         self.event_manager = event_manager
         
         self.moves_history: List[Dict[str, Any]] = []
@@ -31,13 +64,22 @@ class MoveLoggerDisplay:
         self.black_score = 0
 
         self.font = cv2.FONT_HERSHEY_COMPLEX
-        self.font_scale = 1.0
-        self.font_thickness = 2
+        self.font_scale = 1.0 * render_scale
+        self.font_thickness = max(1, round(2 * render_scale))
         self.text_color = (255, 255, 255)
         self.highlight_color = (0, 255, 255)
-        self.padding_y = 10
+        self.padding_y = max(1, round(10 * render_scale))
+        self.margin = max(1, round(20 * render_scale))
 
         self.upscale_factor = 3
+        self.label_cache = label_cache if label_cache is not None else shared_label_cache
+        self._white_moves: List[str] = []
+        self._black_moves: List[str] = []
+        self._indexed_moves = 0
+        self._layout_key: Optional[Tuple] = None
+        self._layout: Optional[MoveLogLayout] = None
+        self._panels: List[TextPanel] = []
+        self._panels_lock = threading.Lock()
 
         self.piece_names = {
             "pawn": "Pawn", "knight": "Knight", "bishop": "Bishop",
@@ -102,10 +144,40 @@ class MoveLoggerDisplay:
         else:
             return f"{formatted_piece_name} {from_notation}-{to_notation}"
 
-    def draw(self, display_img: np.ndarray, display_width: int, display_height: int,
-             board_x_offset: int, board_y_offset: int, board_width: int, board_height: int):
-
-        margin = 20
+    def get_layout(self, display_width: int, display_height: int,
+                   board_x_offset: int, board_y_offset: int, board_width: int, board_height: int) -> MoveLogLayout:
+        """
+        Computes every label of the panel as (text, bottom-left origin, color) without drawing anything.
+        The result is reused until the history, the scores or the screen geometry change.
+        """
+        self._index_new_moves()
+        last_color = self.moves_history[-1]["player_color"].lower() if self.moves_history else ""
+        key = (display_width, display_height, board_x_offset, board_y_offset, board_width, board_height,
+               len(self._white_moves), len(self._black_moves), last_color, self.white_score, self.black_score)
+        if key != self._layout_key:
+            self._layout = self._build_layout(display_width, display_height,
+                                              board_x_offset, board_y_offset, board_width, board_height)
+            self._layout_key = key
+        return self._layout
+
+    def _index_new_moves(self):
+        """
+        Splits moves appended to moves_history since the last call into the per-player lists.
+        """
+        if len(self.moves_history) < self._indexed_moves:
+            self._white_moves, self._black_moves, self._indexed_moves = [], [], 0
+        for entry in self.moves_history[self._indexed_moves:]:
+            color = entry["player_color"].lower()
+            if color in ["white", "w"]:
+                self._white_moves.append(entry["move_desc"])
+            elif color in ["black", "b"]:
+                self._black_moves.append(entry["move_desc"])
+        self._indexed_moves = len(self.moves_history)
+
+    def _build_layout(self, display_width: int, display_height: int,
+                      board_x_offset: int, board_y_offset: int, board_width: int, board_height: int) -> MoveLogLayout:
+        scores = []
+        margin = self.margin
         
         text_size_info_temp = cv2.getTextSize("Lg", self.font, self.font_scale, self.font_thickness)
         temp_w, temp_h_for_line = text_size_info_temp[0]
@@ -119,8 +191,7 @@ class MoveLoggerDisplay:
         black_score_y = board_y_offset - margin
         if black_score_y - black_score_h < margin:
             black_score_y = margin + black_score_h
-        self.draw_sharp_text(display_img, black_score_text, (black_score_x, black_score_y),
-                             self.font, self.font_scale, self.text_color, self.font_thickness)
+        scores.append((black_score_text, (black_score_x, black_score_y), self.text_color))
 
         white_score_text = f"White Score: {self.white_score}"
         score_text_info_white = cv2.getTextSize(white_score_text, self.font, self.font_scale, self.font_thickness)
@@ -130,8 +201,7 @@ class MoveLoggerDisplay:
         white_score_y = board_y_offset + board_height + margin + white_score_h
         if white_score_y > display_height - margin:
             white_score_y = display_height - margin
-        self.draw_sharp_text(display_img, white_score_text, (white_score_x, white_score_y),
-                             self.font, self.font_scale, self.text_color, self.font_thickness)
+        scores.append((white_score_text, (white_score_x, white_score_y), self.text_color))
 
         moves_section_start_y = max(margin + line_height * 2, black_score_y + temp_h_for_line + self.padding_y * 2)
 
@@ -140,14 +210,14 @@ class MoveLoggerDisplay:
         if max_rows_per_col < 1:
             max_rows_per_col = 1
 
-        white_moves_list = [entry["move_desc"] for entry in self.moves_history if entry["player_color"].lower() in ["white", "w"]]
-        black_moves_list = [entry["move_desc"] for entry in self.moves_history if entry["player_color"].lower() in ["black", "b"]]
+        white_moves_list = self._white_moves
+        black_moves_list = self._black_moves
 
         white_col_x_start = margin
         current_y_white = moves_section_start_y
 
-        self.draw_sharp_text(display_img, "White Moves:", (white_col_x_start, current_y_white),
-                             self.font, self.font_scale, self.text_color, self.font_thickness)
+        white_header = ("White Moves:", (white_col_x_start, current_y_white), self.text_color)
+        white_lines = []
         current_y_white += line_height
 
         moves_to_show_white = white_moves_list[-max_rows_per_col:]
@@ -155,8 +225,7 @@ class MoveLoggerDisplay:
             text = f"{len(white_moves_list) - len(moves_to_show_white) + i + 1}. {move_desc}"
             text_color = self.highlight_color if (i == len(moves_to_show_white) - 1 and self.moves_history and self.moves_history[-1]["player_color"].lower() in ["white", "w"]) else self.text_color
 
-            self.draw_sharp_text(display_img, text, (white_col_x_start, current_y_white),
-                                 self.font, self.font_scale, text_color, self.font_thickness)
+            white_lines.append((text, (white_col_x_start, current_y_white), text_color))
             current_y_white += line_height
 
         black_col_x_start = display_width - margin
@@ -166,8 +235,8 @@ class MoveLoggerDisplay:
         header_text_info = cv2.getTextSize(header_text, self.font, self.font_scale, self.font_thickness)
         header_w, _ = header_text_info[0]
 
-        self.draw_sharp_text(display_img, header_text, (black_col_x_start - header_w, current_y_black),
-                             self.font, self.font_scale, self.text_color, self.font_thickness)
+        black_header = (header_text, (black_col_x_start - header_w, current_y_black), self.text_color)
+        black_lines = []
         current_y_black += line_height
 
         moves_to_show_black = black_moves_list[-max_rows_per_col:]
@@ -178,65 +247,54 @@ class MoveLoggerDisplay:
             text_size_info_move = cv2.getTextSize(text, self.font, self.font_scale, self.font_thickness)
             text_w, _ = text_size_info_move[0]
             
-            self.draw_sharp_text(display_img, text, (display_width - text_w - margin, current_y_black),
-                                 self.font, self.font_scale, text_color, self.font_thickness)
+            black_lines.append((text, (display_width - text_w - margin, current_y_black), text_color))
             current_y_black += line_height
 
+        layout = MoveLogLayout(
+            scores=tuple(scores),
+            columns=(MoveLogColumn(white_header, tuple(white_lines)),
+                     MoveLogColumn(black_header, tuple(black_lines)))
+        )
+        return replace(layout, rects=tuple(self.get_text_rect(text, org) for text, org, _ in layout.entries()))
+
+    def get_text_rect(self, text: str, org_pos: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """
+        Returns the (x, y, w, h) area that draw_sharp_text covers for this text.
+        """
+        (text_w_large, text_h_large), baseline_large = cv2.getTextSize(
+            text, self.font, self.font_scale * self.upscale_factor, self.font_thickness * self.upscale_factor)
+        width = text_w_large // self.upscale_factor
+        height = (text_h_large + baseline_large) // self.upscale_factor
+        return (org_pos[0], org_pos[1] - height, width, height)
+
+    def draw(self, display_img: np.ndarray, display_width: int, display_height: int,
+             board_x_offset: int, board_y_offset: int, board_width: int, board_height: int):
+        layout = self.get_layout(display_width, display_height,
+                                 board_x_offset, board_y_offset, board_width, board_height)
+        self.draw_layout(display_img, layout)
+
+    def draw_layout(self, display_img: np.ndarray, layout: MoveLogLayout, origin: Tuple[int, int] = (0, 0)):
+        """
+        Draws a layout from get_layout. display_img may be a tile of the screen whose top-left pixel is at origin.
+        """
+        ox, oy = origin
+        for text, (x, y), text_color in layout.scores:
+            self._label(text, text_color).blit(display_img, (x - ox, y - oy))
+
+        with self._panels_lock:
+            while len(self._panels) < len(layout.columns):
+                self._panels.append(TextPanel(self._label))
+        for column, panel in zip(layout.columns, self._panels):
+            text, (x, y), text_color = column.header
+            self._label(text, text_color).blit(display_img, (x - ox, y - oy))
+            panel.sync(column.lines)
+            panel.blit(display_img, origin)
+
+    def _label(self, text: str, color: Tuple[int, int, int]) -> Label:
+        return self.label_cache.get(text, self.font, self.font_scale, self.font_thickness, color, self.upscale_factor)
+
     def draw_sharp_text(self, image: np.ndarray, text: str, org_pos: Tuple[int, int],
                         font_face, font_scale: float, color: Tuple[int, int],
                         thickness: int):
-
-        temp_font_scale = font_scale * self.upscale_factor
-        temp_font_thickness = thickness * self.upscale_factor
-
-        text_size_info_large = cv2.getTextSize(text, font_face, temp_font_scale, temp_font_thickness)
-        text_w_large, text_h_large = text_size_info_large[0]
-        baseline_large = text_size_info_large[1] if len(text_size_info_large) > 1 else 0
-
-        text_canvas_large = np.zeros((text_h_large + baseline_large, text_w_large, 4), dtype=np.uint8)
-
-        cv2.putText(text_canvas_large, text, (0, text_h_large),
-                    font_face, temp_font_scale, color, temp_font_thickness, cv2.LINE_AA)
-
-        alpha_channel = text_canvas_large[:,:,0]
-        _, alpha_mask_large = cv2.threshold(alpha_channel, 1, 255, cv2.THRESH_BINARY)
-
-        alpha_mask_small = cv2.resize(alpha_mask_large, (text_w_large // self.upscale_factor, (text_h_large + baseline_large) // self.upscale_factor),
-                                      interpolation=cv2.INTER_LANCZOS4)
-
-        text_canvas_bgr_small = cv2.resize(text_canvas_large[:,:,:3], (text_w_large // self.upscale_factor, (text_h_large + baseline_large) // self.upscale_factor),
-                                           interpolation=cv2.INTER_LANCZOS4)
-
-        x, y = org_pos
-        text_height = alpha_mask_small.shape[0]
-        text_width = alpha_mask_small.shape[1]
-
-        x1_target = max(0, x)
-        y1_target = max(0, y - text_height)
-        x2_target = min(image.shape[1], x + text_width)
-        y2_target = min(image.shape[0], y)
-
-        x1_source = 0 if x >= 0 else -x
-        y1_source = 0 if y - text_height >= 0 else -(y - text_height)
-        x2_source = text_width if x + text_width <= image.shape[1] else image.shape[1] - x
-        y2_source = text_height if y <= image.shape[0] else image.shape[0] - (y - text_height)
-
-        if x1_target >= x2_target or y1_target >= y2_target or \
-           x1_source >= x2_source or y1_source >= y2_source:
-            return
-
-        roi = image[y1_target:y2_target, x1_target:x2_target]
-        text_roi = text_canvas_bgr_small[y1_source:y2_source, x1_source:x2_source]
-        mask_roi = alpha_mask_small[y1_source:y2_source, x1_source:x2_source]
-
-        if roi.shape != text_roi.shape or roi.shape[:2] != mask_roi.shape[:2]:
-            return
-
-        mask_inv = cv2.bitwise_not(mask_roi)
-
-        img_bg = cv2.bitwise_and(roi, roi, mask=mask_inv)
-        img_fg = cv2.bitwise_and(text_roi, text_roi, mask=mask_roi)
-
-        final_segment = cv2.add(img_bg, img_fg)
-
-        image[y1_target:y2_target, x1_target:x2_target] = final_segment
\ No newline at end of file
+        label = self.label_cache.get(text, font_face, font_scale, thickness, color, self.upscale_factor)
+        label.blit(image, org_pos)
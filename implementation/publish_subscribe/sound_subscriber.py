@@ -1,43 +1,59 @@
 import pathlib
 from typing import Tuple
-import pygame
 
 from .event_manager import EventManager, EventType
 
 
 class SoundSubscriber:
+    """
+    Plays the game sounds. pygame is imported, and its mixer initialised, only when the first sound
+    is played, so games that never emit a sound event (headless runs, simulations, tests) don't pay
+    for audio.
+    """
     def __init__(self, event_manager: EventManager):
-        pygame.mixer.init()
         self.sound_folder = pathlib.Path(__file__).parent.parent.parent / "assets" / "sounds"
-        
+        self.move_sound = None
+        self.capture_sound = None
+        self.jump_sound = None
+        self.illegal_move_sound = None
+        self._sounds_loaded = False
+
+        event_manager.subscribe(EventType.PIECE_MOVED, self.on_piece_moved_sound)
+        event_manager.subscribe(EventType.PIECE_CAPTURED, self.on_piece_captured_sound)
+        event_manager.subscribe(EventType.PIECE_JUMPED, self.on_piece_jumped_sound)
+        event_manager.subscribe(EventType.ILLEGAL_MOVE, self.on_illegal_move)
+
+    def _load_sounds(self):
+        self._sounds_loaded = True
+        import pygame
         try:
+            pygame.mixer.init()
             self.move_sound = pygame.mixer.Sound(str(self.sound_folder / "move.wav"))
             self.capture_sound = pygame.mixer.Sound(str(self.sound_folder / "capture.wav"))
             self.jump_sound = pygame.mixer.Sound(str(self.sound_folder / "jump.wav"))
             self.illegal_move_sound = pygame.mixer.Sound(str(self.sound_folder / "illegal.mp3"))
         except pygame.error as e:
+            print(f"Warning: Sounds disabled: {e}")
             self.move_sound = None
             self.capture_sound = None
             self.jump_sound = None
             self.illegal_move_sound = None
 
-        event_manager.subscribe(EventType.PIECE_MOVED, self.on_piece_moved_sound)
-        event_manager.subscribe(EventType.PIECE_CAPTURED, self.on_piece_captured_sound)
-        event_manager.subscribe(EventType.PIECE_JUMPED, self.on_piece_jumped_sound)
-        event_manager.subscribe(EventType.ILLEGAL_MOVE, self.on_illegal_move)
+    def _play(self, name: str):
+        if not self._sounds_loaded:
+            self._load_sounds()
+        sound = getattr(self, name)
+        if sound:
+            sound.play()
 
     def on_piece_moved_sound(self, piece_color: str, piece_type: str, from_coords: Tuple[int, int], to_coords: Tuple[int, int]):
-        if self.move_sound:
-            self.move_sound.play()
+        self._play("move_sound")
 
     def on_piece_captured_sound(self, piece_color: str, piece_type: str, from_coords: Tuple[int, int], to_coords: Tuple[int, int], captured_piece_type: str, captured_piece_color: str):
-        if self.capture_sound:
-            self.capture_sound.play()
+        self._play("capture_sound")
 
     def on_piece_jumped_sound(self, piece_color: str, piece_type: str, cell_coords: Tuple[int, int]):
-        if self.jump_sound:
-            self.jump_sound.play()
+        self._play("jump_sound")
 
     def on_illegal_move(self):
-        if self.illegal_move_sound:
-            self.illegal_move_sound.play()
\ No newline at end of file
+        self._play("illegal_move_sound")
\ No newline at end of file
@@ -0,0 +1,158 @@
+import threading
+from typing import Callable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .label_cache import Label, composite
+
+LayoutEntry = Tuple[str, Tuple[int, int], Tuple[int, int, int]]
+Rect = Tuple[int, int, int, int]
+
+
+class TextPanel:
+    """
+    Persistent off-screen surface for a column of text lines, kept in the same premasked form as a
+    Label so putting the whole column on screen is a single composite. sync() brings it up to date
+    with the column's current lines: when lines have only scrolled up the surface is shifted in place,
+    and only new or changed lines are stamped.
+    """
+    def __init__(self, label_for: Callable[[str, Tuple[int, int, int]], Label]):
+        self.label_for = label_for
+        self.origin: Tuple[int, int] = (0, 0)
+        self.fg = np.zeros((0, 0, 3), dtype=np.uint8)
+        self.keep = np.zeros((0, 0, 3), dtype=np.uint8)
+        self.rebuilds = 0
+        self._lines: Tuple[LayoutEntry, ...] = ()
+        self._rects: List[Rect] = []
+        self._separate = True
+        self._lock = threading.Lock()
+
+    def sync(self, lines: Tuple[LayoutEntry, ...]):
+        lines = tuple(lines)
+        with self._lock:
+            if lines != self._lines:
+                self._sync(lines)
+
+    def _sync(self, lines: Tuple[LayoutEntry, ...]):
+        labels = [self.label_for(text, color) for text, _, color in lines]
+        rects = [label.get_rect(org) for label, (_, org, _) in zip(labels, lines)]
+        separate = all(upper[1] + upper[3] <= lower[1] for upper, lower in zip(rects, rects[1:]))
+
+        if not (separate and self._separate) or not self._covers(rects):
+            self._rebuild(lines, labels, rects)
+            self._separate = separate
+            return
+
+        old_lines, old_rects = self._scroll_to(lines)
+        changed = [i for i, line in enumerate(lines) if i >= len(old_lines) or old_lines[i] != line]
+        for i in changed:
+            if i < len(old_rects):
+                self._clear(old_rects[i])
+            self._clear(rects[i])
+        for rect in old_rects[len(lines):]:
+            self._clear(rect)
+        for i in changed:
+            self._stamp(labels[i], rects[i])
+
+        self._lines = lines
+        self._rects = rects
+
+    def blit(self, image: np.ndarray, origin: Tuple[int, int] = (0, 0)):
+        """
+        Composites the panel onto image, whose top-left pixel is at origin in screen coordinates.
+        """
+        if not self._rects:
+            return
+        left = min(x for x, _, _, _ in self._rects)
+        top = min(y for _, y, _, _ in self._rects)
+        right = max(x + w for x, _, w, _ in self._rects)
+        bottom = max(y + h for _, y, _, h in self._rects)
+        region = self._region((left, top, right - left, bottom - top))
+        if region is not None:
+            composite(image, self.fg[region], self.keep[region], left - origin[0], top - origin[1])
+
+    def _scroll_to(self, lines: Tuple[LayoutEntry, ...]) -> Tuple[Tuple[LayoutEntry, ...], List[Rect]]:
+        """
+        If the new first line is an older line moved straight up, shifts the surface by that amount and
+        returns the old lines and rects as they now sit; otherwise returns them unchanged.
+        """
+        old_lines, old_rects = self._lines, self._rects
+        if not lines:
+            return old_lines, old_rects
+
+        first_text, (first_x, first_y), first_color = lines[0]
+        start = next((j for j, (text, (x, _), color) in enumerate(old_lines)
+                      if j > 0 and text == first_text and x == first_x and color == first_color), None)
+        if start is None:
+            return old_lines, old_rects
+        shift = old_lines[start][1][1] - first_y
+        if shift <= 0 or shift >= self.fg.shape[0]:
+            return old_lines, old_rects
+
+        self.fg[:-shift] = self.fg[shift:]
+        self.keep[:-shift] = self.keep[shift:]
+        self.fg[-shift:] = 0
+        self.keep[-shift:] = 255
+
+        moved_lines = tuple((text, (x, y - shift), color) for text, (x, y), color in old_lines)
+        moved_rects = [(x, y - shift, w, h) for x, y, w, h in old_rects]
+        for rect in moved_rects[:start]:
+            self._clear(rect)
+        return moved_lines[start:], moved_rects[start:]
+
+    def _covers(self, rects: List[Rect]) -> bool:
+        ox, oy = self.origin
+        height, width = self.fg.shape[:2]
+        return all(ox <= x and oy <= y and x + w <= ox + width and y + h <= oy + height
+                   for x, y, w, h in rects)
+
+    def _rebuild(self, lines: Tuple[LayoutEntry, ...], labels: List[Label], rects: List[Rect]):
+        self.rebuilds += 1
+        if rects:
+            left = min(x for x, _, _, _ in rects)
+            top = min(y for _, y, _, _ in rects)
+            right = max(x + w for x, _, w, _ in rects)
+            bottom = max(y + h for _, y, _, h in rects)
+            # Leave room for the column to grow downwards and for wider lines, so appends rarely rebuild.
+            slack = (right - left) // 4
+            left, right = left - slack, right + slack
+            bottom += max(bottom - top, 8 * max(h for _, _, _, h in rects))
+        else:
+            left = top = right = bottom = 0
+
+        self.origin = (left, top)
+        self.fg = np.zeros((bottom - top, right - left, 3), dtype=np.uint8)
+        self.keep = np.full((bottom - top, right - left, 3), 255, dtype=np.uint8)
+        for label, rect in zip(labels, rects):
+            self._stamp(label, rect)
+
+        self._lines = lines
+        self._rects = rects
+
+    def _region(self, rect: Rect) -> Optional[Tuple[slice, slice]]:
+        x, y, w, h = rect
+        x0 = max(0, x - self.origin[0])
+        y0 = max(0, y - self.origin[1])
+        x1 = min(self.fg.shape[1], x - self.origin[0] + w)
+        y1 = min(self.fg.shape[0], y - self.origin[1] + h)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return slice(y0, y1), slice(x0, x1)
+
+    def _clear(self, rect: Rect):
+        region = self._region(rect)
+        if region is not None:
+            self.fg[region] = 0
+            self.keep[region] = 255
+
+    def _stamp(self, label: Label, rect: Rect):
+        # Drawing a label over the surface composes exactly with drawing both onto the screen in order.
+        region = self._region(rect)
+        if region is None:
+            return
+        fg = self.fg[region]
+        keep = self.keep[region]
+        cv2.bitwise_and(fg, label.keep, dst=fg)
+        cv2.add(fg, label.fg, dst=fg)
+        cv2.bitwise_and(keep, label.keep, dst=keep)
@@ -0,0 +1,258 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .compositor import SpriteCompositor, hits_any
+from .frame_ring import FrameRing
+from .img import Img
+from .static_layer import StaticLayer
+
+Rect = Tuple[int, int, int, int]
+
+
+def rects_intersect(a: Rect, b: Rect) -> bool:
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+def clip_rect(rect: Rect, width: int, height: int) -> Optional[Rect]:
+    x, y, w, h = rect
+    x1, y1 = max(0, x), max(0, y)
+    x2, y2 = min(width, x + w), min(height, y + h)
+    if x1 >= x2 or y1 >= y2:
+        return None
+    return (x1, y1, x2 - x1, y2 - y1)
+
+
+@dataclass(frozen=True)
+class SpriteItem:
+    key: Hashable
+    img: Img
+    x: int
+    y: int
+
+    @property
+    def rects(self) -> Tuple[Rect, ...]:
+        return ((self.x, self.y, self.img.get_width(), self.img.get_height()),)
+
+    def paint(self, frame: Img):
+        self.paint_into(frame.img, (0, 0))
+
+    def paint_into(self, dst: np.ndarray, origin: Tuple[int, int]):
+        self.img.blit(dst, self.x - origin[0], self.y - origin[1])
+
+
+@dataclass(frozen=True)
+class RectItem:
+    key: Hashable
+    x: int
+    y: int
+    width: int
+    height: int
+    color: Tuple[int, int, int]
+    thickness: int
+    clip: Optional[Rect] = None
+
+    @property
+    def rects(self) -> Tuple[Rect, ...]:
+        # cv2.rectangle centres the stroke on the outline and includes the far edge.
+        pad = max(self.thickness, 0)
+        outline = (self.x - pad, self.y - pad, self.width + 2 * pad + 1, self.height + 2 * pad + 1)
+        if self.clip is None:
+            return (outline,)
+        cx, cy, cw, ch = self.clip
+        clipped = clip_rect((outline[0] - cx, outline[1] - cy, outline[2], outline[3]), cw, ch)
+        if clipped is None:
+            return ()
+        return ((clipped[0] + cx, clipped[1] + cy, clipped[2], clipped[3]),)
+
+    def paint(self, frame: Img):
+        if self.clip is None:
+            frame.draw_rectangle(self.x, self.y, self.width, self.height, self.color, self.thickness)
+            return
+        self.paint_into(frame.img, (0, 0))
+
+    def paint_into(self, dst: np.ndarray, origin: Tuple[int, int]):
+        ox, oy = origin
+        cx, cy, cw, ch = self.clip if self.clip is not None else (ox, oy, dst.shape[1], dst.shape[0])
+        # Intersect the clip with the destination, which covers (ox, oy) onwards in frame coordinates.
+        x1, y1 = max(cx, ox), max(cy, oy)
+        x2, y2 = min(cx + cw, ox + dst.shape[1]), min(cy + ch, oy + dst.shape[0])
+        if x1 >= x2 or y1 >= y2:
+            return
+        view = dst[y1 - oy:y2 - oy, x1 - ox:x2 - ox]
+        rx, ry = self.x - x1, self.y - y1
+        cv2.rectangle(view, (rx, ry), (rx + self.width, ry + self.height), self.color, self.thickness)
+
+
+@dataclass(frozen=True)
+class OverlayItem:
+    key: Hashable
+    rects: Tuple[Rect, ...]
+    signature: Any
+    # Called as draw(dst, origin), where dst's top-left pixel is at origin in frame coordinates.
+    draw: Callable[[np.ndarray, Tuple[int, int]], None] = field(compare=False)
+
+    def paint(self, frame: Img):
+        self.paint_into(frame.img, (0, 0))
+
+    def paint_into(self, dst: np.ndarray, origin: Tuple[int, int]):
+        self.draw(dst, origin)
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """
+    Everything needed to draw one frame, captured at a single simulation time.
+    """
+    now_ms: int
+    items: Tuple[Any, ...]
+
+
+class Renderer:
+    """
+    Draws into a ring of preallocated frame buffers, repainting in each buffer only the regions whose
+    items changed since that buffer was last drawn.
+    Sprite items are expected first in the item list; they are composited together as one layer.
+
+    With tile_threads > 1, large repaints are split into horizontal tiles that are restored and
+    painted on a thread pool; every item is painted into each tile it touches, clipped to the tile,
+    so the result is identical to the sequential path.
+    """
+    def __init__(self, static_layer: StaticLayer, ring: Optional[FrameRing] = None,
+                 tile_threads: int = 1, tile_min_pixels: int = 256 * 1024):
+        self.static_layer = static_layer
+        self.ring = ring if ring is not None else FrameRing()
+        self.compositor = SpriteCompositor()
+        self.last_dirty_rects: List[Rect] = []
+        self._items: Dict[Hashable, Any] = {}
+        self.tile_threads = tile_threads
+        self.tile_min_pixels = tile_min_pixels
+        self._pool = ThreadPoolExecutor(max_workers=tile_threads, thread_name_prefix="render-tile") if tile_threads > 1 else None
+
+    def invalidate(self):
+        self.ring.invalidate()
+
+    def close(self):
+        """Stops the tile thread pool, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def render(self, items: List[Any], screen_size: Tuple[int, int]) -> np.ndarray:
+        base = self.static_layer.get(screen_size[0], screen_size[1])
+        current = {item.key: item for item in items}
+
+        changed: List[Rect] = []
+        for key, item in current.items():
+            previous = self._items.get(key)
+            if previous is not item and previous != item:
+                changed.extend(item.rects)
+                if previous is not None:
+                    changed.extend(previous.rects)
+        for key, previous in self._items.items():
+            if key not in current:
+                changed.extend(previous.rects)
+        self._items = current
+        self.ring.add_damage(changed)
+
+        buffer = self.ring.acquire(base.img.shape)
+        frame = buffer.img
+        height, width = frame.img.shape[:2]
+
+        full_repaint = buffer.damage is None or buffer.base is not base
+        if full_repaint:
+            buffer.base = base
+            seed = [r for item in items for r in item.rects]
+        else:
+            seed = buffer.damage
+
+        dirty_rects, to_paint = self._close_over(items, seed, width, height)
+
+        dirty_pixels = width * height if full_repaint else sum(w * h for _, _, w, h in dirty_rects)
+        if self._pool is not None and dirty_pixels >= self.tile_min_pixels:
+            self._paint_tiles(frame.img, base.img, full_repaint, dirty_rects, [items[i] for i in to_paint])
+        else:
+            if full_repaint:
+                np.copyto(frame.img, base.img)
+            else:
+                for x, y, w, h in dirty_rects:
+                    frame.img[y:y + h, x:x + w] = base.img[y:y + h, x:x + w]
+
+            sprites = [items[i] for i in to_paint if isinstance(items[i], SpriteItem)]
+            board = self.static_layer.board
+            bx, by = self.static_layer.board_origin
+            self.compositor.composite(frame.img, sprites,
+                                      (bx, by, board.cell_W_pix, board.cell_H_pix, board.W_cells, board.H_cells))
+            for i in to_paint:
+                if not isinstance(items[i], SpriteItem):
+                    items[i].paint(frame)
+
+        buffer.damage = []
+        self.ring.submit(buffer, None if full_repaint else dirty_rects)
+        self.last_dirty_rects = dirty_rects
+        return frame.img
+
+    def _paint_tiles(self, dst: np.ndarray, base: np.ndarray, full_repaint: bool,
+                     dirty_rects: List[Rect], to_paint: List[Any]):
+        height = dst.shape[0]
+        step = -(-height // self.tile_threads)
+        bounds = [(y0, min(y0 + step, height)) for y0 in range(0, height, step)]
+
+        def paint_tile(y0: int, y1: int):
+            tile = dst[y0:y1]
+            if full_repaint:
+                np.copyto(tile, base[y0:y1])
+            else:
+                for x, y, w, h in dirty_rects:
+                    top, bottom = max(y, y0), min(y + h, y1)
+                    if top < bottom:
+                        tile[top - y0:bottom - y0, x:x + w] = base[top:bottom, x:x + w]
+            for item in to_paint:
+                if any(y < y1 and y0 < y + h for _, y, _, h in item.rects):
+                    item.paint_into(tile, (0, y0))
+
+        for future in [self._pool.submit(paint_tile, y0, y1) for y0, y1 in bounds]:
+            future.result()
+
+    @staticmethod
+    def _close_over(items: List[Any], dirty: List[Rect], width: int, height: int) -> Tuple[List[Rect], List[int]]:
+        """
+        Grows the dirty set until it is closed: any item touching a dirty area is repainted in full,
+        which in turn dirties its own area. Returns the clipped dirty rects and the items to paint in order.
+        """
+        dirty_arr = _clip_array(np.array(dirty, dtype=np.int64).reshape(-1, 4), width, height)
+        if not len(dirty_arr):
+            return [], []
+
+        owners = [i for i, item in enumerate(items) for _ in item.rects]
+        item_rects = np.array([r for item in items for r in item.rects], dtype=np.int64).reshape(-1, 4)
+        owners = np.array(owners, dtype=np.int64)
+
+        painted = np.zeros(len(items), dtype=bool)
+        frontier = dirty_arr
+        while len(frontier) and len(item_rects):
+            hit = hits_any(item_rects, frontier)
+            hit_owners = np.unique(owners[hit])
+            hit_owners = hit_owners[~painted[hit_owners]]
+            if not len(hit_owners):
+                break
+            painted[hit_owners] = True
+            frontier = _clip_array(item_rects[np.isin(owners, hit_owners)], width, height)
+            dirty_arr = np.concatenate([dirty_arr, frontier])
+
+        dirty_arr = np.unique(dirty_arr, axis=0)
+        return [tuple(int(v) for v in r) for r in dirty_arr], np.flatnonzero(painted).tolist()
+
+
+def _clip_array(rects: np.ndarray, width: int, height: int) -> np.ndarray:
+    x1 = np.maximum(rects[:, 0], 0)
+    y1 = np.maximum(rects[:, 1], 0)
+    x2 = np.minimum(rects[:, 0] + rects[:, 2], width)
+    y2 = np.minimum(rects[:, 1] + rects[:, 3], height)
+    keep = (x1 < x2) & (y1 < y2)
+    return np.stack([x1, y1, x2 - x1, y2 - y1], axis=1)[keep]
@@ -0,0 +1,221 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from .img import Img
+from .renderer import OverlayItem, RectItem, SpriteItem, rects_intersect
+
+Rect = Tuple[int, int, int, int]
+
+
+class SceneNode:
+    """
+    A node of the retained scene. Positions are relative to the parent; the world position and the
+    renderer item built from the node are cached until the node, or the transform of an ancestor,
+    changes. Changing a node marks it and its ancestors dirty, so collecting the scene only revisits
+    dirty subtrees and reuses the cached items of everything else.
+    A node with a size clips RectNode children to its area.
+    """
+    def __init__(self, key: Hashable, x: int = 0, y: int = 0, size: Optional[Tuple[int, int]] = None):
+        self.key = key
+        self.x = x
+        self.y = y
+        self.size = size
+        self.visible = True
+        self.parent: Optional["SceneNode"] = None
+        self.children: List["SceneNode"] = []
+        self._by_key: Dict[Hashable, "SceneNode"] = {}
+        self._world: Optional[Tuple[int, int]] = None
+        self._item: Any = None
+        self._dirty = True
+        self._subtree_dirty = True
+        self._items: Tuple[Any, ...] = ()
+
+    def add(self, child: "SceneNode") -> "SceneNode":
+        if child.key in self._by_key:
+            raise ValueError(f"Scene node {self.key!r} already has a child {child.key!r}.")
+        child.parent = self
+        self.children.append(child)
+        self._by_key[child.key] = child
+        child._invalidate_transform()
+        return child
+
+    def remove(self, key: Hashable):
+        child = self._by_key.pop(key, None)
+        if child is None:
+            return
+        self.children.remove(child)
+        child.parent = None
+        self._mark_subtree_dirty()
+
+    def child(self, key: Hashable) -> Optional["SceneNode"]:
+        return self._by_key.get(key)
+
+    def set_position(self, x: int, y: int):
+        if (x, y) != (self.x, self.y):
+            self.x, self.y = x, y
+            self._invalidate_transform()
+
+    def set_size(self, size: Optional[Tuple[int, int]]):
+        if size != self.size:
+            self.size = size
+            self._invalidate_transform()
+
+    def set_visible(self, visible: bool):
+        if visible != self.visible:
+            self.visible = visible
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        self._dirty = True
+        self._mark_subtree_dirty()
+
+    @property
+    def world_position(self) -> Tuple[int, int]:
+        if self._world is None:
+            px, py = self.parent.world_position if self.parent is not None else (0, 0)
+            self._world = (px + self.x, py + self.y)
+        return self._world
+
+    @property
+    def world_rect(self) -> Optional[Rect]:
+        if self.size is None:
+            return None
+        wx, wy = self.world_position
+        return (wx, wy, self.size[0], self.size[1])
+
+    def build_item(self) -> Any:
+        """Returns the renderer item for this node's own content, or None for pure groups."""
+        return None
+
+    def collect(self, viewport: Optional[Rect] = None) -> Tuple[Any, ...]:
+        """
+        Returns the renderer items of this subtree in paint order, skipping invisible nodes and
+        items outside the viewport. Clean subtrees return their cached tuple unchanged.
+        """
+        if not self._subtree_dirty:
+            return self._items
+        if self._dirty:
+            self._item = self.build_item() if self.visible else None
+            self._dirty = False
+
+        items: List[Any] = []
+        if self.visible:
+            item = self._item
+            if item is not None and (viewport is None or any(rects_intersect(r, viewport) for r in item.rects)):
+                items.append(item)
+            for child in self.children:
+                items.extend(child.collect(viewport))
+        self._items = tuple(items)
+        self._subtree_dirty = False
+        return self._items
+
+    def _mark_subtree_dirty(self):
+        node = self
+        while node is not None and not node._subtree_dirty:
+            node._subtree_dirty = True
+            node = node.parent
+
+    def _invalidate_transform(self):
+        self._world = None
+        self.mark_dirty()
+        for child in self.children:
+            child._invalidate_transform()
+
+
+class SpriteNode(SceneNode):
+    def __init__(self, key: Hashable, img: Optional[Img] = None, x: int = 0, y: int = 0):
+        super().__init__(key, x, y)
+        self.img = img
+
+    def set(self, img: Img, x: int, y: int):
+        if img is not self.img:
+            self.img = img
+            self.mark_dirty()
+        self.set_position(x, y)
+
+    def build_item(self) -> Optional[SpriteItem]:
+        if self.img is None:
+            return None
+        wx, wy = self.world_position
+        return SpriteItem(key=self.key, img=self.img, x=wx, y=wy)
+
+
+class RectNode(SceneNode):
+    """
+    Rectangle outline, clipped to the parent's area when the parent has a size.
+    """
+    def __init__(self, key: Hashable, width: int, height: int, color: Tuple[int, int, int], thickness: int,
+                 x: int = 0, y: int = 0):
+        super().__init__(key, x, y)
+        self.width = width
+        self.height = height
+        self.color = color
+        self.thickness = thickness
+
+    def set_style(self, width: int, height: int, color: Tuple[int, int, int], thickness: int):
+        if (width, height, color, thickness) != (self.width, self.height, self.color, self.thickness):
+            self.width, self.height, self.color, self.thickness = width, height, color, thickness
+            self.mark_dirty()
+
+    def build_item(self) -> RectItem:
+        wx, wy = self.world_position
+        clip = self.parent.world_rect if self.parent is not None else None
+        return RectItem(key=self.key, x=wx, y=wy, width=self.width, height=self.height,
+                        color=self.color, thickness=self.thickness, clip=clip)
+
+
+class OverlayNode(SceneNode):
+    """
+    Content drawn by a callback, e.g. text. The content is described by a signature; its screen
+    area is computed by rects_for(signature) only when the signature changes, and the overlay is
+    drawn as draw(dst, origin, signature) with origin relative to this node.
+    """
+    def __init__(self, key: Hashable,
+                 rects_for: Callable[[Any], Tuple[Rect, ...]],
+                 draw: Callable[[np.ndarray, Tuple[int, int], Any], None],
+                 x: int = 0, y: int = 0):
+        super().__init__(key, x, y)
+        self.rects_for = rects_for
+        self.draw = draw
+        self.signature: Any = None
+        self._rects: Tuple[Rect, ...] = ()
+
+    def set_signature(self, signature: Any):
+        if signature != self.signature:
+            self.signature = signature
+            self._rects = tuple(self.rects_for(signature))
+            self.mark_dirty()
+
+    def build_item(self) -> OverlayItem:
+        wx, wy = self.world_position
+        signature = self.signature
+        return OverlayItem(
+            key=self.key,
+            rects=tuple((x + wx, y + wy, w, h) for x, y, w, h in self._rects),
+            signature=signature,
+            draw=lambda dst, origin: self.draw(dst, (origin[0] - wx, origin[1] - wy), signature)
+        )
+
+
+class Scene:
+    """
+    Root of the retained scene: an ordered list of layers, painted back to front.
+    """
+    def __init__(self):
+        self.root = SceneNode("root")
+        self.viewport: Optional[Rect] = None
+
+    def layer(self, name: Hashable) -> SceneNode:
+        layer = self.root.child(name)
+        if layer is None:
+            layer = self.root.add(SceneNode(name))
+        return layer
+
+    def set_viewport(self, viewport: Optional[Rect]):
+        if viewport != self.viewport:
+            self.viewport = viewport
+            self.root._invalidate_transform()
+
+    def items(self) -> Tuple[Any, ...]:
+        return self.root.collect(self.viewport)
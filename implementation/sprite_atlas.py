@@ -0,0 +1,184 @@
+import argparse
+import json
+import pathlib
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .img import Img
+
+ATLAS_MAGIC = b"KFATLAS2"
+_HEADER = struct.Struct("<8sQ")
+_ALIGN = 64
+
+
+def atlas_path_for(root_folder: pathlib.Path, cell_size: Tuple[int, int]) -> pathlib.Path:
+    """
+    Default location of the atlas built for one cell size.
+    """
+    return pathlib.Path(root_folder) / "sprite_atlas" / f"sprites_{cell_size[0]}x{cell_size[1]}.atlas"
+
+
+def build_atlas(pieces_root: pathlib.Path, cell_size: Tuple[int, int], atlas_path: pathlib.Path) -> int:
+    """
+    Packs every sprite under pieces_root/<piece>/states/<state>/sprites, resized to cell_size exactly
+    as Graphics would load it, into one file: a header, a JSON index and the raw arrays. The index
+    records the size and mtime of every source PNG and the mtime of each folder, so stale folders
+    can be detected. Returns the number of sprites written.
+    """
+    pieces_root = pathlib.Path(pieces_root)
+    index: Dict[str, List[dict]] = {}
+    folder_mtimes: Dict[str, int] = {}
+    chunks: List[bytes] = []
+    offset = 0
+
+    def add_array(array: Optional[np.ndarray]) -> Optional[list]:
+        nonlocal offset
+        if array is None:
+            return None
+        array = np.ascontiguousarray(array)
+        entry = [offset, list(array.shape), array.dtype.str]
+        data = array.tobytes()
+        padding = -len(data) % _ALIGN
+        chunks.append(data + b"\0" * padding)
+        offset += len(data) + padding
+        return entry
+
+    count = 0
+    for sprites_dir in sorted(pieces_root.glob("*/states/*/sprites")):
+        frames = []
+        for file in sorted(sprites_dir.glob("*.png")):
+            img = Img().read(file, target_size=cell_size)
+            stat = file.stat()
+            frames.append({
+                "name": file.name,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "blend_mode": img.blend_mode,
+                "img": add_array(img.img),
+                "alpha": add_array(img.alpha),
+                "mask": add_array(img.mask),
+                "inv_alpha": add_array(img.inv_alpha),
+            })
+            count += 1
+        key = sprites_dir.relative_to(pieces_root).as_posix()
+        index[key] = frames
+        folder_mtimes[key] = sprites_dir.stat().st_mtime_ns
+
+    index_bytes = json.dumps({"cell_size": list(cell_size), "folders": index,
+                              "folder_mtimes": folder_mtimes}).encode("utf-8")
+    data_offset = _HEADER.size + len(index_bytes)
+    data_offset += -data_offset % _ALIGN
+
+    atlas_path = pathlib.Path(atlas_path)
+    atlas_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(atlas_path, "wb") as f:
+        f.write(_HEADER.pack(ATLAS_MAGIC, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(b"\0" * (data_offset - _HEADER.size - len(index_bytes)))
+        for chunk in chunks:
+            f.write(chunk)
+    return count
+
+
+class SpriteAtlas:
+    """
+    Sprites packed by build_atlas, memory-mapped read-only. Frames are Img objects whose arrays are
+    views into the mapping, so loading copies and decodes nothing and processes share the pages.
+    """
+    def __init__(self, path: pathlib.Path, pieces_root: pathlib.Path):
+        self.path = pathlib.Path(path)
+        self.pieces_root = pathlib.Path(pieces_root)
+        with open(self.path, "rb") as f:
+            magic, index_length = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != ATLAS_MAGIC:
+                raise ValueError(f"{self.path} is not a sprite atlas.")
+            index = json.loads(f.read(index_length).decode("utf-8"))
+
+        data_offset = _HEADER.size + index_length
+        data_offset += -data_offset % _ALIGN
+        self.cell_size: Tuple[int, int] = tuple(index["cell_size"])
+        self._folders: Dict[str, List[dict]] = index["folders"]
+        self._folder_mtimes: Dict[str, int] = index["folder_mtimes"]
+        self._data = np.memmap(self.path, dtype=np.uint8, mode="r", offset=data_offset)
+
+    def __len__(self) -> int:
+        return sum(len(frames) for frames in self._folders.values())
+
+    def frames(self, sprites_folder: pathlib.Path) -> Optional[List[Img]]:
+        """
+        Returns the frames of a sprites folder in file-name order, or None if it was not packed or
+        its PNGs were edited, added or removed since the atlas was built.
+        """
+        try:
+            key = pathlib.Path(sprites_folder).relative_to(self.pieces_root).as_posix()
+        except ValueError:
+            return None
+        entries = self._folders.get(key)
+        if entries is None:
+            return None
+        if not self._is_current(pathlib.Path(sprites_folder), key, entries):
+            print(f"Warning: Sprite atlas {self.path} is out of date for {key}; reading its PNGs instead.")
+            return None
+        return [Img.from_prepared(self._view(e["img"]), self._view(e["alpha"]), e["blend_mode"],
+                                  self._view(e["mask"]), self._view(e["inv_alpha"]))
+                for e in entries]
+
+    def _is_current(self, folder: pathlib.Path, key: str, entries: List[dict]) -> bool:
+        try:
+            if folder.stat().st_mtime_ns != self._folder_mtimes.get(key):
+                return False
+            for e in entries:
+                stat = (folder / e["name"]).stat()
+                if stat.st_size != e["size"] or stat.st_mtime_ns != e["mtime_ns"]:
+                    return False
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _view(self, entry: Optional[list]) -> Optional[np.ndarray]:
+        if entry is None:
+            return None
+        offset, shape, dtype = entry
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+        return self._data[offset:offset + size].view(dtype).reshape(shape)
+
+
+def load_atlas(pieces_root: pathlib.Path, cell_size: Tuple[int, int],
+               atlas_path: Optional[pathlib.Path] = None) -> Optional[SpriteAtlas]:
+    """
+    Maps the atlas for cell_size if one has been built, otherwise returns None so sprites are read
+    from the PNG files as before.
+    """
+    pieces_root = pathlib.Path(pieces_root)
+    atlas_path = atlas_path if atlas_path is not None else atlas_path_for(pieces_root.parent, cell_size)
+    if not atlas_path.exists():
+        return None
+    try:
+        atlas = SpriteAtlas(atlas_path, pieces_root)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load sprite atlas {atlas_path}: {e}")
+        return None
+    if atlas.cell_size != tuple(cell_size):
+        print(f"Warning: Sprite atlas {atlas_path} is for {atlas.cell_size} cells, not {tuple(cell_size)}; ignoring it.")
+        return None
+    return atlas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack all piece sprites, resized for one cell size, into a sprite atlas.")
+    parser.add_argument("--assets", type=pathlib.Path, default=pathlib.Path(__file__).resolve().parent.parent / "assets")
+    parser.add_argument("--cell-size", type=int, nargs=2, default=(85, 85), metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--output", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+
+    cell_size = tuple(args.cell_size)
+    output = args.output if args.output is not None else atlas_path_for(args.assets, cell_size)
+    count = build_atlas(args.assets / "pieces_resources", cell_size, output)
+    print(f"Wrote {count} sprites to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import hashlib
+import os
+import pathlib
+import tempfile
+import threading
+from typing import Tuple
+
+import numpy as np
+
+from .img import Img
+
+
+def sprite_cache_dir_for(root_folder: pathlib.Path) -> pathlib.Path:
+    """
+    Default location of the resized-sprite cache for an assets folder.
+    """
+    return pathlib.Path(root_folder) / "sprite_cache"
+
+
+class SpriteCache:
+    """
+    Disk cache of sprites already decoded and resized for one cell size. Each entry is a .npy file
+    holding the premultiplied BGR pixels, plus the alpha as a fourth channel when the sprite has one,
+    so a hit is a single np.load. Entries are keyed by the source path, its size and mtime and the
+    target size; storing a new entry deletes older entries of the same source and target size, so
+    editing a PNG replaces its entry instead of adding one. Entries are written atomically, so
+    several game processes can share the cache.
+    """
+    def __init__(self, cache_dir: pathlib.Path):
+        self.cache_dir = pathlib.Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def entry_prefix(self, file: pathlib.Path, target_size: Tuple[int, int]) -> str:
+        """
+        File-name prefix shared by every entry of one source file at one target size. Sprites in
+        different folders share stems (1.png, 2.png, ...), so the prefix includes a hash of the path.
+        """
+        file = pathlib.Path(file).resolve()
+        path_digest = hashlib.sha1(str(file).encode("utf-8")).hexdigest()[:10]
+        return f"{file.stem}_{path_digest}_{target_size[0]}x{target_size[1]}_"
+
+    def entry_path(self, file: pathlib.Path, target_size: Tuple[int, int]) -> pathlib.Path:
+        file = pathlib.Path(file).resolve()
+        stat = file.stat()
+        key = f"{file}|{stat.st_size}|{stat.st_mtime_ns}|{target_size[0]}x{target_size[1]}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return self.cache_dir / f"{self.entry_prefix(file, target_size)}{digest}.npy"
+
+    def read(self, file: pathlib.Path, target_size: Tuple[int, int]) -> Img:
+        """
+        Returns the sprite resized to target_size, from the cache if possible; otherwise decodes it
+        and stores the result for the next launch.
+        """
+        path = self.entry_path(file, target_size)
+        try:
+            pixels = np.load(path, allow_pickle=False)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable sprite cache entry {path}: {e}")
+        else:
+            if pixels.ndim == 3 and pixels.shape[2] in (3, 4) and pixels.dtype == np.uint8 \
+                    and pixels.shape[1::-1] == tuple(target_size):
+                self._count(hit=True)
+                if pixels.shape[2] == 4:
+                    return Img.from_pixels(np.ascontiguousarray(pixels[:, :, :3]), np.ascontiguousarray(pixels[:, :, 3]))
+                return Img.from_pixels(pixels)
+            print(f"Warning: Ignoring unreadable sprite cache entry {path}: unexpected array {pixels.dtype} {pixels.shape}")
+
+        self._count(hit=False)
+        img = Img().read(pathlib.Path(file), target_size=target_size)
+        self._store(path, img)
+        self._prune(path, self.entry_prefix(file, target_size))
+        return img
+
+    def _prune(self, keep: pathlib.Path, prefix: str):
+        """Deletes older entries of the same source and target size."""
+        for old in self.cache_dir.glob(f"{prefix}*.npy"):
+            if old != keep:
+                try:
+                    old.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"Warning: Could not remove stale sprite cache entry {old}: {e}")
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _store(self, path: pathlib.Path, img: Img):
+        pixels = img.img if img.alpha is None else np.dstack([img.img, img.alpha])
+        tmp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                tmp_name = f.name
+                np.save(f, pixels, allow_pickle=False)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            print(f"Warning: Could not write sprite cache entry {path}: {e}")
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.remove(tmp_name)
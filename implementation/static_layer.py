@@ -0,0 +1,41 @@
+from typing import Optional, Tuple
+
+from .board import Board
+from .img import Img
+
+
+class StaticLayer:
+    """
+    Background with the board already blended in at its centred offset.
+    Built once per screen size and used as the starting point of every frame.
+    """
+    def __init__(self, background_img: Img, board: Board):
+        self.background_img = background_img
+        self.board = board
+        self.img: Optional[Img] = None
+        self.size: Optional[Tuple[int, int]] = None
+        self.board_origin: Tuple[int, int] = (0, 0)
+
+    def get(self, screen_width: int, screen_height: int) -> Img:
+        if screen_width <= 0 or screen_height <= 0:
+            screen_width = self.background_img.get_width()
+            screen_height = self.background_img.get_height()
+
+        if self.img is None or self.size != (screen_width, screen_height):
+            self._build(screen_width, screen_height)
+        return self.img
+
+    def invalidate(self):
+        self.img = None
+
+    def _build(self, screen_width: int, screen_height: int):
+        layer = self.background_img.copy()
+        layer.resize(screen_width, screen_height)
+
+        board_x = (screen_width - self.board.img.get_width()) // 2
+        board_y = (screen_height - self.board.img.get_height()) // 2
+        self.board.img.draw_on(layer, board_x, board_y)
+
+        self.img = layer
+        self.size = (screen_width, screen_height)
+        self.board_origin = (board_x, board_y)
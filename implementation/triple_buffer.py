@@ -0,0 +1,35 @@
+import threading
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TripleBuffer(Generic[T]):
+    """
+    Lock-light handoff of the latest value from one producer thread to one consumer thread.
+    The producer always has a back slot to fill and the consumer always keeps a front slot to read,
+    so neither ever waits for the other; values the consumer never picked up are simply overwritten.
+    """
+    def __init__(self):
+        self._back: Optional[T] = None
+        self._middle: Optional[T] = None
+        self._front: Optional[T] = None
+        self._fresh = False
+        self._lock = threading.Lock()
+
+    def publish(self, value: T):
+        self._back = value
+        with self._lock:
+            self._back, self._middle = self._middle, self._back
+            self._fresh = True
+
+    def latest(self) -> Optional[T]:
+        with self._lock:
+            if self._fresh:
+                self._front, self._middle = self._middle, self._front
+                self._fresh = False
+        return self._front
+
+    def has_fresh(self) -> bool:
+        with self._lock:
+            return self._fresh
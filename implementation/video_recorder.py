@@ -0,0 +1,159 @@
+import multiprocessing
+import pathlib
+import queue
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+def _encode_frames(path: str, fourcc: str, fps: float, shape: Tuple[int, int, int], shm_name: str,
+                   slots: int, jobs, done):
+    """
+    Encoder process: writes each queued slot at its frame index, repeating the previous frame over
+    any indices that were dropped so the video keeps real-time pace. A job without a slot repeats
+    the last frame up to its index, so an idle stretch before closing is kept too.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frames = np.ndarray((slots,) + shape, dtype=np.uint8, buffer=shm.buf)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), fps, (shape[1], shape[0]))
+    if not writer.isOpened():
+        print(f"Warning: VideoRecorder could not open {path} for writing.")
+
+    last: Optional[np.ndarray] = None
+    next_index = 0
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        slot, index = job
+        if slot is None:
+            while writer.isOpened() and last is not None and next_index < index:
+                writer.write(last)
+                next_index += 1
+            continue
+        if writer.isOpened():
+            while last is not None and next_index < index:
+                writer.write(last)
+                next_index += 1
+            last = frames[slot].copy()
+            writer.write(last)
+            next_index = index + 1
+        done.put(slot)
+
+    writer.release()
+    del frames
+    shm.close()
+
+
+class VideoRecorder:
+    """
+    Records presented frames to a video file without blocking the game loop. Frames are copied into a
+    small pool of shared-memory slots and encoded by a separate process. Frames that arrive faster
+    than the video fps are skipped up front, and when every slot is still waiting for the encoder the
+    frame is dropped rather than waited for.
+    """
+    def __init__(self, path: pathlib.Path, fps: float = 30.0, fourcc: str = "mp4v", slots: int = 4):
+        if fps <= 0:
+            raise ValueError("VideoRecorder fps must be positive.")
+        if slots < 1:
+            raise ValueError("VideoRecorder needs at least one frame slot.")
+        self.path = pathlib.Path(path)
+        self.fps = fps
+        self.fourcc = fourcc
+        self.slots = slots
+
+        self.frames_offered = 0
+        self.frames_queued = 0
+        self.frames_decimated = 0
+        self.frames_dropped = 0
+
+        self._shape: Optional[Tuple[int, int, int]] = None
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._frames: Optional[np.ndarray] = None
+        self._process = None
+        self._jobs = None
+        self._done = None
+        self._idle_slots = []
+        self._start_ms: Optional[int] = None
+        self._next_index = 0
+
+    def offer(self, frame: np.ndarray, now_ms: int) -> bool:
+        """
+        Hands a frame to the encoder if it is due and a slot is free. Never blocks; returns whether
+        the frame was queued.
+        """
+        self.frames_offered += 1
+        if self._process is None:
+            self._start(frame.shape, now_ms)
+        elif frame.shape != self._shape:
+            print(f"Warning: VideoRecorder dropping frame of shape {frame.shape}, recording is {self._shape}.")
+            self.frames_dropped += 1
+            return False
+
+        index = round((now_ms - self._start_ms) * self.fps / 1000)
+        if index < self._next_index:
+            self.frames_decimated += 1
+            return False
+
+        self._collect_done_slots()
+        if not self._idle_slots:
+            self.frames_dropped += 1
+            return False
+        slot = self._idle_slots.pop()
+
+        np.copyto(self._frames[slot], frame)
+        self._jobs.put((slot, index))
+        self._next_index = index + 1
+        self.frames_queued += 1
+        return True
+
+    def _collect_done_slots(self):
+        while True:
+            try:
+                self._idle_slots.append(self._done.get_nowait())
+            except queue.Empty:
+                return
+
+    def close(self, now_ms: Optional[int] = None, timeout_s: float = 10.0):
+        """
+        Waits for queued frames to be encoded, then finishes the file and frees the shared memory.
+        With now_ms the last frame is repeated up to that time, so the video ends when the game did.
+        """
+        if self._process is None:
+            return
+        if now_ms is not None:
+            self._jobs.put((None, round((now_ms - self._start_ms) * self.fps / 1000)))
+        self._jobs.put(None)
+        self._process.join(timeout_s)
+        if self._process.is_alive():
+            print("Warning: VideoRecorder encoder did not finish in time; terminating it.")
+            self._process.terminate()
+            self._process.join()
+
+        self._frames = None
+        self._shm.close()
+        self._shm.unlink()
+        self._process = None
+
+    def _start(self, shape: Tuple[int, ...], now_ms: int):
+        self._shape = tuple(shape)
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slots * int(np.prod(shape)))
+        self._frames = np.ndarray((self.slots,) + self._shape, dtype=np.uint8, buffer=self._shm.buf)
+
+        context = multiprocessing.get_context("spawn")
+        self._jobs = context.Queue()
+        self._done = context.Queue()
+        self._idle_slots = list(range(self.slots))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._process = context.Process(
+            target=_encode_frames,
+            args=(str(self.path), self.fourcc, self.fps, self._shape, self._shm.name,
+                  self.slots, self._jobs, self._done),
+            daemon=True
+        )
+        self._process.start()
+        self._start_ms = now_ms
+        self._next_index = 0
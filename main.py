@@ -1,13 +1,15 @@
 import pathlib
-import pygame
 from implementation.game_builder import GameBuilder
 from implementation.game import Game
+from implementation.display_sink import PygameSink, WindowSink
 from implementation.publish_subscribe.event_manager import EventType
 from implementation.publish_subscribe.move_logger_display import MoveLoggerDisplay
 from implementation.publish_subscribe.sound_subscriber import SoundSubscriber
 
 def main():
-    pygame.init()
+    # Only the display is needed to read the screen size; the mixer starts with the first sound.
+    import pygame
+    pygame.display.init()
     infoObject = pygame.display.Info()
     FULL_SCREEN_WIDTH = infoObject.current_w
     FULL_SCREEN_HEIGHT = infoObject.current_h
@@ -19,6 +21,15 @@ def main():
     BOARD_HEIGHT = 8
     CELL_WIDTH_PIX = 85
     CELL_HEIGHT_PIX = 85
+    # Frames are composed at most this wide and upscaled to the screen once per frame.
+    RENDER_WIDTH = min(FULL_SCREEN_WIDTH, 1920)
+    # Threads compositing large repaints (e.g. after a resize) as parallel tiles; 1 paints sequentially.
+    TILE_THREADS = 4
+    # Present through a pygame window (dirty-rect updates, pygame event queue) instead of cv2.imshow.
+    USE_PYGAME_DISPLAY = False
+    # Set to a file path (e.g. pathlib.Path("recordings") / "game.mp4") to record the game to video.
+    RECORDING_FILE = None
+    RECORDING_FPS = 30
 
     try:
         game_builder = GameBuilder(
@@ -31,8 +42,16 @@ def main():
             background_image_file=BACKGROUND_IMAGE_FILE,
             screen_width=FULL_SCREEN_WIDTH, 
             screen_height=FULL_SCREEN_HEIGHT,
+            render_width=RENDER_WIDTH,
+            tile_threads=TILE_THREADS,
         )
-        game: Game = game_builder.build_game(board_file=BOARD_LAYOUT_FILE)
+        display_sink = PygameSink() if USE_PYGAME_DISPLAY else WindowSink()
+        recorder = None
+        if RECORDING_FILE is not None:
+            # Imported only when recording: it pulls in multiprocessing.
+            from implementation.video_recorder import VideoRecorder
+            recorder = VideoRecorder(RECORDING_FILE, fps=RECORDING_FPS)
+        game: Game = game_builder.build_game(board_file=BOARD_LAYOUT_FILE, display_sink=display_sink, recorder=recorder)
 
         game.run()
 
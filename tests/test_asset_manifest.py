@@ -0,0 +1,123 @@
+import json
+import os
+import pathlib
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from implementation.asset_manifest import (build_manifest, load_manifest, main, manifest_path_for, stale_files,
+                                           validate_manifest, write_manifest)
+from implementation.board import Board
+from implementation.img import Img
+from implementation.piece_factory import PieceFactory
+
+ASSETS = pathlib.Path(__file__).parent.parent / "assets"
+
+
+@pytest.fixture
+def assets(tmp_path):
+    root = tmp_path / "assets"
+    root.mkdir()
+    shutil.copy(ASSETS / "state_transitions.json", root / "state_transitions.json")
+    for piece in ("KW", "PB"):
+        shutil.copytree(ASSETS / "pieces_resources" / piece, root / "pieces_resources" / piece)
+    return root
+
+
+def make_board():
+    return Board(cell_H_pix=10, cell_W_pix=10, cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+
+
+def test_manifest_paths_are_relative_to_assets_root(assets):
+    manifest = build_manifest(assets)
+    assert sorted(manifest["pieces"]) == ["KW", "PB"]
+    idle = manifest["pieces"]["KW"]["states"]["idle"]
+    assert idle["sprites_dir"] == "pieces_resources/KW/states/idle/sprites"
+    assert all(not pathlib.PurePosixPath(p).is_absolute() for p in idle["sprites"])
+    assert "state_transitions.json" in manifest["files"]
+    assert manifest["files"]["pieces_resources/KW/moves.txt"]["sha256"]
+    assert validate_manifest(manifest) == []
+
+
+def test_invalid_assets_are_reported(assets):
+    shutil.rmtree(assets / "pieces_resources" / "PB" / "states" / "jump" / "sprites")
+    with pytest.raises(ValueError, match="'PB' has no sprites for state 'jump'"):
+        build_manifest(assets)
+
+
+def test_write_manifest_skips_unchanged_work(assets):
+    assert write_manifest(assets)
+    with patch("implementation.asset_manifest.hashlib.sha256", side_effect=AssertionError("rehashed")):
+        assert not write_manifest(assets)
+
+
+def test_stale_files_detects_edits(assets):
+    write_manifest(assets)
+    manifest = load_manifest(assets)
+    assert stale_files(assets, manifest) == []
+
+    moves = assets / "pieces_resources" / "KW" / "moves.txt"
+    moves.write_text(moves.read_text() + "\n0,0\n")
+    os.utime(moves, ns=(0, 0))
+    assert stale_files(assets, manifest) == ["pieces_resources/KW/moves.txt"]
+
+
+def test_piece_factory_reads_only_the_manifest(assets):
+    write_manifest(assets)
+    manifest = load_manifest(assets)
+    with patch("implementation.asset_manifest.open", side_effect=AssertionError("config opened"), create=True), \
+            patch.object(pathlib.Path, "glob", side_effect=AssertionError("folder globbed")):
+        factory = PieceFactory(make_board(), assets / "pieces_resources", lazy_sprites=True, manifest=manifest)
+    assert sorted(factory.state_machines) == ["KW", "PB"]
+    assert factory.create_piece("KW", (1, 2)).piece_id == "KW_1_2"
+
+
+def test_load_manifest_ignores_missing_and_other_versions(assets, capsys):
+    assert load_manifest(assets) is None
+    manifest_path_for(assets).write_text(json.dumps({"version": 0}))
+    assert load_manifest(assets) is None
+    assert "ignoring it" in capsys.readouterr().out
+
+
+def test_load_manifest_rebuilds_when_sources_changed(assets, capsys):
+    write_manifest(assets)
+    assert "files" in load_manifest(assets)
+
+    cfg_path = assets / "pieces_resources" / "KW" / "states" / "idle" / "config.json"
+    cfg = json.loads(cfg_path.read_text())
+    cfg["graphics"]["frames_per_sec"] = 42
+    cfg_path.write_text(json.dumps(cfg))
+    os.utime(cfg_path, ns=(0, 0))
+    manifest = load_manifest(assets)
+    assert "out of date" in capsys.readouterr().out
+    assert "files" not in manifest
+    assert manifest["pieces"]["KW"]["states"]["idle"]["config"]["graphics"]["frames_per_sec"] == 42
+
+
+def test_load_manifest_notices_added_sprites(assets, capsys):
+    sprites = assets / "pieces_resources" / "PB" / "states" / "move" / "sprites"
+    write_manifest(assets)
+    shutil.copy(sorted(sprites.glob("*.png"))[0], sprites / "99.png")
+    os.utime(sprites, ns=(0, 0))
+    manifest = load_manifest(assets)
+    assert "out of date" in capsys.readouterr().out
+    assert "pieces_resources/PB/states/move/sprites/99.png" in manifest["pieces"]["PB"]["states"]["move"]["sprites"]
+
+
+def test_check_fails_when_sources_changed(assets, capsys):
+    with pytest.raises(SystemExit) as missing:
+        main(["--assets", str(assets), "--check"])
+    assert missing.value.code != 0
+
+    write_manifest(assets)
+    with pytest.raises(SystemExit) as clean:
+        main(["--assets", str(assets), "--check"])
+    assert clean.value.code == 0
+
+    moves = assets / "pieces_resources" / "KW" / "moves.txt"
+    moves.write_text(moves.read_text() + "\n0,0\n")
+    with pytest.raises(SystemExit) as edited:
+        main(["--assets", str(assets), "--check"])
+    assert edited.value.code != 0
+    assert "changed: pieces_resources/KW/moves.txt" in capsys.readouterr().out
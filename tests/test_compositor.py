@@ -0,0 +1,102 @@
+import gc
+
+import pytest
+import numpy as np
+
+from implementation.img import Img
+from implementation.compositor import SpriteCompositor, hits_any
+from implementation.renderer import SpriteItem
+
+GRID = (10, 10, 10, 10, 4, 4)
+
+
+def make_sprite(value, size=10, masked=False):
+    img = Img()
+    img.img = np.full((size, size, 3), value, dtype=np.uint8)
+    if masked:
+        img.alpha = np.zeros((size, size), dtype=np.uint8)
+        img.alpha[:, size // 2:] = 255
+        img.img[:, :size // 2] = 0
+        img._prepare_blit()
+    return img
+
+
+def sequential(dst, items):
+    for item in items:
+        item.img.blit(dst, item.x, item.y)
+    return dst
+
+
+@pytest.fixture
+def dst():
+    return np.arange(60 * 60 * 3, dtype=np.uint32).reshape(60, 60, 3).astype(np.uint8)
+
+
+def test_hits_any():
+    rects = np.array([[0, 0, 10, 10], [20, 20, 5, 5]])
+    others = np.array([[5, 5, 10, 10]])
+    assert hits_any(rects, others).tolist() == [True, False]
+
+
+def test_grid_aligned_sprites_match_sequential_blits(dst):
+    items = [SpriteItem(i, make_sprite(10 * i + 5), 10 + 10 * (i % 4), 10 + 10 * (i // 4)) for i in range(16)]
+    expected = sequential(dst.copy(), items)
+    SpriteCompositor().composite(dst, items, GRID)
+    assert np.array_equal(dst, expected)
+
+
+def test_overlapping_and_unaligned_sprites_keep_paint_order(dst):
+    items = [
+        SpriteItem("a", make_sprite(50), 10, 10),
+        SpriteItem("moving", make_sprite(90), 15, 12),
+        SpriteItem("b", make_sprite(120), 20, 10),
+        SpriteItem("same_cell", make_sprite(160), 20, 10),
+        SpriteItem("far", make_sprite(200), 40, 40),
+    ]
+    expected = sequential(dst.copy(), items)
+    SpriteCompositor().composite(dst, items, GRID)
+    assert np.array_equal(dst, expected)
+
+
+def test_masked_sprites_in_batch(dst):
+    items = [SpriteItem(i, make_sprite(100 + i, masked=True), 10 + 10 * i, 30) for i in range(4)]
+    expected = sequential(dst.copy(), items)
+    SpriteCompositor().composite(dst, items, GRID)
+    assert np.array_equal(dst, expected)
+
+
+def test_sprites_outside_grid_or_wrong_size_fall_back(dst):
+    items = [
+        SpriteItem("outside", make_sprite(70), 0, 0),
+        SpriteItem("big", make_sprite(80, size=12), 30, 30),
+        SpriteItem("clipped", make_sprite(90), 55, 55),
+    ]
+    expected = sequential(dst.copy(), items)
+    SpriteCompositor().composite(dst, items, GRID)
+    assert np.array_equal(dst, expected)
+
+
+def test_each_sprite_is_banked_once(dst):
+    sprite = make_sprite(42)
+    compositor = SpriteCompositor()
+    items = [SpriteItem(i, sprite, 10 + 10 * i, 10) for i in range(4)]
+    compositor.composite(dst, items, GRID)
+    compositor.composite(dst, items, GRID)
+    assert compositor._count == 1
+
+
+def test_collected_sprites_release_their_slots(dst):
+    compositor = SpriteCompositor()
+    sprite = make_sprite(42)
+    compositor.composite(dst, [SpriteItem("a", sprite, 10, 10)], GRID)
+    assert len(compositor._slots) == 1
+
+    del sprite
+    gc.collect()
+    assert compositor._slots == {}
+    assert compositor._free == [0]
+
+    replacement = make_sprite(7)
+    compositor.composite(dst, [SpriteItem("b", replacement, 10, 10)], GRID)
+    assert compositor._count == 1
+    assert np.array_equal(dst[10:20, 10:20], replacement.img)
@@ -0,0 +1,120 @@
+import cv2
+import numpy as np
+import pygame
+import pytest
+from unittest.mock import patch
+
+from implementation.display_sink import (
+    NO_KEY, BufferSink, DisplaySink, ImageSequenceSink, NullSink, PygameSink, WindowSink
+)
+
+
+def frame(value):
+    return np.full((4, 6, 3), value, dtype=np.uint8)
+
+
+def test_sink_without_present_cannot_be_constructed():
+    class IncompleteSink(DisplaySink):
+        def poll_key(self) -> int:
+            return NO_KEY
+
+    with pytest.raises(TypeError):
+        IncompleteSink()
+
+
+def test_buffer_sink_keeps_copy_of_latest_frame():
+    sink = BufferSink()
+    source = frame(10)
+    sink.present(source)
+    kept = sink.frame
+    source[:] = 99
+    sink.present(frame(20))
+    assert sink.frame is kept
+    assert (sink.frame == 20).all()
+    assert sink.frames_presented == 2
+    assert sink.poll_key() == NO_KEY
+
+
+def test_image_sequence_sink_writes_every_nth_frame(tmp_path):
+    sink = ImageSequenceSink(tmp_path / "frames", every=2)
+    sink.open(frame(0), lambda x, y: None)
+    for value in range(5):
+        sink.present(frame(value * 10))
+    written = sorted((tmp_path / "frames").glob("*.png"))
+    assert [p.name for p in written] == ["frame_000000.png", "frame_000001.png", "frame_000002.png"]
+    assert (cv2.imread(str(written[1])) == 20).all()
+
+
+def test_image_sequence_sink_rejects_bad_step(tmp_path):
+    with pytest.raises(ValueError):
+        ImageSequenceSink(tmp_path, every=0)
+
+
+def test_null_sink_does_not_need_frames():
+    sink = NullSink()
+    assert not sink.needs_frames
+    sink.present(frame(0))
+    assert sink.poll_key() == NO_KEY
+
+
+def test_window_sink_reports_no_key_when_idle():
+    with patch("implementation.display_sink.cv2.waitKey", return_value=-1):
+        assert WindowSink().poll_key() == NO_KEY
+    with patch("implementation.display_sink.cv2.waitKey", return_value=0x10000 | ord('w')):
+        assert WindowSink().poll_key() == ord('w')
+
+
+def test_window_sink_forwards_left_clicks_only():
+    clicks = []
+    with patch("implementation.display_sink.cv2.imshow"), \
+         patch("implementation.display_sink.cv2.setMouseCallback") as set_callback:
+        WindowSink().open(frame(0), lambda x, y: clicks.append((x, y)))
+    callback = set_callback.call_args[0][1]
+    callback(cv2.EVENT_MOUSEMOVE, 1, 2, 0, None)
+    callback(cv2.EVENT_LBUTTONDOWN, 3, 4, 0, None)
+    assert clicks == [(3, 4)]
+
+
+@pytest.fixture
+def pygame_sink(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    sink = PygameSink()
+    yield sink
+    sink.close()
+
+
+def window_pixels(sink):
+    return pygame.surfarray.array3d(pygame.display.get_surface()).swapaxes(0, 1)[:, :, ::-1]
+
+
+def test_pygame_sink_updates_only_dirty_rects(pygame_sink):
+    first = np.zeros((4, 6, 3), dtype=np.uint8)
+    first[:, :, 2] = 200
+    pygame_sink.open(first, lambda x, y: None)
+    assert (window_pixels(pygame_sink) == first).all()
+
+    second = np.full((4, 6, 3), 90, dtype=np.uint8)
+    with patch("pygame.display.update") as update:
+        pygame_sink.present(second, [(1, 1, 2, 2), (5, 3, 4, 4)])
+    assert update.call_args[0][0] == [(1, 1, 2, 2), (5, 3, 1, 1)]
+
+    expected = first.copy()
+    expected[1:3, 1:3] = 90
+    expected[3:, 5:] = 90
+    assert (window_pixels(pygame_sink) == expected).all()
+
+
+def test_pygame_sink_reads_clicks_and_keys_from_event_queue(pygame_sink):
+    clicks = []
+    pygame_sink.open(frame(0), lambda x, y: clicks.append((x, y)))
+    pygame.event.clear()
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(2, 3)))
+    pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=3, pos=(4, 1)))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_w))
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN))
+    assert pygame_sink.poll_key() == ord('w')
+    assert clicks == [(2, 3)]
+    assert pygame_sink.poll_key() == 13
+    assert pygame_sink.poll_key() == NO_KEY
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    assert pygame_sink.poll_key() == 27
@@ -0,0 +1,84 @@
+import pytest
+
+from implementation.frame_ring import FrameRing
+
+
+SHAPE = (4, 6, 3)
+
+
+def test_ring_needs_two_buffers():
+    with pytest.raises(ValueError):
+        FrameRing(count=1)
+
+
+def test_acquire_preallocates_once_per_shape():
+    ring = FrameRing(count=3)
+    buffer = ring.acquire(SHAPE)
+    array = buffer.img.img
+    assert array.shape == SHAPE
+    ring.submit(buffer)
+    for _ in range(6):
+        b = ring.acquire(SHAPE)
+        ring.submit(b)
+    assert buffer.img.img is array
+
+
+def test_acquire_skips_latest_and_presenting_buffers():
+    ring = FrameRing(count=3)
+    first = ring.acquire(SHAPE)
+    ring.submit(first)
+    presented = ring.take_latest()
+    assert presented is first
+
+    second = ring.acquire(SHAPE)
+    assert second is not first
+    ring.submit(second)
+
+    third = ring.acquire(SHAPE)
+    assert third is not first and third is not second
+    ring.release(presented)
+
+
+def test_latest_is_last_submitted():
+    ring = FrameRing(count=2)
+    assert ring.take_latest() is None
+    a = ring.acquire(SHAPE)
+    ring.submit(a)
+    b = ring.acquire(SHAPE)
+    ring.submit(b)
+    assert ring.take_latest() is b
+
+
+def test_damage_accumulates_until_cap():
+    ring = FrameRing(count=2, max_damage_rects=3)
+    for buffer in ring.buffers:
+        buffer.damage = []
+    ring.add_damage([(0, 0, 1, 1), (1, 1, 1, 1)])
+    assert all(len(b.damage) == 2 for b in ring.buffers)
+    ring.add_damage([(2, 2, 1, 1), (3, 3, 1, 1)])
+    assert all(b.damage is None for b in ring.buffers)
+
+
+def test_shape_change_forces_full_repaint():
+    ring = FrameRing(count=2)
+    buffer = ring.acquire(SHAPE)
+    buffer.damage = []
+    ring.submit(buffer)
+    ring.acquire(SHAPE)
+    again = ring.acquire((8, 8, 3))
+    assert again.damage is None
+    assert again.img.img.shape == (8, 8, 3)
+
+
+def test_present_damage_covers_every_frame_since_last_presented():
+    ring = FrameRing(count=3)
+    first = ring.acquire(SHAPE)
+    ring.submit(first)
+    assert ring.take_latest().present_damage is None
+    ring.release(first)
+
+    for rect in [(0, 0, 1, 1), (2, 2, 1, 1)]:
+        buffer = ring.acquire(SHAPE)
+        ring.submit(buffer, [rect])
+    assert ring.take_latest().present_damage == [(0, 0, 1, 1), (2, 2, 1, 1)]
+    assert ring.take_latest().present_damage == []
@@ -0,0 +1,98 @@
+import pytest
+
+from implementation.frame_scheduler import FrameScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(clock, **kwargs):
+    kwargs.setdefault("report_interval_s", None)
+    return FrameScheduler(target_fps=10.0, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_rejects_non_positive_fps():
+    with pytest.raises(ValueError):
+        FrameScheduler(target_fps=0)
+
+
+def test_sleeps_until_next_deadline():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    assert scheduler.begin_frame()
+    clock.now += 0.03
+    scheduler.end_frame()
+    assert clock.sleeps == [pytest.approx(0.07)]
+    assert clock.now == pytest.approx(0.1)
+    assert scheduler.missed_deadlines == 0
+
+
+def test_late_frame_is_missed_and_next_render_skipped():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    scheduler.begin_frame()
+    clock.now += 0.25
+    scheduler.end_frame()
+    assert scheduler.missed_deadlines == 1
+    assert clock.sleeps == []
+
+    assert not scheduler.begin_frame()
+    scheduler.end_frame()
+    assert scheduler.begin_frame()
+    assert scheduler.frames_skipped == 1
+    assert scheduler.frames_rendered == 2
+
+
+def test_skips_are_bounded_by_max_frame_skip():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, max_frame_skip=2)
+    scheduler.begin_frame()
+    clock.now += 0.25
+    scheduler.end_frame()
+    results = []
+    for _ in range(3):
+        results.append(scheduler.begin_frame())
+        clock.now += 0.12
+        scheduler.end_frame()
+    assert results == [False, False, True]
+
+
+def test_resyncs_when_too_far_behind():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock, max_frame_skip=2)
+    scheduler.begin_frame()
+    clock.now += 10.0
+    scheduler.end_frame()
+    assert scheduler.begin_frame()
+    scheduler.end_frame()
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+
+def test_achieved_fps_counts_rendered_frames():
+    clock = FakeClock()
+    scheduler = make_scheduler(clock)
+    for _ in range(6):
+        scheduler.begin_frame()
+        scheduler.end_frame()
+    assert scheduler.achieved_fps == pytest.approx(10.0)
+    assert "10.0/10 fps" in scheduler.report()
+
+
+def test_reports_only_when_an_interval_is_set(capsys):
+    for interval, has_report in [(None, False), (0.5, True)]:
+        clock = FakeClock()
+        scheduler = FrameScheduler(target_fps=10.0, clock=clock, sleep=clock.sleep, report_interval_s=interval)
+        for _ in range(11):
+            scheduler.begin_frame()
+            scheduler.end_frame()
+        assert ("FrameScheduler:" in capsys.readouterr().out) == has_report
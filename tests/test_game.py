@@ -2,6 +2,8 @@ import pathlib
 import cv2
 import pytest
 import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 from implementation.board import Board
 from implementation.command import Command
 from implementation.mock_img import MockImg
@@ -28,7 +30,7 @@ def setup_game_with_kings():
     move_logger_display = MoveLoggerDisplay(event_manager)
     message_display = MessageDisplay(event_manager)
     sound_subscriber = SoundSubscriber(event_manager)
-    piece_factory = PieceFactory(board, pathlib.Path(r"C:\Users\user1\Documents\Bootcamp\KFChess\assets\pieces_resources"))
+    piece_factory = PieceFactory(board, pathlib.Path(__file__).parent.parent / "assets" / "pieces_resources")
 
     game = Game(pieces, board, event_manager, background_img,
                 move_logger_display, message_display, sound_subscriber, piece_factory)
@@ -52,4 +54,69 @@ def test_is_win_draw_no_kings(setup_game_with_kings):
     game = setup_game_with_kings
     del game.pieces["KW_0_0"]
     del game.pieces["KB_6_6"]
-    assert game._is_win()
\ No newline at end of file
+    assert game._is_win()
+
+def test_game_passes_tile_threads_to_renderer():
+    board = Board(100,100,7,7,10,10,Img())
+    event_manager = EventManager()
+    piece_factory = PieceFactory(board, pathlib.Path(__file__).parent.parent / "assets" / "pieces_resources", lazy_sprites=True)
+    game = Game([], board, event_manager, Img(), MoveLoggerDisplay(event_manager), MessageDisplay(event_manager),
+                SoundSubscriber(event_manager), piece_factory, tile_threads=3)
+    assert game.renderer.tile_threads == 3
+    assert game.renderer._pool is not None
+    game.renderer.close()
+
+
+def scaled_game(render_size, output_size):
+    return SimpleNamespace(screen_width=render_size[0], screen_height=render_size[1],
+                           output_width=output_size[0], output_height=output_size[1])
+
+
+def test_to_render_coords_maps_output_clicks_to_internal_resolution():
+    game = scaled_game((960, 540), (1920, 1080))
+    assert Game._to_render_coords(game, 0, 0) == (0, 0)
+    assert Game._to_render_coords(game, 1919, 1079) == (959, 539)
+    assert Game._to_render_coords(game, 301, 99) == (150, 49)
+    assert Game._to_render_coords(scaled_game((960, 540), (960, 540)), 301, 99) == (301, 99)
+
+
+def test_upscale_rects_covers_the_scaled_area_plus_filter_margin():
+    game = scaled_game((960, 540), (1920, 1080))
+    assert Game._upscale_rects(game, None) is None
+    assert Game._upscale_rects(game, [(10, 20, 5, 4)]) == [(18, 38, 14, 12)]
+    same = scaled_game((960, 540), (960, 540))
+    assert Game._upscale_rects(same, [(10, 20, 5, 4)]) == [(10, 20, 5, 4)]
+
+
+def test_run_releases_recorder_renderer_and_sink_when_the_loop_fails(setup_game_with_kings, monkeypatch):
+    game = setup_game_with_kings
+    game.pieces = {}
+    game.display_sink = MagicMock()
+    game.recorder = MagicMock()
+    game.renderer = MagicMock()
+    monkeypatch.setattr(game, "start_user_input_thread", lambda: None)
+    monkeypatch.setattr(game, "_run_single_threaded", MagicMock(side_effect=RuntimeError("boom")))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        game.run()
+    game.recorder.close.assert_called_once()
+    game.renderer.close.assert_called_once()
+    game.display_sink.close.assert_called_once()
+
+
+def test_keyboard_cursor_requests_redraw_only_when_it_moves(setup_game_with_kings):
+    game = setup_game_with_kings
+    game.display_sink = MagicMock(needs_frames=False)
+    game.keyboard_cursor_cell = (0, 0)
+
+    game._redraw_requested = False
+    game.display_sink.poll_key.return_value = ord('a')
+    assert game._show()
+    assert game.keyboard_cursor_cell == (0, 0)
+    assert not game._redraw_requested
+
+    game.display_sink.poll_key.return_value = ord('d')
+    assert game._show()
+    assert game.keyboard_cursor_cell == (1, 0)
+    assert game._redraw_requested
+    game.renderer.close()
@@ -0,0 +1,55 @@
+import pathlib
+import shutil
+
+import pytest
+
+from implementation.game_builder import GameBuilder
+from implementation.video_recorder import VideoRecorder
+
+ASSETS = pathlib.Path(__file__).parent.parent / "assets"
+
+
+@pytest.fixture
+def assets(tmp_path):
+    root = tmp_path / "assets"
+    shutil.copytree(ASSETS, root, ignore=shutil.ignore_patterns("sprite_cache", "sprite_atlas", "asset_manifest.json"))
+    return root
+
+
+def make_builder(assets, render_width=None):
+    return GameBuilder(root_folder=assets, board_width=8, board_height=8, cell_width_pix=80, cell_height_pix=80,
+                       board_image_file="board.png", background_image_file="background.png",
+                       screen_width=1600, screen_height=900, render_width=render_width)
+
+
+def test_lower_render_width_scales_board_background_and_text(assets):
+    full = make_builder(assets)
+    half = make_builder(assets, render_width=800)
+
+    assert half.render_scale == 0.5
+    assert (half.render_width, half.render_height) == (800, 450)
+    assert (half.board.cell_W_pix, half.board.cell_H_pix) == (40, 40)
+    assert half.board.img.get_width() == 8 * 40
+    assert (half.background_img.get_width(), half.background_img.get_height()) == (800, 450)
+    assert half.static_layer.get(800, 450).img.shape[:2] == (450, 800)
+
+    assert half.message_display.font_scale == pytest.approx(full.message_display.font_scale / 2)
+    assert half.move_logger_display.font_scale == pytest.approx(full.move_logger_display.font_scale / 2)
+    assert half.move_logger_display.font_thickness == 1
+    assert half.move_logger_display.margin == full.move_logger_display.margin // 2
+
+
+def test_game_renders_at_internal_resolution_and_outputs_at_screen_size(assets):
+    game = make_builder(assets, render_width=800).build_game("board.csv")
+    assert (game.screen_width, game.screen_height) == (800, 450)
+    assert (game.output_width, game.output_height) == (1600, 900)
+    game.renderer.close()
+
+
+def test_build_game_attaches_the_recorder(assets, tmp_path):
+    recorder = VideoRecorder(tmp_path / "game.avi", fps=10, fourcc="MJPG")
+    builder = make_builder(assets, render_width=800)
+    assert builder.build_game("board.csv").recorder is None
+    game = builder.build_game("board.csv", recorder=recorder)
+    assert game.recorder is recorder
+    game.renderer.close()
@@ -1,3 +1,4 @@
+import copy
 import pytest
 import tempfile
 import shutil
@@ -92,7 +93,7 @@ def test_graphics_copy_method(temp_sprites_folder, dummy_board):
 
         assert copied_graphics is not original_graphics
         assert copied_graphics.sprites_folder == original_graphics.sprites_folder
-        assert copied_graphics.board is not original_graphics.board
+        assert copied_graphics.board is original_graphics.board
         assert copied_graphics.loop == original_graphics.loop
         assert copied_graphics.fps == original_graphics.fps
         assert copied_graphics.cur_index == original_graphics.cur_index
@@ -101,11 +102,74 @@ def test_graphics_copy_method(temp_sprites_folder, dummy_board):
         assert copied_graphics.animation_finished == original_graphics.animation_finished
         assert len(copied_graphics.sprites) == len(original_graphics.sprites)
         
-        assert copied_graphics.sprites[0] is not original_graphics.sprites[0]
+        assert copied_graphics.sprites is original_graphics.sprites
         assert all(isinstance(s, MockImg) for s in copied_graphics.sprites)
         assert all(isinstance(s, MockImg) for s in original_graphics.sprites)
 
 
+def test_graphics_copy_has_own_cursor_and_reads_nothing(temp_sprites_folder, dummy_board):
+    with patch('implementation.graphics.Img', new=MockImg):
+        original = Graphics(sprites_folder=temp_sprites_folder, board=dummy_board, loop=True, fps=5.0)
+    original.last_frame_time = 500
+
+    with patch('implementation.graphics.Img.read', side_effect=AssertionError("sprite read")):
+        clone = original.copy()
+    clone.update(900)
+    assert clone.cur_index == 2
+    assert original.cur_index == 0
+
+    clone.sprites = [MockImg()]
+    assert clone.total_frames == 1
+    assert clone.cur_index == 0
+    assert clone.get_img() is clone.sprites[0]
+    assert len(original.sprites) == original.total_frames
+
+
+def test_graphics_next_frame_ms(temp_sprites_folder, dummy_board):
+    with patch('implementation.graphics.Img', new=MockImg):
+        graphics = Graphics(sprites_folder=temp_sprites_folder, board=dummy_board, loop=False, fps=6.0)
+        assert graphics.next_frame_ms(100) == 100
+        graphics.update(1000)
+        assert graphics.next_frame_ms(1000) == 1167
+        graphics.update(1166)
+        assert graphics.cur_index == 0
+        graphics.update(1167)
+        assert graphics.cur_index == 1
+
+        graphics.update(5000)
+        assert graphics.is_finished()
+        assert graphics.next_frame_ms(5000) is None
+
+
+def test_graphics_deepcopy_shares_sprites_and_board(temp_sprites_folder, dummy_board):
+    with patch('implementation.graphics.Img', new=MockImg):
+        original = Graphics(sprites_folder=temp_sprites_folder, board=dummy_board, loop=True, fps=5.0)
+    original.last_frame_time = 500
+
+    clone = copy.deepcopy(original)
+    assert clone is not original
+    assert clone.sprites is original.sprites
+    assert clone.board is original.board
+
+    clone.update(900)
+    assert clone.cur_index == 2
+    assert original.cur_index == 0
+    assert original.last_frame_time == 500
+
+
+def test_lazy_graphics_decode_once_on_first_use(temp_sprites_folder, dummy_board):
+    with patch('implementation.graphics.Img', new=MockImg):
+        graphics = Graphics(sprites_folder=temp_sprites_folder, board=dummy_board, lazy=True)
+        clone = copy.deepcopy(graphics)
+        assert graphics.total_frames == 3
+        assert MockImg.get_read_calls() == []
+
+        clone.get_img()
+        assert len(MockImg.get_read_calls()) == 3
+        assert graphics.sprites is clone.sprites
+        assert len(MockImg.get_read_calls()) == 3
+
+
 def test_graphics_reset_method(dummy_board, temp_sprites_folder):
     with patch('implementation.graphics.Img', new=MockImg):
         graphics = Graphics(
@@ -1,3 +1,101 @@
+import pathlib
+import threading
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from implementation.board import Board
+from implementation.graphics import Graphics
+from implementation.graphics_factory import GraphicsFactory
+from implementation.img import Img
+
+
+def make_sprite_dirs(root: pathlib.Path):
+    rng = np.random.default_rng(1)
+    dirs = []
+    for piece_id in ["PB", "QW"]:
+        for state in ["idle", "move"]:
+            sprite_dir = root / piece_id / "states" / state / "sprites"
+            sprite_dir.mkdir(parents=True)
+            for i in range(3):
+                cv2.imwrite(str(sprite_dir / f"{i}.png"), rng.integers(0, 255, (16, 16, 4), dtype=np.uint8))
+            dirs.append(sprite_dir)
+    return dirs
+
+
+def test_preloaded_sprites_match_sequential_loading(tmp_path):
+    board = Board(cell_H_pix=10, cell_W_pix=12, cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    dirs = make_sprite_dirs(tmp_path)
+    gf = GraphicsFactory(board=board)
+    assert gf.preload(dirs, max_workers=4) == 12
+
+    cfg = {"graphics": {"frames_per_sec": 8, "is_loop": True}}
+    with patch("implementation.graphics.read_sprite", side_effect=AssertionError("decoded again")):
+        loaded = [gf.load(d, cfg) for d in dirs]
+
+    for sprite_dir, graphics in zip(dirs, loaded):
+        expected = Graphics(sprite_dir, board)
+        assert graphics.fps == 8 and graphics.loop
+        assert graphics.total_frames == 3
+        for a, b in zip(expected.sprites, graphics.sprites):
+            assert np.array_equal(a.img, b.img)
+            assert np.array_equal(a.alpha, b.alpha)
+
+
+def test_prefetch_decodes_folders_not_used_yet(tmp_path):
+    board = Board(cell_H_pix=10, cell_W_pix=12, cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    dirs = make_sprite_dirs(tmp_path)
+    gf = GraphicsFactory(board=board)
+    graphics = [gf.load(d, {}) for d in dirs]
+    assert not any(gf.sprite_set(d).loaded for d in dirs)
+
+    graphics[0].get_img()
+    assert gf.sprite_set(dirs[0]).loaded
+
+    gf.prefetch(max_workers=2).join()
+    assert all(gf.sprite_set(d).loaded for d in dirs)
+    assert graphics[1].sprites is gf.sprite_set(dirs[1]).frames()
+
+
+def test_frames_wait_for_a_folder_being_prefetched(tmp_path):
+    board = Board(cell_H_pix=10, cell_W_pix=12, cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    sprite_set = GraphicsFactory(board=board).sprite_set(make_sprite_dirs(tmp_path)[0])
+    assert sprite_set.claim()
+    assert not sprite_set.claim()
+
+    result = []
+    with patch("implementation.graphics.read_sprite", side_effect=AssertionError("decoded twice")):
+        reader = threading.Thread(target=lambda: result.append(sprite_set.frames()))
+        reader.start()
+        reader.join(0.1)
+        assert reader.is_alive()
+        frames = [Img(), Img(), Img()]
+        sprite_set.set_frames(frames)
+        sprite_set.release()
+        reader.join(5)
+    assert result == [frames]
+
+
+def test_released_claim_without_frames_lets_the_reader_decode(tmp_path):
+    board = Board(cell_H_pix=10, cell_W_pix=12, cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    sprite_set = GraphicsFactory(board=board).sprite_set(make_sprite_dirs(tmp_path)[0])
+    assert sprite_set.claim()
+    sprite_set.release()
+    assert len(sprite_set.frames()) == 3
+
+
+def test_single_worker_preload_does_not_start_a_pool(tmp_path):
+    board = Board(cell_H_pix=10, cell_W_pix=12, cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    dirs = make_sprite_dirs(tmp_path)
+    gf = GraphicsFactory(board=board)
+    with patch("implementation.graphics_factory.ThreadPoolExecutor", side_effect=AssertionError("pool started")):
+        assert gf.preload(dirs, max_workers=1) == 12
+    assert all(gf.sprite_set(d).loaded for d in dirs)
+
+
+# Earlier tests, kept for reference:
+
 # import pytest
 # import tempfile
 # import shutil
@@ -170,4 +268,4 @@
 #     non_existent_dir = pathlib.Path("./non_existent_sprites_folder_xyz_123") 
 
 #     with pytest.raises(FileNotFoundError, match=r"Sprites base directory not found: .*non_existent_sprites_folder_xyz_123"):
-#         gf.load(non_existent_dir, {"PB": True})
\ No newline at end of file
+#         gf.load(non_existent_dir, {"PB": True})
@@ -0,0 +1,26 @@
+from implementation.import_bench import external_imports, measure, parse_importtime
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     numpy.core
+import time:        50 |        150 |   numpy
+import time:        20 |         20 |     json
+import time:        30 |         50 |   implementation.img
+import time:        10 |        210 | implementation.graphics
+"""
+
+
+def test_parse_importtime_reads_depth_and_times():
+    entries = parse_importtime(SAMPLE)
+    assert [(e.name, e.depth) for e in entries] == [
+        ("numpy.core", 2), ("numpy", 1), ("json", 2), ("implementation.img", 1), ("implementation.graphics", 0)]
+    assert entries[-1].cumulative_us == 210
+
+
+def test_external_imports_are_the_outermost_non_package_modules():
+    assert [e.name for e in external_imports(parse_importtime(SAMPLE))] == ["json", "numpy"]
+
+
+def test_game_import_does_not_load_pygame_or_multiprocessing():
+    cost = measure("implementation.game", repeat=1)
+    assert "pygame" not in cost.heavy
+    assert "multiprocessing" not in cost.heavy
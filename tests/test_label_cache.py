@@ -0,0 +1,62 @@
+import cv2
+import numpy as np
+import pytest
+
+from implementation.publish_subscribe.label_cache import LabelCache
+
+FONT = cv2.FONT_HERSHEY_COMPLEX
+WHITE = (255, 255, 255)
+
+
+def test_repeated_text_is_rendered_once():
+    cache = LabelCache()
+    first = cache.get("White Score: 0", FONT, 1.0, 2, WHITE)
+    second = cache.get("White Score: 0", FONT, 1.0, 2, WHITE)
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key_includes_color_scale_and_thickness():
+    cache = LabelCache()
+    base = cache.get("abc", FONT, 1.0, 2, WHITE)
+    assert cache.get("abc", FONT, 1.0, 2, (0, 255, 255)) is not base
+    assert cache.get("abc", FONT, 1.2, 2, WHITE) is not base
+    assert cache.get("abc", FONT, 1.0, 3, WHITE) is not base
+    assert len(cache) == 4
+
+
+def test_least_recently_used_label_is_evicted():
+    cache = LabelCache(max_entries=2)
+    a = cache.get("a", FONT, 1.0, 2, WHITE)
+    cache.get("b", FONT, 1.0, 2, WHITE)
+    cache.get("a", FONT, 1.0, 2, WHITE)
+    cache.get("c", FONT, 1.0, 2, WHITE)
+    assert len(cache) == 2
+    assert cache.get("a", FONT, 1.0, 2, WHITE) is a
+    assert cache.misses == 3
+
+
+def test_rejects_empty_capacity():
+    with pytest.raises(ValueError):
+        LabelCache(max_entries=0)
+
+
+def test_blit_draws_text_inside_its_rect_only():
+    cache = LabelCache()
+    label = cache.get("Hi", FONT, 1.0, 2, WHITE)
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+    label.blit(image, (10, 50))
+    x, y, w, h = label.get_rect((10, 50))
+    assert image[y:y + h, x:x + w].any()
+    outside = image.copy()
+    outside[y:y + h, x:x + w] = 0
+    assert not outside.any()
+
+
+def test_blit_clips_at_image_edges():
+    cache = LabelCache()
+    label = cache.get("Clipped text", FONT, 1.0, 2, WHITE)
+    image = np.zeros((20, 30, 3), dtype=np.uint8)
+    label.blit(image, (-10, 5))
+    label.blit(image, (500, 500))
+    assert image.shape == (20, 30, 3)
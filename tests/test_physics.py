@@ -1,3 +1,4 @@
+import copy
 import pytest
 from implementation.mock_img import MockImg
 from implementation.board import Board
@@ -80,6 +81,20 @@ def test_jump_physics_reset_and_update(board_with_mockimg):
     assert finished_cmd.piece_id == "p2"
 
 
+def test_next_change_times(board_with_mockimg):
+    idle = IdlePhysics(start_cell=(0, 0), board=board_with_mockimg)
+    assert idle.next_change_ms(1000) is None
+
+    mp = MovePhysics(start_cell=(1, 1), board=board_with_mockimg, speed_m_s=1.0)
+    assert mp.next_change_ms(1000) is None
+    mp.reset(Command(timestamp=1000, type="Move", piece_id="p1", params=[3, 1], source_cell=(1, 1)))
+    assert mp.next_change_ms(1200) == 1200
+
+    jp = JumpPhysics(start_cell=(2, 2), board=board_with_mockimg)
+    jp.reset(Command(timestamp=1000, type="Jump", piece_id="p2", params=[2, 2], source_cell=(2, 2)))
+    assert jp.next_change_ms(1200) == 2000
+
+
 def test_can_be_captured_and_can_capture_methods(board_with_mockimg):
     p = Physics(start_cell=(0, 0), board=board_with_mockimg)
     assert p.can_be_captured() is True
@@ -91,4 +106,15 @@ def test_can_be_captured_and_can_capture_methods(board_with_mockimg):
 
     jp = JumpPhysics(start_cell=(0, 0), board=board_with_mockimg)
     assert jp.can_be_captured() is False
-    assert jp.can_capture() is True
\ No newline at end of file
+    assert jp.can_capture() is True
+
+def test_deepcopy_shares_board_but_not_position(board_with_mockimg):
+    original = MovePhysics(start_cell=(1, 1), board=board_with_mockimg, speed_m_s=1.0)
+    clone = copy.deepcopy(original)
+    assert clone.board is original.board
+
+    clone.reset(Command(timestamp=0, type="Move", piece_id="p1", params=[3, 1], source_cell=(1, 1)))
+    clone.update(1000)
+    assert clone.get_pos() == (2.0, 1.0)
+    assert original.get_pos() == (1.0, 1.0)
+    assert original.start_time_ms is None
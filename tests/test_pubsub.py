@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, patch
 from implementation.publish_subscribe.event_manager import EventManager, EventType
+from implementation.publish_subscribe.message_display import MessageDisplay
 from implementation.publish_subscribe.move_logger_display import MoveLoggerDisplay
 from implementation.publish_subscribe.sound_subscriber import SoundSubscriber
 
@@ -41,6 +42,14 @@ def test_publish_event_with_wrong_arguments(event_manager, capsys):
     assert "for GAME_START failed with arguments ('wrong_arg',), {}." in captured
 
 
+def test_message_display_next_change_is_message_expiry(event_manager):
+    display = MessageDisplay(event_manager)
+    assert display.next_change_ms(0) is None
+    display._on_game_start(1000)
+    assert display.next_change_ms(1500) == 1000 + display.message_duration_ms
+    assert display.next_change_ms(1000 + display.message_duration_ms) is None
+
+
 @pytest.fixture
 def move_logger(event_manager):
     return MoveLoggerDisplay(event_manager)
@@ -71,13 +80,36 @@ def test_on_piece_jumped(move_logger):
     assert move_logger.moves_history[0]['move_desc'] == 'Knight enters Jump state at c6'
 
 
+
+def test_move_log_layout_is_reused_until_a_move(move_logger):
+    first = move_logger.get_layout(1400, 900, 300, 100, 680, 680)
+    assert move_logger.get_layout(1400, 900, 300, 100, 680, 680) is first
+    move_logger._on_piece_moved("white", "pawn", (1, 2), (1, 3))
+    second = move_logger.get_layout(1400, 900, 300, 100, 680, 680)
+    assert second is not first
+    white, black = second.columns
+    assert [text for text, _, _ in white.lines] == ["1. Pawn a7-a8"]
+    assert white.lines[0][2] == move_logger.highlight_color
+    assert black.lines == ()
+    assert second.rects == tuple(move_logger.get_text_rect(text, org) for text, org, _ in second.entries())
+
+
 @pytest.fixture
 def sound_subscriber_with_mocks(event_manager):
-    with patch('pygame.mixer.Sound') as MockSoundConstructor:
+    with patch('pygame.mixer.init'), patch('pygame.mixer.Sound') as MockSoundConstructor:
         subscriber = SoundSubscriber(event_manager)
         yield subscriber, MockSoundConstructor 
 
 
+def test_sound_subscriber_initialises_mixer_on_first_sound(event_manager):
+    with patch('pygame.mixer.init') as mixer_init, patch('pygame.mixer.Sound'):
+        subscriber = SoundSubscriber(event_manager)
+        mixer_init.assert_not_called()
+        subscriber.on_piece_moved_sound('white', 'pawn', (1, 2), (1, 3))
+        subscriber.on_piece_jumped_sound('white', 'knight', (2, 3))
+        mixer_init.assert_called_once()
+
+
 def test_sound_subscriber_on_piece_moved_sound(sound_subscriber_with_mocks):
     subscriber, MockSoundConstructor = sound_subscriber_with_mocks
     subscriber.on_piece_moved_sound('white', 'pawn', (1, 2), (1, 3))
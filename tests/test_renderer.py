@@ -0,0 +1,185 @@
+import pytest
+import numpy as np
+
+from implementation.board import Board
+from implementation.img import Img
+from implementation.static_layer import StaticLayer
+from implementation.renderer import Renderer, SpriteItem, RectItem, OverlayItem, rects_intersect, clip_rect
+
+
+def make_img(h, w, value):
+    img = Img()
+    img.img = np.full((h, w, 3), value, dtype=np.uint8)
+    return img
+
+
+@pytest.fixture
+def background():
+    img = Img()
+    img.img = np.arange(60 * 80 * 3, dtype=np.uint32).reshape(60, 80, 3).astype(np.uint8)
+    return img
+
+
+@pytest.fixture
+def board():
+    return Board(
+        cell_H_pix=10,
+        cell_W_pix=10,
+        cell_H_m=1.0,
+        cell_W_m=1.0,
+        W_cells=4,
+        H_cells=4,
+        img=make_img(40, 40, 200)
+    )
+
+
+@pytest.fixture
+def renderer(background, board):
+    return Renderer(StaticLayer(background, board))
+
+
+SCREEN = (80, 60)
+
+
+def naive_frame(background, board, origin, items):
+    frame = background.copy()
+    board.img.draw_on(frame, origin[0], origin[1])
+    for item in items:
+        item.paint(frame)
+    return frame.img
+
+
+def test_rects_intersect_and_clip():
+    assert rects_intersect((0, 0, 10, 10), (5, 5, 10, 10))
+    assert not rects_intersect((0, 0, 10, 10), (10, 0, 5, 5))
+    assert clip_rect((-5, -5, 10, 10), 20, 20) == (0, 0, 5, 5)
+    assert clip_rect((25, 0, 10, 10), 20, 20) is None
+
+
+def test_first_render_matches_full_composite(renderer, background, board):
+    items = [SpriteItem("a", make_img(10, 10, 50), 20, 10)]
+    frame = renderer.render(items, SCREEN)
+    assert np.array_equal(frame, naive_frame(background, board, (20, 10), items))
+
+
+def test_unchanged_items_produce_no_dirty_rects(renderer):
+    sprite = make_img(10, 10, 50)
+    for _ in range(len(renderer.ring.buffers) + 1):
+        renderer.render([SpriteItem("a", sprite, 20, 10)], SCREEN)
+    assert renderer.last_dirty_rects == []
+
+
+def test_moved_sprite_repaints_old_and_new_area(renderer, background, board):
+    sprite = make_img(10, 10, 50)
+    for _ in range(len(renderer.ring.buffers)):
+        renderer.render([SpriteItem("a", sprite, 20, 10)], SCREEN)
+    items = [SpriteItem("a", sprite, 30, 10)]
+    frame = renderer.render(items, SCREEN)
+
+    assert (20, 10, 10, 10) in renderer.last_dirty_rects
+    assert (30, 10, 10, 10) in renderer.last_dirty_rects
+    assert np.array_equal(frame, naive_frame(background, board, (20, 10), items))
+
+
+def test_overlapping_unchanged_item_is_repainted(renderer, background, board):
+    still = make_img(10, 10, 50)
+    moving = make_img(10, 10, 90)
+    renderer.render([SpriteItem("still", still, 25, 15), SpriteItem("moving", moving, 20, 10)], SCREEN)
+    items = [SpriteItem("still", still, 25, 15), SpriteItem("moving", moving, 40, 30)]
+    frame = renderer.render(items, SCREEN)
+    assert np.array_equal(frame, naive_frame(background, board, (20, 10), items))
+
+
+def test_removed_item_is_restored(renderer, background, board):
+    renderer.render([SpriteItem("a", make_img(10, 10, 50), 0, 0)], SCREEN)
+    frame = renderer.render([], SCREEN)
+    assert np.array_equal(frame, naive_frame(background, board, (20, 10), []))
+
+
+def test_clipped_rect_item_stays_inside_clip(renderer, background, board):
+    item = RectItem("cursor", 20, 10, 10, 10, (0, 0, 255), 3, clip=(20, 10, 40, 40))
+    frame = renderer.render([item], SCREEN)
+    untouched = naive_frame(background, board, (20, 10), [])
+    assert np.array_equal(frame[:10], untouched[:10])
+    assert np.array_equal(frame[:, :20], untouched[:, :20])
+    assert item.rects == ((20, 10, 14, 14),)
+
+
+def test_overlay_redrawn_only_when_signature_changes(renderer):
+    calls = []
+    def draw(img, origin):
+        calls.append(1)
+    buffers = len(renderer.ring.buffers)
+    for _ in range(buffers + 2):
+        renderer.render([OverlayItem("text", ((0, 0, 5, 5),), "hello", draw)], SCREEN)
+    assert len(calls) == buffers
+    renderer.render([OverlayItem("text", ((0, 0, 5, 5),), "bye", draw)], SCREEN)
+    assert len(calls) == buffers + 1
+
+
+def tile_scene(step):
+    sprite = make_img(10, 10, 50)
+    sprite.img[3:7, 3:7] = 120
+
+    def draw(img, origin):
+        x, y = 5 - origin[0], 40 + step - origin[1]
+        img[max(0, y):max(0, y + 7), x:x + 30] = (10, 200, 30)
+
+    return [
+        SpriteItem("a", sprite, 3 * step, 2 * step),
+        SpriteItem("b", sprite, 50, 55 - 4 * step),
+        RectItem("cursor", 20 + step, 10, 10, 10, (0, 0, 255), 3, clip=(20, 10, 40, 40)),
+        OverlayItem("text", ((5, 40 + step, 30, 7),), step, draw),
+    ]
+
+
+def test_tiled_render_matches_sequential_render(background, board):
+    sequential = Renderer(StaticLayer(background, board))
+    tiled = Renderer(StaticLayer(background, board), tile_threads=4, tile_min_pixels=0)
+    for step in range(12):
+        expected = sequential.render(tile_scene(step), SCREEN)
+        frame = tiled.render(tile_scene(step), SCREEN)
+        assert np.array_equal(frame, expected)
+        assert tiled.last_dirty_rects == sequential.last_dirty_rects
+
+
+def test_small_repaints_skip_the_tile_pool(background, board, monkeypatch):
+    tiled = Renderer(StaticLayer(background, board), tile_threads=4)
+    monkeypatch.setattr(tiled, "_paint_tiles", lambda *args: pytest.fail("small repaint was tiled"))
+    tiled.render(tile_scene(0), SCREEN)
+
+
+def test_close_stops_tile_pool_and_falls_back_to_sequential(background, board):
+    sequential = Renderer(StaticLayer(background, board))
+    tiled = Renderer(StaticLayer(background, board), tile_threads=4, tile_min_pixels=0)
+    pool = tiled._pool
+    tiled.close()
+    assert pool._shutdown
+    assert np.array_equal(tiled.render(tile_scene(0), SCREEN), sequential.render(tile_scene(0), SCREEN))
+    tiled.close()
+
+
+def test_invalidate_forces_full_repaint(renderer):
+    renderer.render([], SCREEN)
+    for buffer in renderer.ring.buffers:
+        if buffer.img.img is not None:
+            buffer.img.img[:] = 0
+    renderer.invalidate()
+    frame = renderer.render([], SCREEN)
+    assert frame.any()
+
+
+def test_every_ring_buffer_catches_up_on_missed_changes(renderer, background, board):
+    sprite = make_img(10, 10, 50)
+    for x in range(0, 60, 5):
+        items = [SpriteItem("a", sprite, x, 20), RectItem("cursor", 30, 20, 10, 10, (0, 0, 255), 2)]
+        frame = renderer.render(items, SCREEN)
+        assert np.array_equal(frame, naive_frame(background, board, (20, 10), items))
+
+
+def test_render_reuses_preallocated_buffers(renderer):
+    sprite = make_img(10, 10, 50)
+    arrays = set()
+    for x in range(10):
+        arrays.add(id(renderer.render([SpriteItem("a", sprite, x, 0)], SCREEN)))
+    assert len(arrays) <= len(renderer.ring.buffers)
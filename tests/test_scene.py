@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from implementation.img import Img
+from implementation.renderer import OverlayItem, RectItem, SpriteItem
+from implementation.scene import OverlayNode, RectNode, Scene, SceneNode, SpriteNode
+
+
+def make_img(h, w, value):
+    img = Img()
+    img.img = np.full((h, w, 3), value, dtype=np.uint8)
+    return img
+
+
+def test_children_follow_parent_transform():
+    scene = Scene()
+    layer = scene.layer("pieces")
+    layer.set_position(20, 10)
+    sprite = make_img(5, 5, 50)
+    layer.add(SpriteNode("a")).set(sprite, 3, 4)
+
+    assert scene.items() == (SpriteItem("a", sprite, 23, 14),)
+    layer.set_position(30, 10)
+    assert scene.items() == (SpriteItem("a", sprite, 33, 14),)
+
+
+def test_clean_scene_reuses_cached_items():
+    scene = Scene()
+    layer = scene.layer("pieces")
+    sprite = make_img(5, 5, 50)
+    layer.add(SpriteNode("a")).set(sprite, 0, 0)
+    layer.add(SpriteNode("b")).set(sprite, 10, 0)
+    first = scene.items()
+
+    layer.child("a").set(sprite, 0, 0)
+    assert scene.items() is first
+
+    layer.child("b").set(sprite, 12, 0)
+    second = scene.items()
+    assert second[0] is first[0]
+    assert second[1] == SpriteItem("b", sprite, 12, 0)
+
+
+def test_layers_paint_in_order_and_removed_nodes_disappear():
+    scene = Scene()
+    sprite = make_img(5, 5, 50)
+    pieces = scene.layer("pieces")
+    pieces.add(SpriteNode("a")).set(sprite, 0, 0)
+    pieces.add(SpriteNode("b")).set(sprite, 5, 0)
+    scene.layer("cursors").add(RectNode("cursor", 5, 5, (0, 0, 255), 1))
+    assert [item.key for item in scene.items()] == ["a", "b", "cursor"]
+
+    pieces.remove("a")
+    assert [item.key for item in scene.items()] == ["b", "cursor"]
+
+
+def test_rect_node_clips_to_sized_parent():
+    scene = Scene()
+    cursors = scene.layer("cursors")
+    cursors.set_position(20, 10)
+    cursors.set_size((40, 40))
+    cursors.add(RectNode("cursor", 10, 10, (0, 0, 255), 3, x=10, y=0))
+    (item,) = scene.items()
+    assert item == RectItem("cursor", 30, 10, 10, 10, (0, 0, 255), 3, clip=(20, 10, 40, 40))
+
+
+def test_hidden_and_off_screen_nodes_are_culled():
+    scene = Scene()
+    sprite = make_img(5, 5, 50)
+    layer = scene.layer("pieces")
+    layer.add(SpriteNode("visible")).set(sprite, 0, 0)
+    layer.add(SpriteNode("off_screen")).set(sprite, 100, 0)
+    hidden = layer.add(SpriteNode("hidden"))
+    hidden.set(sprite, 10, 10)
+    hidden.set_visible(False)
+
+    scene.set_viewport((0, 0, 50, 50))
+    assert [item.key for item in scene.items()] == ["visible"]
+    hidden.set_visible(True)
+    assert [item.key for item in scene.items()] == ["visible", "hidden"]
+
+
+def test_overlay_rects_computed_once_per_signature_and_drawn_relative_to_node():
+    computed, drawn = [], []
+
+    def rects_for(signature):
+        computed.append(signature)
+        return ((0, 0, 4, 2),)
+
+    scene = Scene()
+    node = scene.layer("overlays").add(OverlayNode(
+        "text", rects_for, lambda dst, origin, signature: drawn.append((origin, signature)), x=5, y=6))
+    node.set_signature("hello")
+    node.set_signature("hello")
+    (item,) = scene.items()
+
+    assert computed == ["hello"]
+    assert isinstance(item, OverlayItem)
+    assert item.rects == ((5, 6, 4, 2),)
+    item.paint_into(np.zeros((10, 10, 3), dtype=np.uint8), (0, 2))
+    assert drawn == [((-5, -4), "hello")]
+
+
+def test_duplicate_child_keys_are_rejected():
+    node = SceneNode("root")
+    node.add(SceneNode("a"))
+    with pytest.raises(ValueError):
+        node.add(SceneNode("a"))
@@ -0,0 +1,111 @@
+import os
+import pathlib
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from implementation.board import Board
+from implementation.graphics import Graphics
+from implementation.img import Img, BLEND_MASKED, BLEND_OPAQUE, BLEND_TRANSLUCENT
+from implementation.sprite_atlas import SpriteAtlas, atlas_path_for, build_atlas, load_atlas
+
+CELL = (12, 10)
+
+
+@pytest.fixture
+def pieces_root(tmp_path):
+    root = tmp_path / "pieces_resources"
+    rng = np.random.default_rng(0)
+    idle = root / "PW" / "states" / "idle" / "sprites"
+    move = root / "PW" / "states" / "move" / "sprites"
+    idle.mkdir(parents=True)
+    move.mkdir(parents=True)
+
+    cv2.imwrite(str(idle / "1.png"), rng.integers(0, 255, (CELL[1], CELL[0], 3), dtype=np.uint8))
+    masked = rng.integers(0, 255, (CELL[1], CELL[0], 4), dtype=np.uint8)
+    masked[:, :, 3] = 0
+    masked[2:8, 3:9, 3] = 255
+    cv2.imwrite(str(idle / "2.png"), masked)
+    cv2.imwrite(str(move / "1.png"), rng.integers(0, 255, (CELL[1], CELL[0], 4), dtype=np.uint8))
+    return root
+
+
+def test_atlas_frames_match_png_loading(pieces_root, tmp_path):
+    atlas_path = tmp_path / "sprites.atlas"
+    assert build_atlas(pieces_root, CELL, atlas_path) == 3
+    atlas = SpriteAtlas(atlas_path, pieces_root)
+    assert atlas.cell_size == CELL
+    assert len(atlas) == 3
+
+    for folder, modes in [("PW/states/idle/sprites", [BLEND_OPAQUE, BLEND_MASKED]),
+                          ("PW/states/move/sprites", [BLEND_TRANSLUCENT])]:
+        files = sorted((pieces_root / folder).glob("*.png"))
+        frames = atlas.frames(pieces_root / folder)
+        assert [f.blend_mode for f in frames] == modes
+        for file, frame in zip(files, frames):
+            expected = Img().read(file, target_size=CELL)
+            assert not frame.img.flags.writeable
+            for name in ("img", "alpha", "mask", "inv_alpha"):
+                a, b = getattr(expected, name), getattr(frame, name)
+                assert (a is None and b is None) or np.array_equal(a, b)
+
+            dst_expected = np.full((16, 16, 3), 77, dtype=np.uint8)
+            dst_frame = dst_expected.copy()
+            expected.blit(dst_expected, 2, 3)
+            frame.blit(dst_frame, 2, 3)
+            assert np.array_equal(dst_expected, dst_frame)
+
+
+def test_unknown_folder_is_not_in_atlas(pieces_root, tmp_path):
+    build_atlas(pieces_root, CELL, tmp_path / "sprites.atlas")
+    atlas = SpriteAtlas(tmp_path / "sprites.atlas", pieces_root)
+    assert atlas.frames(pieces_root / "QB" / "states" / "idle" / "sprites") is None
+    assert atlas.frames(tmp_path / "elsewhere") is None
+
+
+def test_graphics_uses_atlas_without_reading_pngs(pieces_root, tmp_path):
+    build_atlas(pieces_root, CELL, tmp_path / "sprites.atlas")
+    atlas = SpriteAtlas(tmp_path / "sprites.atlas", pieces_root)
+    board = Board(cell_H_pix=CELL[1], cell_W_pix=CELL[0], cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    with patch("implementation.graphics.Img.read", side_effect=AssertionError("PNG decoded")):
+        graphics = Graphics(pieces_root / "PW" / "states" / "idle" / "sprites", board, atlas=atlas)
+    assert graphics.total_frames == 2
+    assert graphics.get_img().get_width() == CELL[0]
+
+
+def test_load_atlas_only_uses_matching_cell_size(pieces_root, capsys):
+    assert load_atlas(pieces_root, CELL) is None
+    build_atlas(pieces_root, CELL, atlas_path_for(pieces_root.parent, CELL))
+    assert load_atlas(pieces_root, CELL) is not None
+
+    other = (CELL[0] * 2, CELL[1] * 2)
+    build_atlas(pieces_root, CELL, atlas_path_for(pieces_root.parent, other))
+    assert load_atlas(pieces_root, other) is None
+    assert "ignoring it" in capsys.readouterr().out
+
+
+def test_non_atlas_file_is_rejected(tmp_path):
+    path = tmp_path / "not.atlas"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        SpriteAtlas(path, tmp_path)
+
+
+def test_edited_or_added_sprites_make_the_folder_stale(pieces_root, tmp_path, capsys):
+    build_atlas(pieces_root, CELL, tmp_path / "sprites.atlas")
+    atlas = SpriteAtlas(tmp_path / "sprites.atlas", pieces_root)
+    idle = pieces_root / "PW" / "states" / "idle" / "sprites"
+    move = pieces_root / "PW" / "states" / "move" / "sprites"
+
+    os.utime(idle / "1.png", ns=(0, 0))
+    assert atlas.frames(idle) is None
+    assert "out of date" in capsys.readouterr().out
+
+    cv2.imwrite(str(move / "2.png"), np.zeros((CELL[1], CELL[0], 3), dtype=np.uint8))
+    os.utime(move, ns=(0, 0))
+    assert atlas.frames(move) is None
+
+    board = Board(cell_H_pix=CELL[1], cell_W_pix=CELL[0], cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    assert Graphics(move, board, atlas=atlas).total_frames == 2
@@ -0,0 +1,104 @@
+import os
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+
+from implementation.board import Board
+from implementation.graphics_factory import GraphicsFactory
+from implementation.img import Img, BLEND_MASKED, BLEND_OPAQUE, BLEND_TRANSLUCENT
+from implementation.sprite_cache import SpriteCache
+
+SIZE = (12, 10)
+
+
+@pytest.fixture
+def sprites(tmp_path):
+    folder = tmp_path / "sprites"
+    folder.mkdir()
+    rng = np.random.default_rng(0)
+    cv2.imwrite(str(folder / "1.png"), rng.integers(0, 255, (20, 24, 3), dtype=np.uint8))
+    masked = rng.integers(0, 255, (SIZE[1], SIZE[0], 4), dtype=np.uint8)
+    masked[:, :, 3] = 0
+    masked[2:8, 3:9, 3] = 255
+    cv2.imwrite(str(folder / "2.png"), masked)
+    cv2.imwrite(str(folder / "3.png"), rng.integers(0, 255, (20, 24, 4), dtype=np.uint8))
+    return sorted(folder.glob("*.png"))
+
+
+def test_cached_sprites_match_decoded_sprites(sprites, tmp_path):
+    cache = SpriteCache(tmp_path / "cache")
+    for file in sprites:
+        cache.read(file, SIZE)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    with patch("implementation.img.cv2.imread", side_effect=AssertionError("PNG decoded")):
+        cached = [cache.read(file, SIZE) for file in sprites]
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert [img.blend_mode for img in cached] == [BLEND_OPAQUE, BLEND_MASKED, BLEND_TRANSLUCENT]
+
+    for file, frame in zip(sprites, cached):
+        expected = Img().read(file, target_size=SIZE)
+        for name in ("img", "alpha", "mask", "inv_alpha"):
+            a, b = getattr(expected, name), getattr(frame, name)
+            assert (a is None and b is None) or np.array_equal(a, b)
+
+
+def test_changed_source_or_size_misses(sprites, tmp_path):
+    cache = SpriteCache(tmp_path / "cache")
+    cache.read(sprites[0], SIZE)
+    cache.read(sprites[0], (6, 5))
+    os.utime(sprites[0], ns=(0, 0))
+    cache.read(sprites[0], SIZE)
+    assert (cache.hits, cache.misses) == (0, 3)
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 2
+
+
+def test_edited_source_replaces_its_entry_only(sprites, tmp_path):
+    cache = SpriteCache(tmp_path / "cache")
+    for file in sprites:
+        cache.read(file, SIZE)
+    other_folder = tmp_path / "other"
+    other_folder.mkdir()
+    cv2.imwrite(str(other_folder / sprites[0].name), np.zeros((4, 4, 3), dtype=np.uint8))
+    cache.read(other_folder / sprites[0].name, SIZE)
+
+    os.utime(sprites[0], ns=(0, 0))
+    cache.read(sprites[0], SIZE)
+    entries = sorted(p.name for p in (tmp_path / "cache").glob("*.npy"))
+    assert len(entries) == 4
+    assert cache.entry_path(sprites[0], SIZE).name in entries
+    assert cache.entry_path(other_folder / sprites[0].name, SIZE).name in entries
+
+
+def test_unreadable_entry_is_rebuilt(sprites, tmp_path, capsys):
+    cache = SpriteCache(tmp_path / "cache")
+    cache.read(sprites[1], SIZE)
+    cache.entry_path(sprites[1], SIZE).write_bytes(b"not a npy file")
+    img = cache.read(sprites[1], SIZE)
+    assert img.blend_mode == BLEND_MASKED
+    assert "Ignoring unreadable" in capsys.readouterr().out
+    assert cache.read(sprites[1], SIZE).blend_mode == BLEND_MASKED
+    assert cache.hits == 1
+
+    np.save(cache.entry_path(sprites[1], SIZE), np.zeros((4, 4), dtype=np.uint8))
+    assert cache.read(sprites[1], SIZE).blend_mode == BLEND_MASKED
+    assert "unexpected array" in capsys.readouterr().out
+
+    np.save(cache.entry_path(sprites[1], SIZE), np.zeros((SIZE[0], SIZE[1], 4), dtype=np.uint8))
+    img = cache.read(sprites[1], SIZE)
+    assert (img.get_width(), img.get_height()) == SIZE
+    assert "unexpected array" in capsys.readouterr().out
+
+
+def test_graphics_factory_preloads_through_cache(sprites, tmp_path):
+    board = Board(cell_H_pix=SIZE[1], cell_W_pix=SIZE[0], cell_H_m=1.0, cell_W_m=1.0, W_cells=8, H_cells=8, img=Img())
+    folder = sprites[0].parent
+    GraphicsFactory(board, cache=SpriteCache(tmp_path / "cache")).preload([folder])
+
+    cache = SpriteCache(tmp_path / "cache")
+    factory = GraphicsFactory(board, cache=cache)
+    assert factory.preload([folder]) == 3
+    assert (cache.hits, cache.misses) == (3, 0)
+    assert factory.sprite_set(folder).frames()[0].get_width() == SIZE[0]
@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+
+from implementation.board import Board
+from implementation.img import Img
+from implementation.static_layer import StaticLayer
+
+
+def make_img(h, w, value):
+    img = Img()
+    img.img = np.full((h, w, 3), value, dtype=np.uint8)
+    return img
+
+
+@pytest.fixture
+def layer():
+    board = Board(
+        cell_H_pix=10,
+        cell_W_pix=10,
+        cell_H_m=1.0,
+        cell_W_m=1.0,
+        W_cells=4,
+        H_cells=4,
+        img=make_img(40, 40, 200)
+    )
+    return StaticLayer(make_img(60, 80, 30), board)
+
+
+def test_layer_has_board_centred_on_background(layer):
+    img = layer.get(80, 60)
+    assert layer.board_origin == (20, 10)
+    assert (img.img[10:50, 20:60] == 200).all()
+    assert (img.img[:10] == 30).all()
+    assert (img.img[:, :20] == 30).all()
+
+
+def test_layer_is_built_once_per_size(layer):
+    first = layer.get(80, 60)
+    assert layer.get(80, 60) is first
+
+
+def test_layer_rebuilt_when_screen_size_changes(layer):
+    first = layer.get(80, 60)
+    second = layer.get(100, 70)
+    assert second is not first
+    assert second.img.shape == (70, 100, 3)
+    assert layer.board_origin == (30, 15)
+
+
+def test_layer_does_not_modify_background(layer):
+    layer.get(100, 70)
+    assert layer.background_img.img.shape == (60, 80, 3)
+    assert (layer.background_img.img == 30).all()
+
+
+def test_unknown_screen_size_falls_back_to_background_size(layer):
+    assert layer.get(0, 0).img.shape == (60, 80, 3)
@@ -0,0 +1,78 @@
+import cv2
+import numpy as np
+
+from implementation.publish_subscribe.label_cache import LabelCache
+from implementation.publish_subscribe.text_panel import TextPanel
+
+FONT = cv2.FONT_HERSHEY_COMPLEX
+WHITE = (255, 255, 255)
+YELLOW = (0, 255, 255)
+LINE_HEIGHT = 37
+
+
+def make_panel():
+    cache = LabelCache()
+    return TextPanel(lambda text, color: cache.get(text, FONT, 1.0, 2, color)), cache
+
+
+def column(texts, top=60, highlight_last=True):
+    lines = []
+    for i, text in enumerate(texts):
+        color = YELLOW if highlight_last and i == len(texts) - 1 else WHITE
+        lines.append((text, (20, top + i * LINE_HEIGHT), color))
+    return tuple(lines)
+
+
+def reference(cache, lines, background):
+    image = background.copy()
+    for text, org, color in lines:
+        cache.get(text, FONT, 1.0, 2, color).blit(image, org)
+    return image
+
+
+def background():
+    return np.random.default_rng(0).integers(0, 255, (400, 500, 3), dtype=np.uint8)
+
+
+def test_panel_matches_drawing_every_line():
+    panel, cache = make_panel()
+    lines = column(["1. Pawn a2-a4", "2. Knight b1-c3"])
+    panel.sync(lines)
+    image = background()
+    panel.blit(image)
+    assert np.array_equal(image, reference(cache, lines, background()))
+
+
+def test_appending_moves_does_not_rebuild():
+    panel, cache = make_panel()
+    moves = []
+    for i in range(5):
+        moves.append(f"{i + 1}. Pawn a2-a{i + 3}")
+        lines = column(moves)
+        panel.sync(lines)
+        image = background()
+        panel.blit(image)
+        assert np.array_equal(image, reference(cache, lines, background()))
+    assert panel.rebuilds == 1
+
+
+def test_scrolling_shifts_panel_in_place():
+    panel, cache = make_panel()
+    moves = [f"{i + 1}. Rook h1-h{i + 2}" for i in range(6)]
+    panel.sync(column(moves[:4]))
+    for start in range(1, 3):
+        lines = column(moves[start:start + 4])
+        panel.sync(lines)
+        image = background()
+        panel.blit(image)
+        assert np.array_equal(image, reference(cache, lines, background()))
+    assert panel.rebuilds == 1
+
+
+def test_empty_column_draws_nothing():
+    panel, _ = make_panel()
+    panel.sync(column(["1. Pawn a2-a4"]))
+    panel.sync(())
+    image = background()
+    panel.blit(image)
+    assert np.array_equal(image, background())
@@ -0,0 +1,48 @@
+import threading
+
+from implementation.triple_buffer import TripleBuffer
+
+
+def test_latest_is_none_before_publish():
+    buffer = TripleBuffer()
+    assert buffer.latest() is None
+    assert not buffer.has_fresh()
+
+
+def test_latest_returns_most_recent_value():
+    buffer = TripleBuffer()
+    buffer.publish(1)
+    buffer.publish(2)
+    buffer.publish(3)
+    assert buffer.has_fresh()
+    assert buffer.latest() == 3
+    assert not buffer.has_fresh()
+
+
+def test_latest_keeps_value_until_next_publish():
+    buffer = TripleBuffer()
+    buffer.publish("a")
+    assert buffer.latest() == "a"
+    assert buffer.latest() == "a"
+    buffer.publish("b")
+    assert buffer.latest() == "b"
+
+
+def test_consumer_never_sees_values_going_backwards():
+    buffer = TripleBuffer()
+    count = 5000
+
+    def produce():
+        for i in range(count):
+            buffer.publish(i)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    seen = -1
+    while producer.is_alive() or buffer.has_fresh():
+        value = buffer.latest()
+        if value is not None:
+            assert value >= seen
+            seen = value
+    producer.join()
+    assert buffer.latest() == count - 1
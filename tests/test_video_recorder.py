@@ -0,0 +1,83 @@
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from implementation.video_recorder import VideoRecorder
+
+
+def frame(value):
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+
+def count_frames(path):
+    capture = cv2.VideoCapture(str(path))
+    count = 0
+    while capture.read()[0]:
+        count += 1
+    capture.release()
+    return count
+
+
+def test_rejects_bad_settings(tmp_path):
+    with pytest.raises(ValueError):
+        VideoRecorder(tmp_path / "a.avi", fps=0)
+    with pytest.raises(ValueError):
+        VideoRecorder(tmp_path / "a.avi", slots=0)
+
+
+def test_frames_faster_than_video_fps_are_decimated(tmp_path):
+    recorder = VideoRecorder(tmp_path / "game.avi", fps=10, fourcc="MJPG")
+    try:
+        queued = [recorder.offer(frame(i), now_ms) for i, now_ms in enumerate([0, 20, 40, 100, 120])]
+    finally:
+        recorder.close()
+    assert queued == [True, False, False, True, False]
+    assert recorder.frames_decimated == 3
+
+
+def test_gaps_are_filled_to_keep_real_time_length(tmp_path):
+    path = tmp_path / "game.avi"
+    recorder = VideoRecorder(path, fps=10, fourcc="MJPG")
+    recorder.offer(frame(0), 1000)
+    recorder.offer(frame(100), 1500)
+    recorder.close()
+    assert count_frames(path) == 6
+
+
+def test_close_repeats_the_last_frame_up_to_the_close_time(tmp_path):
+    path = tmp_path / "game.avi"
+    recorder = VideoRecorder(path, fps=10, fourcc="MJPG")
+    recorder.offer(frame(0), 1000)
+    recorder.offer(frame(100), 1200)
+    recorder.close(now_ms=2000)
+    assert count_frames(path) == 10
+
+
+def test_frame_of_other_size_is_dropped(tmp_path):
+    recorder = VideoRecorder(tmp_path / "game.avi", fps=10, fourcc="MJPG")
+    try:
+        recorder.offer(frame(0), 0)
+        assert not recorder.offer(np.zeros((10, 10, 3), dtype=np.uint8), 500)
+    finally:
+        recorder.close()
+    assert recorder.frames_dropped == 1
+
+
+def test_full_slots_drop_instead_of_blocking(tmp_path):
+    path = tmp_path / "game.avi"
+    recorder = VideoRecorder(path, fps=10, fourcc="MJPG", slots=1)
+    try:
+        # The encoder process is still starting up, so its only slot stays busy for these offers.
+        start = time.perf_counter()
+        queued = [recorder.offer(frame(i), i * 100) for i in range(5)]
+        elapsed = time.perf_counter() - start
+    finally:
+        recorder.close()
+    assert queued[0] and not all(queued)
+    assert elapsed < 0.5
+    assert recorder.frames_dropped == queued.count(False)
+    assert recorder.frames_queued + recorder.frames_dropped == recorder.frames_offered
+    last_queued = max(i for i, ok in enumerate(queued) if ok)
+    assert count_frames(path) == last_queued + 1